@@ -0,0 +1,71 @@
+"""
+Benchmark how long `import penguins` takes on top of `import polars`.
+
+Each measurement runs in a fresh interpreter, so nothing is cached in sys.modules,
+and times `import penguins` after polars is already imported, since polars' own
+import cost is outside penguins' control. The full import (`from penguins import *`,
+which loads every verb and helper) is reported alongside for comparison.
+
+The script exits with status 1 if the plain import takes more than --max-ms.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 20 --max-ms 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Statements timed in a fresh interpreter, after import polars
+CASES = {
+    "import penguins": "import penguins",
+    "from penguins import *": "from penguins import *",
+    "import penguins (PENGUINS_NO_ACUTIS)": "import penguins"
+}
+
+_TIMER = """
+import time
+import polars
+start = time.perf_counter()
+{statement}
+print((time.perf_counter() - start) * 1000)
+"""
+
+# Define function for timing a statement in a fresh interpreter
+def time_import(statement, env):
+    """Return the wall time in milliseconds of statement, run in a new interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(statement=statement)],
+        capture_output=True, text=True, check=True, cwd=ROOT, env=env
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the import time of penguins")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="Fresh interpreters per case, the best is kept (default: 10)")
+    parser.add_argument("--max-ms", type=float, default=10.0,
+                        help="Fail if `import penguins` takes longer than this (default: 10)")
+    args = parser.parse_args(argv)
+    
+    base_env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    base_env.pop("PENGUINS_NO_ACUTIS", None)
+    
+    results = {}
+    for name, statement in CASES.items():
+        env = dict(base_env, PENGUINS_NO_ACUTIS="1") if "PENGUINS_NO_ACUTIS" in name else base_env
+        results[name] = min(time_import(statement, env) for _ in range(args.repeat))
+        print(f"{name:<40} {results[name]:8.2f} ms")
+    
+    if results["import penguins"] > args.max_ms:
+        print(f"\n`import penguins` took {results['import penguins']:.2f} ms, over the {args.max_ms} ms limit")
+        return 1
+    
+    print(f"\n`import penguins` is within the {args.max_ms} ms limit.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+"""
+Benchmark every penguins verb and acutis method against hand-written Polars.
+
+Each case runs the penguins version and the equivalent plain Polars code on
+synthetic frames of several sizes and widths, eager and lazy (lazy results are
+collected so both sides do the same work), and reports penguins' overhead in
+absolute and relative terms.
+
+The script exits with status 1 if any case is slower than Polars by more than
+--threshold times (ignoring differences under --min-overhead-ms, which are noise),
+or if --baseline is given and a case's overhead ratio grew by more than --regression
+compared to a previous --save run.
+
+No network access is needed: all data is generated locally.
+
+Usage:
+    python benchmarks/bench_verbs.py
+    python benchmarks/bench_verbs.py --rows 10000 1000000 --widths 10 100 --save baseline.json
+    python benchmarks/bench_verbs.py --baseline baseline.json --threshold 1.5
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import namedtuple
+
+import polars as pl
+import polars.selectors as cs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import penguins
+from penguins import (
+    _, select, filter, mutate, across, arrange, rename, group_by, summarize, reframe,
+    round, head, tail, distinct, slice, slice_max, slice_head, relocate, drop_null, pull,
+    sample, join, join_asof, join_where, join_many, pivot_longer, pivot_wider, unite, separate, bind_cols,
+    bind_rows, collect, sink_parquet, starts_with
+)
+
+# A benchmark case: penguins and Polars callables taking the input frame. Ungated cases
+# (gate=False) have no like-for-like Polars equivalent, so they are reported and checked
+# against a --baseline but never against --threshold
+Case = namedtuple("Case", ["name", "penguins", "polars", "lazy", "gate"], defaults=[True])
+
+# Define function for generating a synthetic frame
+def make_frame(rows, width):
+    """
+    Build a synthetic DataFrame with id, group, key, value, text and nullable columns,
+    plus float columns x0, x1, ... up to the requested width.
+    """
+    base = pl.DataFrame({"id": pl.int_range(rows, eager=True)})
+    frame = base.with_columns(
+        group=pl.format("g{}", pl.col("id") % 10),
+        key=pl.col("id") % 1000,
+        value=(pl.col("id").hash(42) % 10_000) / 100,
+        text=pl.format("a{}-b{}", pl.col("id") % 7, pl.col("id") % 3),
+        maybe=pl.when(pl.col("id") % 7 == 0).then(None).otherwise(pl.col("id"))
+    )
+    extra = max(width - frame.width, 0)
+    return frame.with_columns(
+        (pl.col("value") * (i + 1)).alias(f"x{i}") for i in range(extra)
+    )
+
+# Define function for building the benchmark cases
+def make_cases(tmpdir):
+    """Return the list of cases, each pairing a penguins call with its Polars equivalent."""
+    dims = pl.select(key=pl.int_range(1000), label=pl.format("k{}", pl.int_range(1000)))
+    quotes = pl.select(id=pl.int_range(0, 10_000_000, 7), quote=pl.int_range(0, 10_000_000, 7) / 7)
+    groups = pl.select(group=pl.format("g{}", pl.int_range(10)), group_label=pl.format("G{}", pl.int_range(10)))
+    texts = pl.select(text=pl.format("a{}-b{}", pl.int_range(21) % 7, pl.int_range(21) % 3), text_id=pl.int_range(21)).unique("text")
+    bands = pl.select(lo=pl.int_range(0, 100, 10) * 1.0, hi=pl.int_range(10, 110, 10) * 1.0, band=pl.int_range(10))
+    
+    def quiet(fn):
+        # Swallow printed output (affiche) so it doesn't flood the report
+        def run(df):
+            with contextlib.redirect_stdout(io.StringIO()):
+                return fn(df)
+        return run
+    
+    def lazy_dims(df, table=dims):
+        return table.lazy() if isinstance(df, pl.LazyFrame) else table
+    
+    parquet_path = os.path.join(tmpdir, "sink.parquet")
+    
+    return [
+        # Verbs
+        Case("select", lambda df: df >> select(_.id, starts_with("x")),
+             lambda df: df.select("id", cs.starts_with("x")), True),
+        Case("filter", lambda df: df >> filter(_.value > 50),
+             lambda df: df.filter(pl.col("value") > 50), True),
+        Case("mutate", lambda df: df >> mutate(v2=_.value * 2),
+             lambda df: df.with_columns(v2=pl.col("value") * 2), True),
+        Case("mutate_across", lambda df: df >> mutate(across(starts_with("x"), lambda c: c * 2)),
+             lambda df: df.with_columns(cs.starts_with("x") * 2), True),
+        Case("arrange", lambda df: df >> arrange(-_.value),
+             lambda df: df.sort("value", descending=True), True),
+        Case("rename", lambda df: df >> rename(v=_.value),
+             lambda df: df.rename({"value": "v"}), True),
+        Case("group_by_summarize", lambda df: df >> group_by(_.group) >> summarize(m=_.value.mean()),
+             lambda df: df.group_by("group").agg(m=pl.col("value").mean()), True),
+        Case("group_by_mutate", lambda df: df >> group_by(_.group) >> mutate(c=_.value - _.value.mean()),
+             lambda df: df.with_columns(c=pl.col("value") - pl.col("value").mean().over("group")), True),
+        Case("group_by_filter", lambda df: df >> group_by(_.group) >> filter(_.value > _.value.mean()),
+             lambda df: df.filter((pl.col("value") > pl.col("value").mean()).over("group")), True),
+        Case("grouped_chain",
+             lambda df: df >> group_by(_.group, _.text) >> mutate(c=_.value - _.value.mean())
+                           >> filter(_.c > _.c.median()) >> summarize(m=_.c.mean()),
+             lambda df: df.with_columns(c=pl.col("value") - pl.col("value").mean().over("group", "text"))
+                          .filter((pl.col("c") > pl.col("c").median()).over("group", "text"))
+                          .group_by("group", "text").agg(m=pl.col("c").mean()), True),
+        Case("reframe", lambda df: df >> group_by(_.group) >> reframe(q=pl.col("value").quantile(0.5)),
+             lambda df: df.group_by("group").agg(q=pl.col("value").quantile(0.5)), True),
+        Case("round", lambda df: df >> round(decimals=1),
+             lambda df: df.with_columns(cs.numeric().round(1)), True),
+        Case("head", lambda df: df >> head(10),
+             lambda df: df.head(10), True),
+        Case("tail", lambda df: df >> tail(10),
+             lambda df: df.tail(10), True),
+        Case("distinct", lambda df: df >> distinct(_.group, _.key),
+             lambda df: df.unique(subset=["group", "key"]), True),
+        Case("sorted_distinct", lambda df: df >> arrange(_.key, _.group) >> distinct(_.group, _.key),
+             lambda df: df.sort("key", "group").unique(subset=["group", "key"]), True),
+        Case("sorted_grouped_mutate",
+             lambda df: df >> arrange(_.group, _.text) >> group_by(_.group, _.text) >> mutate(c=_.value - _.value.mean()),
+             lambda df: df.sort("group", "text").with_columns(c=pl.col("value") - pl.col("value").mean().over("group", "text")), True),
+        Case("slice", lambda df: df >> slice(100, 50),
+             lambda df: df.slice(100, 50), True),
+        Case("slice_max", lambda df: df >> group_by(_.group) >> slice_max(_.value, n=3),
+             lambda df: df.filter(pl.col("value") >= pl.col("value").top_k(3).min().over("group")).sort("group", "value", descending=[False, True], nulls_last=True, maintain_order=True), True),
+        Case("slice_head", lambda df: df >> group_by(_.group) >> slice_head(n=3),
+             lambda df: df.group_by("group", maintain_order=True).head(3).select(df.collect_schema().names()), True),
+        Case("relocate", lambda df: df >> relocate(_.value, _.key),
+             lambda df: df.select("value", "key", cs.all() - cs.by_name("value", "key")), True),
+        Case("drop_null", lambda df: df >> drop_null(),
+             lambda df: df.drop_nulls(), True),
+        Case("pull", lambda df: df >> pull(_.value),
+             lambda df: df.lazy().select("value").collect().to_series() if isinstance(df, pl.LazyFrame) else df["value"], True),
+        Case("sample", lambda df: df >> sample(n=100, seed=1),
+             lambda df: df.sample(n=100, seed=1), False),
+        Case("join", lambda df: df >> join(lazy_dims(df), on="key"),
+             lambda df: df.join(lazy_dims(df), on="key"), True),
+        Case("join_asof", lambda df: df >> join_asof(quotes, on=_.id),
+             lambda df: df.join_asof(lazy_dims(df, quotes), on="id"), True),
+        Case("join_where", lambda df: df >> join_where(bands, _.value >= _.lo, _.value < _.hi),
+             lambda df: df.join_where(lazy_dims(df, bands), pl.col("value") >= pl.col("lo"), pl.col("value") < pl.col("hi")), True),
+        Case("join_many", lambda df: df >> join_many([(lazy_dims(df), "key"), (lazy_dims(df, groups), "group"), (lazy_dims(df, texts), "text")]),
+             lambda df: df.join(lazy_dims(df), on="key", how="left").join(lazy_dims(df, groups), on="group", how="left")
+                          .join(lazy_dims(df, texts), on="text", how="left"), True),
+        Case("pivot_longer", lambda df: df >> pivot_longer(cols=[_.value, _.key], names_to="n", values_to="v"),
+             lambda df: df.unpivot(on=["value", "key"], index=[c for c in df.columns if c not in ("value", "key")],
+                                   variable_name="n", value_name="v"), False),
+        Case("pivot_wider", lambda df: df >> pivot_wider(names_from=_.group, values_from=_.value, id_cols=_.key, values_fn="sum"),
+             lambda df: df.pivot(on="group", index="key", values="value", aggregate_function="sum"), False),
+        Case("unite", lambda df: df >> unite("gk", [_.group, _.key], sep="-"),
+             lambda df: df.with_columns(gk=pl.concat_str([pl.col("group"), pl.col("key").cast(pl.String)], separator="-")).drop("group", "key"), True),
+        Case("separate", lambda df: df >> separate(_.text, into=["a", "b"], sep="-", validate=False),
+             lambda df: df.with_columns(pl.col("text").str.split_exact("-", 1).struct.rename_fields(["a", "b"]).struct.unnest()).drop("text"), True),
+        Case("bind_cols", lambda df: df.select("id") >> bind_cols(df.select("value")),
+             lambda df: df.select("id").hstack(df.select("value")), False),
+        Case("bind_rows", lambda df: df >> bind_rows(df),
+             lambda df: pl.concat([df, df]), True),
+        Case("collect", lambda df: df >> collect(),
+             lambda df: df.collect() if isinstance(df, pl.LazyFrame) else df, True),
+        Case("sink_parquet", lambda df: df >> sink_parquet(parquet_path),
+             lambda df: df.sink_parquet(parquet_path) if isinstance(df, pl.LazyFrame) else df.write_parquet(parquet_path), True),
+        # Acutis methods
+        Case("affiche", quiet(lambda df: df.affiche()),
+             quiet(lambda df: print(df.head(20) if isinstance(df, pl.DataFrame) else df.head(20).collect())), True, False),
+        Case("count_table", lambda df: df.count_table("group"),
+             lambda df: df.lazy().group_by("group").agg(count=pl.len()).with_columns(percent=pl.col("count") / pl.col("count").sum() * 100).sort("count", descending=True).collect(), True),
+        Case("count_null", lambda df: df.count_null(),
+             lambda df: df.lazy().select(pl.all().null_count()).unpivot(variable_name="col", value_name="null_count").sort("null_count", descending=True).collect(), True),
+        Case("pasteurize", lambda df: df.pasteurize(),
+             lambda df: df.with_columns(cs.string().str.strip_chars().replace(["NA", "NULL", ""], None).str.to_titlecase()).filter(~pl.all_horizontal(pl.all().is_null())).unique(maintain_order=True), True),
+    ]
+
+# Define function for timing a callable
+def best_time(fn, df, repeat):
+    """Return the best wall time in seconds of fn(df) over repeat runs, collecting LazyFrames (grouped or not)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(df)
+        if isinstance(result, penguins.GroupedFrame):
+            result = result.ungroup()
+        if isinstance(result, pl.LazyFrame):
+            result.collect()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# Define function for running every case
+def run(rows_list, widths, repeat, cases):
+    """Run all cases at every size, width and mode; return a DataFrame of results."""
+    records = []
+    for rows in rows_list:
+        for width in widths:
+            frame = make_frame(rows, width)
+            for mode in ("eager", "lazy"):
+                df = frame if mode == "eager" else frame.lazy()
+                for case in cases:
+                    if mode == "lazy" and not case.lazy:
+                        continue
+                    record = {"case": case.name, "mode": mode, "rows": rows, "width": width, "gate": case.gate}
+                    try:
+                        record["polars_ms"] = best_time(case.polars, df, repeat) * 1000
+                        record["penguins_ms"] = best_time(case.penguins, df, repeat) * 1000
+                        record["error"] = None
+                    except Exception as exc:
+                        record["polars_ms"] = record["penguins_ms"] = None
+                        record["error"] = f"{type(exc).__name__}: {exc}".splitlines()[0]
+                    records.append(record)
+    
+    return pl.DataFrame(records, schema={
+        "case": pl.String, "mode": pl.String, "rows": pl.Int64, "width": pl.Int64, "gate": pl.Boolean,
+        "polars_ms": pl.Float64, "penguins_ms": pl.Float64, "error": pl.String
+    }).with_columns(
+        overhead_ms=pl.col("penguins_ms") - pl.col("polars_ms"),
+        ratio=pl.col("penguins_ms") / pl.col("polars_ms")
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark penguins verbs against raw Polars")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000],
+                        help="Row counts to benchmark (default: 10000 1000000)")
+    parser.add_argument("--widths", type=int, nargs="+", default=[10, 100],
+                        help="Column counts to benchmark (default: 10 100)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Runs per measurement, the best is kept (default: 5)")
+    parser.add_argument("--cases", nargs="+", default=None,
+                        help="Only run these cases (default: all)")
+    parser.add_argument("--threshold", type=float, default=2.0,
+                        help="Fail if penguins is more than this many times slower than Polars (default: 2.0)")
+    parser.add_argument("--min-overhead-ms", type=float, default=1.0,
+                        help="Ignore overheads below this many milliseconds (default: 1.0)")
+    parser.add_argument("--baseline", default=None,
+                        help="JSON results from a previous --save run to check for regressions")
+    parser.add_argument("--regression", type=float, default=0.25,
+                        help="Fail if a case's ratio grew by more than this fraction over the baseline (default: 0.25)")
+    parser.add_argument("--save", default=None,
+                        help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cases = make_cases(tmpdir)
+        if args.cases:
+            cases = [case for case in cases if case.name in args.cases]
+        results = run(args.rows, args.widths, args.repeat, cases)
+    
+    with pl.Config(tbl_rows=-1, tbl_cols=-1, fmt_str_lengths=60):
+        print(results.drop("error", "gate").with_columns(cs.float().round(3)))
+    
+    errors = results.filter(pl.col("error").is_not_null())
+    if errors.height:
+        print("\nCases that failed to run:")
+        for row in errors.iter_rows(named=True):
+            print(f"  {row['case']} ({row['mode']}, {row['rows']} rows x {row['width']} cols): {row['error']}")
+    
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results.to_dicts(), f, indent=2)
+    
+    # Overhead beyond the threshold
+    failures = results.filter(
+        pl.col("gate") & (pl.col("ratio") > args.threshold) & (pl.col("overhead_ms") > args.min_overhead_ms)
+    )
+    
+    # Regressions against a saved baseline
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = pl.DataFrame(json.load(f), infer_schema_length=None)
+        keys = ["case", "mode", "rows", "width"]
+        compared = results.join(baseline.select(*keys, baseline_ratio="ratio"), on=keys, how="inner")
+        regressions = compared.filter(
+            (pl.col("ratio") > pl.col("baseline_ratio") * (1 + args.regression))
+            & (pl.col("overhead_ms") > args.min_overhead_ms)
+        )
+        failures = pl.concat([failures, regressions.drop("baseline_ratio")]).unique(keys, maintain_order=True)
+    
+    if failures.height:
+        print(f"\n{failures.height} case(s) exceeded the overhead limits:")
+        for row in failures.iter_rows(named=True):
+            print(f"  {row['case']} ({row['mode']}, {row['rows']} rows x {row['width']} cols): "
+                  f"{row['penguins_ms']:.3f} ms vs {row['polars_ms']:.3f} ms ({row['ratio']:.2f}x)")
+        return 1
+    
+    print("\nAll cases within the overhead limits.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,57 +2,113 @@
 penguins: a siuba-styled addon for polars
 """
 
+import importlib
+import os
+
 # core imports
 from penguins.core.symbolic import _, Symbolic
 from penguins.core import pipe
+from penguins.core.pipeline import Pipeline, Verb, verb
+from penguins.core.options import options, lazy_mode
+from penguins.core.cache import plan_cache_info, clear_plan_cache
+from penguins.core.schema import schema_resolutions, reset_schema_resolutions
+from penguins.core.groups import GroupedFrame
 
-# acutis imports 
+# acutis methods, patched onto Polars objects as placeholders that load on first use
 from penguins import acutis
-from penguins.acutis.affiche import affiche
-from penguins.acutis.pasteurize import pasteurize
-from penguins.acutis.count_table import count_table
-from penguins.acutis.count_null import count_null
-
-# verb imports
-from penguins.verbs.select import select
-from penguins.verbs.mutate import mutate, across
-from penguins.verbs.filter import filter
-from penguins.verbs.arrange import arrange
-from penguins.verbs.rename import rename
-from penguins.verbs.group_by import group_by
-from penguins.verbs.summarize import summarize
-from penguins.verbs.round import round
-from penguins.verbs.head import head
-from penguins.verbs.tail import tail
-from penguins.verbs.distinct import distinct 
-from penguins.verbs.slice import slice
-from penguins.verbs.relocate import relocate 
-from penguins.verbs.drop_null import drop_null
-from penguins.verbs.pull import pull
-from penguins.verbs.sample import sample
-from penguins.verbs.join import join
-from penguins.verbs.pivot import pivot_longer, pivot_wider
-from penguins.verbs.unite import unite
-from penguins.verbs.separate import separate
-from penguins.verbs.bind_cols import bind_cols
-from penguins.verbs.bind_rows import bind_rows
-from penguins.verbs.reframe import reframe
-
-# utils + helper imports
-from penguins.utils.if_else import if_else
-from penguins.utils.case_when import case_when
-from penguins.utils.row_contains import row_contains
-from penguins.utils.helpers import starts_with, ends_with, contains, where, is_numeric, \
-    is_integer, is_float, is_string, is_boolean, is_temporal, is_null, is_cat
-    
+if not os.environ.get("PENGUINS_NO_ACUTIS"):
+    acutis.install()
+
+# Everything else is imported on first access, to keep `import penguins` fast
+_LAZY_IMPORTS = {
+    "trace": "penguins.core.trace",
+    "load_penguins": "penguins.data",
+    "generate_penguins": "penguins.data",
+    # acutis
+    "affiche": "penguins.acutis",
+    "pasteurize": "penguins.acutis",
+    "count_table": "penguins.acutis",
+    "count_null": "penguins.acutis",
+    # verbs
+    "select": "penguins.verbs.select",
+    "mutate": "penguins.verbs.mutate",
+    "across": "penguins.verbs.mutate",
+    "filter": "penguins.verbs.filter",
+    "arrange": "penguins.verbs.arrange",
+    "assume_sorted": "penguins.verbs.arrange",
+    "rename": "penguins.verbs.rename",
+    "group_by": "penguins.verbs.group_by",
+    "ungroup": "penguins.verbs.group_by",
+    "summarize": "penguins.verbs.summarize",
+    "round": "penguins.verbs.round",
+    "head": "penguins.verbs.head",
+    "tail": "penguins.verbs.tail",
+    "distinct": "penguins.verbs.distinct",
+    "slice": "penguins.verbs.slice",
+    "slice_max": "penguins.verbs.slice",
+    "slice_min": "penguins.verbs.slice",
+    "slice_head": "penguins.verbs.slice",
+    "slice_tail": "penguins.verbs.slice",
+    "relocate": "penguins.verbs.relocate",
+    "drop_null": "penguins.verbs.drop_null",
+    "pull": "penguins.verbs.pull",
+    "sample": "penguins.verbs.sample",
+    "join": "penguins.verbs.join",
+    "join_asof": "penguins.verbs.join",
+    "join_where": "penguins.verbs.join",
+    "join_many": "penguins.verbs.join",
+    "pivot_longer": "penguins.verbs.pivot",
+    "pivot_wider": "penguins.verbs.pivot",
+    "unite": "penguins.verbs.unite",
+    "separate": "penguins.verbs.separate",
+    "bind_cols": "penguins.verbs.bind_cols",
+    "bind_rows": "penguins.verbs.bind_rows",
+    "reframe": "penguins.verbs.reframe",
+    "collect": "penguins.verbs.collect",
+    "sink_parquet": "penguins.verbs.sink",
+    "sink_csv": "penguins.verbs.sink",
+    "sink_ipc": "penguins.verbs.sink",
+    # utils + helpers
+    "if_else": "penguins.utils.if_else",
+    "case_when": "penguins.utils.case_when",
+    "row_contains": "penguins.utils.row_contains",
+    "starts_with": "penguins.utils.helpers",
+    "ends_with": "penguins.utils.helpers",
+    "contains": "penguins.utils.helpers",
+    "where": "penguins.utils.helpers",
+    "is_numeric": "penguins.utils.helpers",
+    "is_integer": "penguins.utils.helpers",
+    "is_float": "penguins.utils.helpers",
+    "is_string": "penguins.utils.helpers",
+    "is_boolean": "penguins.utils.helpers",
+    "is_temporal": "penguins.utils.helpers",
+    "is_null": "penguins.utils.helpers",
+    "is_cat": "penguins.utils.helpers"
+}
+
+# Load lazily imported names on first access (PEP 562)
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 # set version
 __version__ = "0.3.6"
 
 # add to primary import 
-__all__ = ['_', 'Symbolic', 'select', 'mutate', 'filter', 'arrange', 'rename', 'group_by',
-           'summarize', 'round', 'head', 'tail', 'distinct', 'slice', 'relocate', 'drop_null',
+__all__ = ['_', 'Symbolic', 'Pipeline', 'Verb', 'verb', 'GroupedFrame', 'options', 'lazy_mode', 'plan_cache_info', 'clear_plan_cache', 
+           'schema_resolutions', 'reset_schema_resolutions', 'trace', 'load_penguins', 'generate_penguins', 'select', 'mutate', 'filter', 'arrange', 'assume_sorted', 'rename', 'group_by',
+           'ungroup', 'summarize', 'round', 'head', 'tail', 'distinct', 'slice', 'slice_max', 'slice_min', 
+           'slice_head', 'slice_tail', 'relocate', 'drop_null',
            'pull', 'sample', 'affiche', 'pasteurize', 'count_table', 'count_null', 'starts_with', 
            'ends_with', 'contains', 'across', 'where', 'is_numeric', 'is_integer', 'is_float', 
            'is_string', 'is_boolean', 'is_temporal', 'is_null', 'if_else', 'is_null', 'is_cat', 
-           'case_when', 'join', 'pivot_longer', 'pivot_wider', 'unite', 'separate', 'bind_rows', 'bind_cols', 
-           'row_contains', 'reframe']
\ No newline at end of file
+           'case_when', 'join', 'join_asof', 'join_where', 'join_many', 'pivot_longer', 'pivot_wider', 'unite', 'separate', 'bind_rows', 'bind_cols', 
+           'row_contains', 'reframe', 'collect',
+           'sink_parquet', 'sink_csv', 'sink_ipc']
\ No newline at end of file
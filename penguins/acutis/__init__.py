@@ -1,12 +1,116 @@
 """
 Acutis module: Extended methods for Polars objects.
 
-Importing this module adds additional methods to Polars Series and DataFrame objects.
+install() adds the acutis methods to Polars Series, DataFrame and LazyFrame objects.
+It runs when penguins is imported, unless the PENGUINS_NO_ACUTIS environment variable
+is set, and is cheap either way: each method module is only imported the first time
+its method (or function) is used.
+
+Usage:
+    import penguins.acutis
+    penguins.acutis.install("affiche")
+    penguins.acutis.uninstall()
 """
+import importlib
+import sys
+import types
+import polars as pl
+
+# Module defining each method, and the Polars classes it is patched onto
+_METHODS = {
+    "affiche": ("penguins.acutis.affiche", (pl.DataFrame, pl.LazyFrame)),
+    "count_table": ("penguins.acutis.count_table", (pl.Series, pl.DataFrame, pl.LazyFrame)),
+    "count_null": ("penguins.acutis.count_null", (pl.DataFrame, pl.LazyFrame)),
+    "pasteurize": ("penguins.acutis.pasteurize", (pl.DataFrame, pl.LazyFrame))
+}
+
+# Define function for importing a method module on demand
+def _load(name):
+    """
+    Import the module behind an acutis method, swap any installed placeholders for
+    the real method, and return the module.
+    """
+    module = importlib.import_module(_METHODS[name][0])
+    
+    # Importing the submodule binds its name on this package, so rebind the function
+    globals()[name] = getattr(module, name)
+    
+    method, classes = module._PATCHES[name]
+    for cls in classes:
+        if isinstance(cls.__dict__.get(name), _LazyMethod):
+            setattr(cls, name, method)
+    return module
+
+class _LazyMethod:
+    """
+    Placeholder for an acutis method whose module isn't imported yet.
+    
+    The first time the method is looked up on a Polars object, its module is imported
+    and the placeholder is replaced by the real method.
+    """
+    def __init__(self, name):
+        self.name = name
+    
+    def __get__(self, obj, cls=None):
+        method = _load(self.name)._PATCHES[self.name][0]
+        return method.__get__(obj, cls)
+    
+    def __repr__(self):
+        return f"<acutis method {self.name}() (not loaded yet)>"
+
+def install(*names):
+    """
+    Patch acutis methods onto Polars objects.
+    
+    names: The methods to install (default: all of affiche, count_table, count_null
+           and pasteurize)
+    
+    Usage: penguins.acutis.install()
+    """
+    for name in names or _METHODS:
+        if name not in _METHODS:
+            raise ValueError(f"Unknown acutis method {name!r}; choose from {list(_METHODS)}")
+        for cls in _METHODS[name][1]:
+            setattr(cls, name, _LazyMethod(name))
+        
+        # Methods whose module is already imported don't need a placeholder
+        module_name = _METHODS[name][0]
+        if module_name in sys.modules:
+            _load(name)
+
+def uninstall(*names):
+    """
+    Remove acutis methods from Polars objects.
+    
+    names: The methods to remove (default: all)
+    
+    Usage: penguins.acutis.uninstall()
+    """
+    for name in names or _METHODS:
+        if name not in _METHODS:
+            raise ValueError(f"Unknown acutis method {name!r}; choose from {list(_METHODS)}")
+        for cls in _METHODS[name][1]:
+            if name in cls.__dict__:
+                delattr(cls, name)
+
+class _Package(types.ModuleType):
+    """
+    The acutis package, which keeps its functions bound when their modules are imported.
+    
+    Importing a submodule binds it on the package under its own name, so without this
+    `import penguins.acutis.affiche` would shadow the affiche() function with its module.
+    """
+    def __setattr__(self, name, value):
+        if name in _METHODS and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _Package
 
-from penguins.acutis.affiche import affiche             # Imports both the function and the method 
-from penguins.acutis.count_table import count_table
-from penguins.acutis.count_null import count_null
-from penguins.acutis.pasteurize import pasteurize
+# Load the method functions lazily on attribute access
+def __getattr__(name):
+    if name in _METHODS:
+        return getattr(_load(name), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__all__ = ['affiche', 'count_table', 'count_null', 'pasteurize']
\ No newline at end of file
+__all__ = ['affiche', 'count_table', 'count_null', 'pasteurize', 'install', 'uninstall']
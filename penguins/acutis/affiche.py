@@ -1,173 +1,215 @@
 # Define the affiche() method and function
 import polars as pl
-import re
 import math
+from penguins.core.pipeline import verb
 
 """
 affiche extension for Polars DataFrames and LazyFrames.
 
-This module monkey-patches the affiche() method onto pl.DataFrame.
-The patch is applied automatically when this module is imported.
+This module defines the affiche() method, which penguins.acutis.install() patches
+onto pl.DataFrame and pl.LazyFrame, and the affiche() verb.
 
 Usage:
     df.affiche()
 """
-# Define the affiche() method
-def affiche(self, align="left", na_color="\033[91;3m", theme="newspaper"):
+# Border themes
+_THEMES = {
+    "newspaper": {
+        "h": "═", "v": "║",
+        "tl": "╔", "tr": "╗",
+        "bl": "╚", "br": "╝",
+        "jn": "╬",
+        "l": "╠", "r": "╣",
+        "t": "╦", "b": "╩"
+    }
+}
+
+# Abbreviate common type names
+_TYPE_ABBREV = {
+    "string": "str",
+    "categorical": "cat",
+    "boolean": "bool",
+    "object": "obj",
+    "decimal": "dec",
+    "datetime(time_unit='us', time_zone=none)": "datetime"
+}
+
+_RESET = "\033[0m"
+_ELLIPSIS = "…"
+
+# Define function for printing the empty table message
+def _print_empty():
+    msg = "That table doesn't exist!"
+    width = len(msg)
+    top = f"╔{'═' * (width + 2)}╗"
+    mid = f"║ {msg} ║"
+    bot = f"╚{'═' * (width + 2)}╝"
+    print(f"{top}\n{mid}\n{bot}")
+
+# Define function for converting preview rows to strings
+def _to_text(df):
     """
-    Display a Polars DataFrame with formatted table borders and styling.
+    Convert every column of a preview DataFrame to strings with Polars expressions.
     
-    Args:
-        self: the DataFrame instance
-        align: text alignment ("left", "center", "right")
-        na_color: ANSI color code for missing values
-        theme: border theme ("newspaper")
+    Nulls are kept as nulls so they can be styled. Nested, binary and object columns
+    have no string cast, so those fall back to Python's str() on the preview rows only.
     
-    Usage:
-        df.affiche()
+    Returns a DataFrame of String columns with the same names
     """
-    # Collect LazyFrame if needed
-    if isinstance(self, pl.LazyFrame):
-        df = self.collect()
+    exprs = []
+    for name, dtype in df.schema.items():
+        col = pl.col(name)
+        if dtype == pl.String:
+            exprs.append(col)
+        elif dtype == pl.Boolean:
+            exprs.append(pl.when(col).then(pl.lit("True")).when(~col).then(pl.lit("False")).alias(name))
+        elif dtype.is_nested() or dtype in (pl.Binary, pl.Object):
+            values = [None if v is None else str(v) for v in df[name].to_list()]
+            exprs.append(pl.lit(pl.Series(name, values, dtype=pl.String)).alias(name))
+        else:
+            exprs.append(col.cast(pl.String))
+    return df.select(exprs)
+
+# Define function for padding a single header or type cell
+def _pad(text, visible_width, width, align):
+    pad_total = width - visible_width
+    
+    if align == "center":
+        pad_left = math.floor(pad_total / 2)
+    elif align == "right":
+        pad_left = pad_total
     else:
-        df = self
+        pad_left = 0
     
-    # Handle empty DataFrame
-    if df.shape[1] == 0 or df.shape[0] == 0:
-        msg = "That table doesn't exist!"
-        width = len(msg)
-        top = f"╔{'═' * (width + 2)}╗"
-        mid = f"║ {msg} ║"
-        bot = f"╚{'═' * (width + 2)}╝"
-        print(f"{top}\n{mid}\n{bot}")
-        return None
+    pad_right = pad_total - pad_left
+    return f"{' ' * pad_left}{text}{' ' * pad_right}"
 
-    # Border theme
-    if theme == "newspaper":
-        border = {
-            "h": "═", "v": "║",
-            "tl": "╔", "tr": "╗",
-            "bl": "╚", "br": "╝",
-            "jn": "╬",
-            "l": "╠", "r": "╣",
-            "t": "╦", "b": "╩"
-        }
+# Define function for padding a whole column of data cells
+def _pad_expr(name, width, align, na_text):
+    """
+    Build a padded cell expression for one text column.
+    
+    Nulls are displayed as na_text but padded as if they were the 4 characters "null".
+    """
+    content = pl.col(name)
+    pad_total = width - content.str.len_chars().fill_null(4)
+    
+    if align == "center":
+        pad_left = pad_total // 2
+    elif align == "right":
+        pad_left = pad_total
     else:
+        pad_left = pl.lit(0)
+    
+    spaces = pl.lit(" " * width)
+    return pl.concat_str([
+        spaces.str.slice(0, pad_left),
+        content.fill_null(pl.lit(na_text)),
+        spaces.str.slice(0, pad_total - pad_left)
+    ])
+
+# Define the shared renderer
+def _render(df, align="left", na_color="\033[91;3m", theme="newspaper",
+            max_rows=20, max_cols=20, total_rows=None, head_only=False):
+    """
+    Print a preview of a DataFrame with formatted table borders and styling.
+    
+    Only up to max_rows rows (half from the head, half from the tail) and max_cols
+    columns (half from each side) are formatted, so the cost of rendering is bounded
+    regardless of the size of the frame.
+    
+    df: The DataFrame to display
+    total_rows: Total row count to report in the footer, if df is only a preview
+    head_only: If True, df holds the first rows of a larger result (e.g. a LazyFrame
+               fetched with a row limit), so the preview is taken from the head only
+    """
+    # Border theme
+    if theme not in _THEMES:
         raise ValueError("Theme not supported. Try 'newspaper'")
-
-    reset = "\033[0m"
-
-    # Handle color for unique NA types
-    def color_na(x):
-        if x is None:
-            return f"{na_color}null{reset}"
-        return str(x)
-
-    # Width calculator (ignores ANSI codes)
-    def display_width(s):
-        clean = re.sub(r'\033\[[0-9;]*[mK]', '', str(s))
-        return len(clean)
-
-    # Prepare display data
+    border = _THEMES[theme]
+    
+    n_rows = df.height if total_rows is None else total_rows
+    n_cols = df.width
+    
+    # Handle empty DataFrame
+    if n_cols == 0 or df.height == 0:
+        _print_empty()
+        return None
+    
+    # Trim columns to the budget, keeping the first and last ones
     col_names = df.columns
+    cols_truncated = max_cols is not None and n_cols > max_cols
+    if cols_truncated:
+        n_left = max(math.ceil(max_cols / 2), 1)
+        n_right = max(max_cols - n_left, 0)
+        col_names = col_names[:n_left] + (col_names[-n_right:] if n_right else [])
+        df = df.select(col_names)
+    
+    # Trim rows to the budget, keeping the head and tail
+    rows_truncated = max_rows is not None and df.height > max_rows
+    if rows_truncated:
+        ellipsis_row = pl.DataFrame({name: [_ELLIPSIS] for name in col_names})
+        if head_only:
+            text = pl.concat([_to_text(df.head(max_rows)), ellipsis_row])
+        else:
+            n_head = max(math.ceil(max_rows / 2), 1)
+            n_tail = max(max_rows - n_head, 0)
+            text = pl.concat([_to_text(df.head(n_head)), ellipsis_row, _to_text(df.tail(n_tail))])
+    else:
+        text = _to_text(df)
+    
     # Pull column types
     col_types = [str(dtype) for dtype in df.dtypes]
+    col_types = [_TYPE_ABBREV.get(dtype.lower(), dtype) for dtype in col_types]
+    
+    # Mark the dropped middle columns with an ellipsis column
+    if cols_truncated:
+        text = text.insert_column(n_left, pl.Series(_ELLIPSIS, [_ELLIPSIS] * text.height))
+        col_names = col_names[:n_left] + [_ELLIPSIS] + col_names[n_left:]
+        col_types = col_types[:n_left] + [""] + col_types[n_left:]
+    
+    # Column widths, from a single aggregation over the preview rows
+    data_widths = text.select(
+        pl.all().str.len_chars().fill_null(4).max()
+    ).row(0)
+    col_widths = [
+        max(len(name), len(dtype), width)
+        for name, dtype, width in zip(col_names, col_types, data_widths)
+    ]
     
-    # Abbreviate common type names
-    type_abbrev = {
-        "string": "str",
-        "categorical": "cat",
-        "boolean": "bool",
-        "object": "obj",
-        "decimal": "dec",
-        "datetime(time_unit='us', time_zone=none)": "datetime"
-    }
-
-    col_types = [type_abbrev.get(dtype.lower(), dtype) for dtype in col_types]
-    
-    # Column widths
-    col_widths = []
-    for i, col in enumerate(col_names):
-        header_width = display_width(col)
-        type_width = display_width(col_types[i])
-        # Get column values and apply color_na
-        col_values = [color_na(val) for val in df[col].to_list()]
-        data_widths = [display_width(val) for val in col_values]
-        col_widths.append(max([header_width, type_width] + data_widths))
-
     # Draw horizontal line
     def draw_hline(connector_left, connector_right, cross):
-        line = connector_left
-        for i, width in enumerate(col_widths):
-            line += border["h"] * (width + 2) + cross
-        line = line[:-1] + connector_right
-        return line
-
+        segments = [border["h"] * (width + 2) for width in col_widths]
+        return connector_left + cross.join(segments) + connector_right
+    
     top_line = draw_hline(border["tl"], border["tr"], border["t"])
     mid_line = draw_hline(border["l"], border["r"], border["jn"])
     bot_line = draw_hline(border["bl"], border["br"], border["b"])
-
+    
     # Header
-    header_parts = [border["v"]]
-    for i, name in enumerate(col_names):
-        width = col_widths[i]
-        pad_total = width - display_width(name)
-    
-        if align == "left":
-            pad_left = 0
-        elif align == "center":
-            pad_left = math.floor(pad_total / 2)
-        elif align == "right":
-            pad_left = pad_total
-        else:
-            pad_left = 0
-
-        pad_right = pad_total - pad_left
-        header_parts.append(f" {' ' * pad_left}{name}{' ' * pad_right} {border['v']}")
-    header = "".join(header_parts)
-
+    header_cells = [
+        _pad(name, len(name), width, align)
+        for name, width in zip(col_names, col_widths)
+    ]
+    header = f"{border['v']} " + f" {border['v']} ".join(header_cells) + f" {border['v']}"
+    
     # Type row
-    type_parts = [border["v"]]
-    for i, dtype in enumerate(col_types):
-        dtype_formatted = f"\033[3m{dtype.lower()}{reset}"
-        width = col_widths[i]
-        pad_total = width - display_width(dtype)
-
-        if align == "left":
-            pad_left = 0
-        elif align == "center":
-            pad_left = math.floor(pad_total / 2)
-        elif align == "right":
-            pad_left = pad_total
-        else:
-            pad_left = 0
-
-        pad_right = pad_total - pad_left
-        type_parts.append(f" {' ' * pad_left}{dtype_formatted}{' ' * pad_right} {border['v']}")
-    type_row = "".join(type_parts)
-
-    # Data rows
-    data_rows = []
-    for row_idx in range(len(df)):
-        row_parts = [border["v"]]
-        for col_idx, col_name in enumerate(col_names):
-            content = color_na(df[col_name][row_idx])
-            width = col_widths[col_idx]
-            pad_total = width - display_width(content)
-
-            if align == "left":
-                pad_left = 0
-            elif align == "center":
-                pad_left = math.floor(pad_total / 2)
-            elif align == "right":
-                pad_left = pad_total
-            else:
-                pad_left = 0
-
-            pad_right = pad_total - pad_left
-            row_parts.append(f" {' ' * pad_left}{content}{' ' * pad_right} {border['v']}")
-        data_rows.append("".join(row_parts))
-
+    type_cells = [
+        _pad(f"\033[3m{dtype.lower()}{_RESET}", len(dtype), width, align)
+        for dtype, width in zip(col_types, col_widths)
+    ]
+    type_row = f"{border['v']} " + f" {border['v']} ".join(type_cells) + f" {border['v']}"
+    
+    # Data rows, padded and joined with vectorized string expressions
+    na_text = f"{na_color}null{_RESET}"
+    row_parts = [pl.lit(f"{border['v']} ")]
+    for i, (name, width) in enumerate(zip(col_names, col_widths)):
+        if i > 0:
+            row_parts.append(pl.lit(f" {border['v']} "))
+        row_parts.append(_pad_expr(name, width, align, na_text))
+    row_parts.append(pl.lit(f" {border['v']}"))
+    data_rows = text.select(pl.concat_str(row_parts).alias("row"))["row"].to_list()
+    
     # Print table
     print(top_line)
     print(header)
@@ -175,15 +217,71 @@ def affiche(self, align="left", na_color="\033[91;3m", theme="newspaper"):
     print(mid_line)
     print("\n".join(data_rows))
     print(bot_line)
-
+    
+    # Footer with the full size when the preview was truncated
+    if rows_truncated and head_only and total_rows is None:
+        print(f"more than {max_rows:,} rows × {n_cols:,} columns")
+    elif rows_truncated or cols_truncated or total_rows is not None:
+        print(f"{n_rows:,} rows × {n_cols:,} columns")
+    
     return None
 
-# Monkey-patch Polars DataFrame and LazyFrame
-pl.DataFrame.affiche = affiche
-pl.LazyFrame.affiche = affiche 
+# Define function for fetching a preview from a LazyFrame
+def _fetch_preview(lf, max_rows, count_rows):
+    """
+    Fetch only the preview rows of a LazyFrame, pushing the row limit into the plan.
+    
+    One row more than max_rows is fetched so the renderer can tell the result was
+    truncated. If count_rows is True, the total row count is computed in the same
+    collect_all() call, so Polars can share the scan between both queries.
+    
+    Returns a (DataFrame, total_rows) tuple, with total_rows None if not counted
+    """
+    preview = lf if max_rows is None else lf.head(max_rows + 1)
+    if not count_rows:
+        return preview.collect(), None
+    
+    df, total = pl.collect_all([preview, lf.select(pl.len())])
+    return df, total.item()
+
+# Define the affiche() method
+def affiche(self, align="left", na_color="\033[91;3m", theme="newspaper", max_rows=20, max_cols=20,
+            count_rows=False):
+    """
+    Display a Polars DataFrame with formatted table borders and styling.
+    
+    Args:
+        self: the DataFrame instance
+        align: text alignment ("left", "center", "right")
+        na_color: ANSI color code for missing values
+        theme: border theme ("newspaper")
+        max_rows: maximum number of rows shown, split between head and tail (None for all)
+        max_cols: maximum number of columns shown, split between left and right (None for all)
+        count_rows: for LazyFrames, also compute the total row count for the footer
+                    (default False, since it may require a full scan)
+    
+    Usage:
+        df.affiche()
+    """
+    # Fetch only the preview rows of a LazyFrame
+    if isinstance(self, pl.LazyFrame):
+        df, total_rows = _fetch_preview(self, max_rows, count_rows)
+        return _render(df, align=align, na_color=na_color, theme=theme,
+                       max_rows=max_rows, max_cols=max_cols, total_rows=total_rows, head_only=True)
+    
+    return _render(self, align=align, na_color=na_color, theme=theme,
+                   max_rows=max_rows, max_cols=max_cols)
+
+# Keep the method under its own name, since the verb below takes over affiche
+_affiche_method = affiche
+
+# Polars classes the method is patched onto by penguins.acutis.install()
+_PATCHES = {"affiche": (_affiche_method, (pl.DataFrame, pl.LazyFrame))}
 
 # Define the affiche() function
-def affiche(align="left", na_color="\033[91;3m", theme="newspaper"):
+@verb(terminal=True)
+def affiche(align="left", na_color="\033[91;3m", theme="newspaper", max_rows=20, max_cols=20,
+            count_rows=False):
     """
     Display a Polars DataFrame or LazyFrame with formatted table borders and styling.
     
@@ -191,160 +289,17 @@ def affiche(align="left", na_color="\033[91;3m", theme="newspaper"):
         align: text alignment ("left", "center", "right")
         na_color: ANSI color code for missing values
         theme: border theme ("newspaper")
+        max_rows: maximum number of rows shown, split between head and tail (None for all)
+        max_cols: maximum number of columns shown, split between left and right (None for all)
+        count_rows: for LazyFrames, also compute the total row count for the footer
+                    (default False, since it may require a full scan)
     
     Usage:
         df >> affiche()
     """
     def _affiche(df):
-
-        # Collect LazyFrame if needed
-        if isinstance(df, pl.LazyFrame):
-            df = df.collect()
-            
-        # Handle empty DataFrame
-        if df.shape[1] == 0 or df.shape[0] == 0:
-            msg = "That table doesn't exist!"
-            width = len(msg)
-            top = f"╔{'═' * (width + 2)}╗"
-            mid = f"║ {msg} ║"
-            bot = f"╚{'═' * (width + 2)}╝"
-            print(f"{top}\n{mid}\n{bot}")
-            return None
-
-        # Border theme
-        if theme == "newspaper":
-            border = {
-                "h": "═", "v": "║",
-                "tl": "╔", "tr": "╗",
-                "bl": "╚", "br": "╝",
-                "jn": "╬",
-                "l": "╠", "r": "╣",
-                "t": "╦", "b": "╩"
-            }
-        else:
-            raise ValueError("Theme not supported. Try 'newspaper'")
-
-        reset = "\033[0m"
-
-        # Handle color for unique NA types
-        def color_na(x):
-            if x is None:
-                return f"{na_color}null{reset}"
-            return str(x)
-
-        # Width calculator (ignores ANSI codes)
-        def display_width(s):
-            clean = re.sub(r'\033\[[0-9;]*[mK]', '', str(s))
-            return len(clean)
-
-        # Prepare display data
-        col_names = df.columns
-        # Pull column data types
-        col_types = [str(dtype) for dtype in df.dtypes]
-        
-        # Abbreviate common type names
-        type_abbrev = {
-            "string": "str",
-            "categorical": "cat",
-            "boolean": "bool",
-            "object": "obj",
-            "decimal": "dec"
-        }
-
-        col_types = [type_abbrev.get(dtype.lower(), dtype) for dtype in col_types]
-    
-        # Column widths
-        col_widths = []
-        for i, col in enumerate(col_names):
-            header_width = display_width(col)
-            type_width = display_width(col_types[i])
-            # Get column values and apply color_na
-            col_values = [color_na(val) for val in df[col].to_list()]
-            data_widths = [display_width(val) for val in col_values]
-            col_widths.append(max([header_width, type_width] + data_widths))
-
-        # Draw horizontal line
-        def draw_hline(connector_left, connector_right, cross):
-            line = connector_left
-            for i, width in enumerate(col_widths):
-                line += border["h"] * (width + 2) + cross
-            line = line[:-1] + connector_right
-            return line
-
-        top_line = draw_hline(border["tl"], border["tr"], border["t"])
-        mid_line = draw_hline(border["l"], border["r"], border["jn"])
-        bot_line = draw_hline(border["bl"], border["br"], border["b"])
-
-        # Header
-        header_parts = [border["v"]]
-        for i, name in enumerate(col_names):
-            width = col_widths[i]
-            pad_total = width - display_width(name)
-
-            if align == "left":
-                pad_left = 0
-            elif align == "center":
-                pad_left = math.floor(pad_total / 2)
-            elif align == "right":
-                pad_left = pad_total
-            else:
-                pad_left = 0
-
-            pad_right = pad_total - pad_left
-            header_parts.append(f" {' ' * pad_left}{name}{' ' * pad_right} {border['v']}")
-        
-        header = "".join(header_parts)
-
-        # Type row
-        type_parts = [border["v"]]
-        for i, dtype in enumerate(col_types):
-            dtype_formatted = f"\033[3m{dtype.lower()}{reset}"
-            width = col_widths[i]
-            pad_total = width - display_width(dtype)
-
-            if align == "left":
-                pad_left = 0
-            elif align == "center":
-                pad_left = math.floor(pad_total / 2)
-            elif align == "right":
-                pad_left = pad_total
-            else:
-                pad_left = 0
-
-            pad_right = pad_total - pad_left
-            type_parts.append(f" {' ' * pad_left}{dtype_formatted}{' ' * pad_right} {border['v']}")
-        type_row = "".join(type_parts)
-
-        # Data rows
-        data_rows = []
-        for row_idx in range(len(df)):
-            row_parts = [border["v"]]
-            for col_idx, col_name in enumerate(col_names):
-                content = color_na(df[col_name][row_idx])
-                width = col_widths[col_idx]
-                pad_total = width - display_width(content)
-
-                if align == "left":
-                    pad_left = 0
-                elif align == "center":
-                    pad_left = math.floor(pad_total / 2)
-                elif align == "right":
-                    pad_left = pad_total
-                else:
-                    pad_left = 0
-
-                pad_right = pad_total - pad_left
-                row_parts.append(f" {' ' * pad_left}{content}{' ' * pad_right} {border['v']}")
-            
-            data_rows.append("".join(row_parts))
-
-        # Print table
-        print(top_line)
-        print(header)
-        print(type_row)
-        print(mid_line)
-        print("\n".join(data_rows))
-        print(bot_line)
+        return _affiche_method(df, align=align, na_color=na_color, theme=theme,
+                               max_rows=max_rows, max_cols=max_cols, count_rows=count_rows)
     
     return _affiche
 
@@ -2,52 +2,78 @@
 """
 count_null extension for Polars DataFrame and LazyFrame.
 
-This module monkey-patches the count_null() method onto pl.DataFrame.
-The patch is applied automatically when this module is imported.
+This module defines the count_null() method, which penguins.acutis.install() patches
+onto pl.DataFrame and pl.LazyFrame.
 
 Usage:
     df.count_null()
 """
 import polars as pl
+from penguins.core.schema import collect_schema
 
-def count_null(self):
+_ROWS = "__penguins_rows"
+
+# Define function for adding the null percentage column
+def _with_percent(null_counts):
     """
-    Count null values for each column in a DataFrame, with percentages.
-    Usage: df.count_null()
+    Add a formatted null_percent column from the null_count and row count columns.
     """
-    # Collect LazyFrame if needed
-    if isinstance(self, pl.LazyFrame):
-        df = self.collect()
-    else:
-        df = self
-    
-    # Get null counts for each column
-    null_counts = df.null_count().transpose(
-        include_header=True,
-        header_name="col",
-        column_names=["null_count"]
-    )
-    
-    # Calculate percentages
-    total_rows = len(df)
-    null_counts = null_counts.with_columns([
-        # Calculate raw percentage
+    share = pl.col("null_count") / pl.col(_ROWS)
+    return null_counts.with_columns(
         pl.when(pl.col("null_count") == 0)
           .then(pl.lit("0%"))
-          .when((pl.col("null_count") / total_rows) <= 0.0099)
+          .when(share <= 0.0099)
           .then(pl.lit("<1%"))
           .otherwise(
-              (pl.col("null_count") / total_rows * 100)
+              (share * 100)
               .round(0)
               .cast(pl.Int64)
               .cast(pl.Utf8) + "%"
           )
           .alias("null_percent")
-    ])
+    ).drop(_ROWS)
+
+def count_null(self, by=None, engine="auto"):
+    """
+    Count null values for each column in a DataFrame, with percentages.
+    
+    The null counts and the row count are computed in one lazy aggregation and
+    reshaped in the same query, so only the final table is ever materialized.
+    
+    by: Optional column name or list of names; if given, null counts are reported
+        for each group, in long format with one row per group and column
+    engine: Polars engine used to run the aggregation, e.g. "streaming" for
+            out-of-core scans (default "auto")
+    
+    Usage: df.count_null()
+           pl.scan_parquet("big.parquet").count_null(by="year", engine="streaming")
+    """
+    lf = self.lazy() if isinstance(self, pl.DataFrame) else self
+    
+    keys = [by] if isinstance(by, str) else list(by or [])
+    cols = [col for col in collect_schema(lf).names() if col not in keys]
+    # A single wildcard expression plans much faster than one expression per column
+    aggs = [pl.len().alias(_ROWS), pl.all().exclude(keys).null_count()]
+    
+    # Single-pass aggregation, over the whole table or per group
+    if keys:
+        counts = lf.group_by(keys).agg(aggs)
+    else:
+        counts = lf.select(aggs)
+    
+    # Reshape to long format and format percentages in the same lazy query
+    null_counts = counts.unpivot(
+        on=cols,
+        index=keys + [_ROWS],
+        variable_name="col",
+        value_name="null_count"
+    ).with_columns(pl.col("null_count").cast(pl.UInt32))
     
-    # Sort by missing count descending
-    return null_counts.sort("null_count", descending=True)
+    return _with_percent(null_counts).sort(
+        keys + ["null_count"],
+        descending=[False] * len(keys) + [True],
+        maintain_order=True
+    ).collect(engine=engine)
 
-# Monkey patch onto polars DataFrame and LazyFrame
-pl.DataFrame.count_null = count_null
-pl.LazyFrame.count_null = count_null 
\ No newline at end of file
+# Polars classes the method is patched onto by penguins.acutis.install()
+_PATCHES = {"count_null": (count_null, (pl.DataFrame, pl.LazyFrame))}
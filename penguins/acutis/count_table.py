@@ -2,63 +2,94 @@
 """
 count_table extension for Polars Series, DataFrame and LazyFrame.
 
-This module monkey-patches the count_table() method onto pl.Series and pl.DataFrame.
-The patch is applied automatically when this module is imported.
+This module defines the count_table() method, which penguins.acutis.install() patches
+onto pl.Series, pl.DataFrame and pl.LazyFrame.
 
 Usage:
     For Series: series.count_table()
-    For DataFrame: df["column"].count_table()
-    For LazyFrame: lf.select("column").count_table()
+    For DataFrame: df["column"].count_table() or df.count_table("column")
+    For LazyFrame: lf.count_table("column")
+    For crosstabs: df.count_table("species", "island")
 """
 import polars as pl
+from penguins.core.schema import collect_schema
 
-def count_table(self):
+# Define function for binning a numeric column
+def _bin_expr(name, bins):
+    """
+    Build an expression replacing a numeric column with the lower edge of its bin.
+    
+    bins: Number of equal-width bins between the column's min and max, or a list of
+          break points (values below the first break get -inf)
+    
+    Nulls stay null, so they are still counted as their own group.
+    """
+    col = pl.col(name).cast(pl.Float64)
+    
+    if isinstance(bins, int):
+        low = col.min()
+        width = (col.max() - low) / bins
+        index = ((col - low) / width).floor().clip(0, bins - 1)
+        edge = pl.when(width == 0).then(low).otherwise(low + index * width)
+    else:
+        edge = pl.lit(float("-inf"))
+        for brk in sorted(bins):
+            edge = pl.when(col >= brk).then(pl.lit(float(brk))).otherwise(edge)
+    
+    return pl.when(col.is_null()).then(None).otherwise(edge).alias(name)
+
+def count_table(self, *cols, top_n=None, bins=None, engine="auto"):
     """
     Create a count table with counts and percentages for a Series or DataFrame column.
     
+    The counts are built as one lazy group-by, so only the final table is materialized.
+    
+    cols: Column names to count; several names give a crosstab of their combinations
+          (default: every column of the DataFrame or LazyFrame)
+    top_n: Only keep the top_n most frequent values, with percentages still
+           computed against the full total (ties are ordered by value)
+    bins: Number of equal-width bins (or a list of break points) for numeric columns,
+          which are then labelled by the lower edge of their bin and sorted by it
+    engine: Polars engine used to run the query, e.g. "streaming" (default "auto")
+    
     For Series: series.count_table()
-    For DataFrame: df["column"].count_table()
-    For LazyFrame: lf.select("column").count_table()
+    For DataFrame: df["column"].count_table() or df.count_table("column")
+    For LazyFrame: lf.count_table("column")
     """
-    # Handle DataFrame/LazyFrame - take first column
-    if isinstance(self, (pl.DataFrame, pl.LazyFrame)):
-        # Collect LazyFrame if needed
-        if isinstance(self, pl.LazyFrame):
-            self = self.collect()
-            
-        if self.shape[1] != 1:
-            raise ValueError("count_table() requires a DataFrame with exactly one column")
-        series = self[self.columns[0]]
-        col_name = self.columns[0]
+    # Handle Series - count its values as a one-column frame
+    if isinstance(self, pl.Series):
+        if cols:
+            raise ValueError("count_table() on a Series does not take column names")
+        col_name = self.name or "value"
+        lf = self.to_frame(col_name).lazy()
+        keys = [col_name]
     else:
-        series = self
-        col_name = series.name or "value"
+        lf = self.lazy() if isinstance(self, pl.DataFrame) else self
+        keys = list(cols) or collect_schema(lf).names()
+    
+    # Replace numeric key columns with their bins
+    if bins is not None:
+        schema = collect_schema(lf)
+        binned = [_bin_expr(key, bins) for key in keys if schema[key].is_numeric()]
+        if binned:
+            lf = lf.with_columns(binned)
     
-    # Get value counts including nulls
+    # Count each combination of keys, with numeric percentages of the full total
     table = (
-        series.value_counts(sort=True)
-        .sort(pl.col("count"), descending=True)
+        lf.group_by(keys)
+        .agg(pl.len().alias("count"))
+        .with_columns((pl.col("count") / pl.col("count").sum() * 100).round(2).alias("percent"))
     )
     
-    # Rename columns
-    table = table.rename({series.name: col_name})
+    # Most frequent first, breaking ties by the keys so the order is deterministic
+    table = table.sort(["count", *keys], descending=[True, *[False] * len(keys)], nulls_last=True)
+    if top_n is not None:
+        table = table.head(top_n)
     
-    # Calculate percentages
-    total = table["count"].sum()
-    table = table.with_columns(
-        pl.when(pl.col("count") == 0)
-        .then(pl.lit("0%"))
-        .when((pl.col("count") / total * 100) < 1)
-        .then(pl.lit("<1%"))
-        .otherwise(
-            (pl.col("count") / total * 100).round(0).cast(pl.Int64).cast(pl.Utf8) + "%"
-        )
-        .alias("percent")
-    )
+    if bins is not None:
+        table = table.sort(keys, nulls_last=True)
     
-    return table
+    return table.collect(engine=engine)
 
-# Monkey-patch onto both Series and DataFrame
-pl.Series.count_table = count_table
-pl.DataFrame.count_table = count_table
-pl.LazyFrame.count_table = count_table  
\ No newline at end of file
+# Polars classes the method is patched onto by penguins.acutis.install()
+_PATCHES = {"count_table": (count_table, (pl.Series, pl.DataFrame, pl.LazyFrame))}
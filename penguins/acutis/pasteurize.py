@@ -1,17 +1,18 @@
 """
 pasteurize() extension for Polars DataFrames and LazyFrames.
 
-This module monkey-patches the pasteurize() method onto pl.DataFrame.
-The patch is applied automatically when this module is imported.
+This module defines the pasteurize() method, which penguins.acutis.install() patches
+onto pl.DataFrame and pl.LazyFrame.
 
 Usage:
     df.pasteurize()
 """
 import polars as pl
 import re
+from penguins.core.schema import collect_schema, tag_schema
 
 # Define the pasteurize() method
-def pasteurize(df):
+def pasteurize(df, maintain_order=True):
     """
     Clean a Polars DataFrame or LazyFrame by:
         Removing empty and duplicate rows
@@ -19,6 +20,13 @@ def pasteurize(df):
         Stripping whitespace from strings
         Converting "NA" and "NULL" char strings to true `null`s
         Converting strings to titlecase
+    
+    All steps are added to one lazy plan (a single batched expression for every string
+    column, then an all-null row filter and hash-based de-duplication), so LazyFrames
+    stay lazy and can be collected with the streaming engine.
+    
+    maintain_order: Keep the de-duplicated rows in their original order
+                    (default True); False lets Polars de-duplicate without ordering
     """
     # Clean column names first
     def clean_name(name):
@@ -28,33 +36,35 @@ def pasteurize(df):
         return name.strip('_')
     
     # Handle schema access efficiently for LazyFrames
-    if isinstance(df, pl.LazyFrame):
-        schema = df.collect_schema()
-        columns = schema.names()
-        dtypes = schema.dtypes()
-    else:
-        columns = df.columns
-        dtypes = df.dtypes
+    schema = collect_schema(df)
+    columns = schema.names()
+    dtypes = schema.dtypes()
+    
+    if not columns:
+        return df
     
     # Create mapping of old -> new column names
     rename_map = {col: clean_name(col) for col in columns}
     df = df.rename(rename_map)
     
     # Clean string columns: strip whitespace, replace NA variants, apply title case
-    # Use the NEW (cleaned) column names
+    # Use the NEW (cleaned) column names, in one expression for all of them
     string_cols = [rename_map[col] for col, dtype in zip(columns, dtypes) if dtype == pl.String]
     
-    for col in string_cols:
+    if string_cols:
         df = df.with_columns(
-            pl.col(col)
+            pl.col(string_cols)
             .str.strip_chars()
             .replace(["NA", "NULL", ""], None)
             .str.to_titlecase()
-            .alias(col)
         )
     
-    return df
+    # Remove rows that are entirely null, then duplicate rows
+    df = df.filter(~pl.all_horizontal(pl.all().is_null()))
+    df = df.unique(maintain_order=maintain_order)
+    
+    # Cleaning keeps every dtype, so the output schema is known without resolving it
+    return tag_schema(df, {rename_map[col]: dtype for col, dtype in zip(columns, dtypes)})
 
-# Monkey patch onto Polars DataFrame and LazyFrame
-pl.DataFrame.pasteurize = pasteurize
-pl.LazyFrame.pasteurize = pasteurize
\ No newline at end of file
+# Polars classes the method is patched onto by penguins.acutis.install()
+_PATCHES = {"pasteurize": (pasteurize, (pl.DataFrame, pl.LazyFrame))}
\ No newline at end of file
@@ -0,0 +1,68 @@
+# Establish the compiled-plan cache for pipelines
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+class PlanCache:
+    """
+    LRU cache of compiled pipeline plans.
+    
+    Keyed on (pipeline identity, input schema), so applying the same Pipeline to
+    many same-schema frames only resolves selectors and builds expressions once.
+    
+    maxsize: Maximum number of compiled plans kept before the least recently
+             used one is evicted (default 128)
+    """
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans = OrderedDict()
+    
+    def get(self, key):
+        """Return the cached plan for key, or None on a miss."""
+        plan = self._plans.get(key)
+        if plan is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._plans.move_to_end(key)
+        return plan
+    
+    def put(self, key, plan):
+        """Store a compiled plan, evicting the least recently used ones if full."""
+        self._plans[key] = plan
+        self._plans.move_to_end(key)
+        while len(self._plans) > max(self.maxsize, 0):
+            self._plans.popitem(last=False)
+    
+    def info(self):
+        """Return hit/miss counters and the current size."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._plans))
+    
+    def clear(self):
+        """Remove all compiled plans and reset the counters."""
+        self._plans.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Create the global plan cache
+plan_cache = PlanCache()
+
+def plan_cache_info():
+    """
+    Report compiled-plan cache statistics.
+    
+    Returns a CacheInfo(hits, misses, maxsize, currsize) named tuple
+    
+    Usage: penguins.plan_cache_info()
+    """
+    return plan_cache.info()
+
+def clear_plan_cache():
+    """
+    Empty the compiled-plan cache and reset its counters.
+    
+    Usage: penguins.clear_plan_cache()
+    """
+    plan_cache.clear()
@@ -0,0 +1,203 @@
+# Establish grouped frames for group_by()
+import polars as pl
+
+# Column holding each row's group on eager grouped frames, while a grouped verb runs
+GROUP_INDEX = "__penguins_group"
+
+class GroupedFrame:
+    """
+    A DataFrame or LazyFrame grouped by one or more key columns, as returned by group_by().
+    
+    Unlike a Polars GroupBy it isn't used up by the first aggregation: mutate(), filter()
+    and the slice_*() verbs work within each group and keep the grouping, summarize()
+    and reframe() aggregate each group and return a plain frame, and every other verb
+    runs on the underlying frame, staying grouped as long as the key columns survive.
+    ungroup() returns the plain frame.
+    
+    Eager frames grouped by several keys have the group of every row worked out once,
+    by the first grouped verb, as an integer index; later grouped verbs partition by
+    that single column instead of hashing all the keys again. When the frame is known
+    to be sorted by its keys (see arrange() and assume_sorted()), the index is numbered
+    run by run without hashing at all. LazyFrames leave this to the Polars query optimizer.
+    
+    frame: The DataFrame or LazyFrame that was grouped
+    keys: List of group key column names
+    
+    Usage:
+        gdf = df >> group_by(_.species, _.island)
+        gdf >> mutate(z=_.body_mass_g - _.body_mass_g.mean()) >> filter(_.z > 0)
+        gdf.ungroup()
+    """
+    def __init__(self, frame, keys, index=None):
+        self.frame = frame
+        self.keys = list(keys)
+        self._index = index
+    
+    def ungroup(self):
+        """Return the underlying DataFrame or LazyFrame."""
+        return self.frame
+    
+    def collect(self, **kwargs):
+        """Collect a lazy grouped frame, keeping its groups."""
+        from penguins.core.sortedness import carry_sorted
+        if isinstance(self.frame, pl.LazyFrame):
+            return GroupedFrame(carry_sorted(self.frame, self.frame.collect(**kwargs)), self.keys)
+        return self
+    
+    def lazy(self):
+        """Switch to a lazy grouped frame, keeping its groups."""
+        from penguins.core.sortedness import carry_sorted
+        if isinstance(self.frame, pl.DataFrame):
+            return GroupedFrame(carry_sorted(self.frame, self.frame.lazy()), self.keys)
+        return self
+    
+    def group_by(self, maintain_order=False):
+        """Return the Polars GroupBy (or LazyGroupBy) over the keys."""
+        return self.frame.group_by(self.keys, maintain_order=maintain_order)
+    
+    def partition(self, exprs=()):
+        """
+        Return the frame a grouped verb runs on, and the columns to partition it by.
+        
+        For eager frames grouped by several keys, the frame gets the group index column
+        (built on first use) and that column is the partition; otherwise the frame and
+        keys are returned as they are. So that the index never leaks into a result,
+        it isn't used when any of exprs expands to several columns (e.g. pl.all() or a
+        selector), since those would pick it up.
+        
+        exprs: The expressions the verb will evaluate on the frame
+        """
+        if not isinstance(self.frame, pl.DataFrame) or len(self.keys) < 2:
+            return self.frame, self.keys
+        if any(isinstance(expr, pl.Expr) and expr.meta.has_multiple_outputs() for expr in exprs):
+            return self.frame, self.keys
+        from penguins.core.sortedness import carry_sorted
+        if self._index is None:
+            self._index = self._build_index()
+        return carry_sorted(self.frame, self.frame.with_columns(self._index)), [GROUP_INDEX]
+    
+    def _build_index(self):
+        from penguins.core.sortedness import is_sorted_by
+        # Groups of a frame sorted by its keys are runs of rows, numbered in one pass
+        if is_sorted_by(self.frame, self.keys):
+            return self.frame.select(pl.struct(self.keys).rle_id().set_sorted().alias(GROUP_INDEX)).to_series()
+        # Otherwise each row's group is numbered by the position of the group's first row
+        return (
+            self.frame.select(self.keys).with_row_index(GROUP_INDEX)
+            .select(pl.col(GROUP_INDEX).min().over(self.keys))
+            .to_series()
+        )
+    
+    def regroup(self, result):
+        """
+        Group the result of a verb like this frame, if it still has the key columns.
+        
+        Results without all the key columns, and anything that isn't a frame, are
+        returned as they are.
+        """
+        if isinstance(result, pl.DataFrame):
+            names = result.columns
+        elif isinstance(result, pl.LazyFrame):
+            from penguins.core.schema import collect_schema
+            names = collect_schema(result).names()
+        else:
+            return result
+        if all(key in names for key in self.keys):
+            return self._keep(result)
+        return result
+    
+    def _keep(self, result):
+        # An eager result still holding the group index keeps it for the next grouped verb
+        from penguins.core.sortedness import carry_sorted
+        if isinstance(result, pl.DataFrame) and GROUP_INDEX in result.columns:
+            frame = carry_sorted(result, result.drop(GROUP_INDEX))
+            return GroupedFrame(frame, self.keys, result.get_column(GROUP_INDEX))
+        return GroupedFrame(result, self.keys)
+    
+    def __getattr__(self, name):
+        # Other methods (e.g. agg(), len()) come from the Polars GroupBy, so _.agg(...) works
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.group_by(), name)
+    
+    def __iter__(self):
+        # Iterate over (key, sub-frame) pairs like a Polars GroupBy, in order of appearance
+        return iter(self.group_by(maintain_order=True))
+    
+    def __repr__(self):
+        return f"GroupedFrame(keys={self.keys})\n{self.frame!r}"
+
+def group_parts(obj):
+    """
+    Get the frame and keys behind a GroupedFrame.
+    
+    Returns a (frame, keys) tuple, or None if obj isn't a GroupedFrame
+    """
+    if isinstance(obj, GroupedFrame):
+        return obj.frame, obj.keys
+    return None
+
+def is_grouped(obj):
+    """Check whether obj is a GroupedFrame, or a Polars GroupBy or LazyGroupBy."""
+    return isinstance(obj, (GroupedFrame, pl.dataframe.group_by.GroupBy, pl.lazyframe.group_by.LazyGroupBy))
+
+def partition(obj, verb_name, exprs=()):
+    """
+    Split the input of a grouped verb into the frame to work on and its partition.
+    
+    obj: A DataFrame, LazyFrame or GroupedFrame
+    verb_name: Name of the calling verb, for error messages
+    exprs: The expressions the verb will evaluate on the frame
+    
+    Returns a (frame, by) tuple, with by None for ungrouped frames; by is the group
+    index column for eager frames grouped by several keys (see GroupedFrame.partition())
+    """
+    if isinstance(obj, GroupedFrame):
+        return obj.partition(exprs)
+    if is_grouped(obj):
+        raise TypeError(
+            f"{verb_name}() needs to know the group keys; group with penguins' group_by() "
+            "rather than Polars' group_by() method"
+        )
+    return obj, None
+
+def keep_groups(obj, result):
+    """
+    Group the result of a grouped verb like its input.
+    
+    obj: The verb's input (ungrouped frames leave result unchanged)
+    result: The frame the verb produced from partition(), with every key column
+    """
+    if isinstance(obj, GroupedFrame):
+        return obj._keep(result)
+    return result
+
+def with_partition(columns, by):
+    """Add the group index column to a list of columns when a verb is partitioned by it."""
+    if by == [GROUP_INDEX]:
+        return [*columns, GROUP_INDEX]
+    return columns
+
+def aggregate(grouped, exprs):
+    """
+    Aggregate each group of a GroupedFrame.
+    
+    grouped: The GroupedFrame
+    exprs: Aggregation expressions
+    
+    Returns a plain frame with the keys followed by one column per expression
+    """
+    frame, by = grouped.partition(exprs)
+    if by == grouped.keys:
+        return frame.group_by(by).agg(*exprs)
+    return frame.group_by(by).agg(pl.col(grouped.keys).first(), *exprs).drop(GROUP_INDEX)
+
+def over_groups(expr, keys):
+    """
+    Evaluate an expression within each group as a window expression.
+    
+    Non-expression values (e.g. Series) are returned unchanged.
+    """
+    if keys and isinstance(expr, pl.Expr):
+        return expr.over(keys)
+    return expr
@@ -0,0 +1,47 @@
+# Establish package-wide options for penguins
+from contextlib import contextmanager
+
+class Options:
+    """
+    Package-wide settings that change how the pipe operator >> and verbs execute.
+    
+    auto_lazy: If True, piping an eager DataFrame switches it to a LazyFrame so the
+               whole chain is planned and optimized by Polars, and only collected at
+               terminal verbs like head(), pull(), affiche() or collect()
+    validate_sorted: If True, assume_sorted() checks that the rows really are in the
+                     declared order and raises a ValueError if they aren't (LazyFrames
+                     are collected for the check); meant for debugging, since a wrong
+                     claim makes the sorted fast paths return wrong results
+    
+    Usage:
+        penguins.options.auto_lazy = True
+        penguins.options.validate_sorted = True
+    """
+    def __init__(self):
+        self.auto_lazy = False
+        self.validate_sorted = False
+    
+    def __repr__(self):
+        settings = ", ".join(f"{key}={value!r}" for key, value in vars(self).items())
+        return f"Options({settings})"
+
+# Create the global options object
+options = Options()
+
+@contextmanager
+def lazy_mode(enabled=True):
+    """
+    Temporarily enable (or disable) auto-lazy execution for piped DataFrames.
+    
+    enabled: Whether auto-lazy execution is on inside the block (default True)
+    
+    Usage:
+        with lazy_mode():
+            df >> filter(_.year == 2008) >> mutate(x = _.body_mass_g / 1000) >> head(10)
+    """
+    previous = options.auto_lazy
+    options.auto_lazy = enabled
+    try:
+        yield options
+    finally:
+        options.auto_lazy = previous
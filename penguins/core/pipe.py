@@ -1,5 +1,10 @@
 # Establish the pipe operator >> for polars
 import polars as pl
+from penguins.core.options import options
+from penguins.core.groups import GroupedFrame
+from penguins.core.sortedness import carry_sorted
+from penguins.core.pipeline import Pipeline, FusedVerb
+from penguins.core.trace import current_trace
 
 class MethodCall:
     """
@@ -23,26 +28,91 @@ class MethodCall:
         method = getattr(df, self.method_name)
         return method(*self.args, **self.kwargs)
 
+def _is_auto_lazy(obj):
+    """Check whether a lazy frame or group was created by auto-lazy execution."""
+    return getattr(obj, "_penguins_auto_lazy", False)
+
+def _apply_auto_lazy(df, step):
+    """
+    Apply a single step to an auto-lazy frame.
+    
+    df: LazyFrame, LazyGroupBy or lazy GroupedFrame produced by auto-lazy execution
+    step: A verb, method call or other callable
+    
+    Returns the step's result, collected if the step is terminal
+    """
+    # Verbs that need eager input get the plan collected first
+    if getattr(step, "eager_only", False) and isinstance(df, (pl.LazyFrame, GroupedFrame)):
+        return step(carry_sorted(df, df.collect()))
+    
+    result = step(df)
+    lazy = isinstance(result, pl.LazyFrame) or (
+        isinstance(result, GroupedFrame) and isinstance(result.frame, pl.LazyFrame)
+    )
+    
+    if lazy and getattr(step, "terminal", False):
+        return carry_sorted(result, result.collect())
+    
+    # Mark the result so the next >> keeps accumulating the plan
+    if lazy or isinstance(result, pl.lazyframe.group_by.LazyGroupBy):
+        result._penguins_auto_lazy = True
+    return result
+
+def _run_step(df, step):
+    """
+    Apply a single step, recording it if a trace is active.
+    
+    df: The Polars object to apply the step to
+    step: A verb, method call or other callable
+    
+    Returns the step's result
+    """
+    if _is_auto_lazy(df):
+        run = lambda: _apply_auto_lazy(df, step)
+    else:
+        run = lambda: step(df)
+    
+    tracer = current_trace()
+    if tracer is None:
+        return run()
+    return tracer.record(step, df, run)
+
 def _pipe_rshift(self, other):
     """
     Pipe operator for Polars DataFrames.
     
     self: The Polars DataFrame
-    other: Either a verb function or a MethodCall object
+    other: A verb function, a MethodCall object or a Pipeline
     
-    Returns the result of applying the verb function or method call.
+    Returns the result of applying the verb function, method call or pipeline.
     """
-    # Check if other is a MethodCall (from _.method_name())
-    if isinstance(other, MethodCall):
-        return other(self)
-    # Otherwise it's a verb function
-    return other(self)
+    # In auto-lazy mode, eager DataFrames switch to a LazyFrame and accumulate the plan
+    if options.auto_lazy and isinstance(self, pl.DataFrame):
+        self = carry_sorted(self, self.lazy())
+        self._penguins_auto_lazy = True
+    elif options.auto_lazy and isinstance(self, GroupedFrame) and isinstance(self.frame, pl.DataFrame):
+        self = self.lazy()
+        self._penguins_auto_lazy = True
+    
+    # Pipelines run step by step, so each verb can be auto-lazy and traced on its own;
+    # steps after a terminal verb run on the collected result as usual
+    steps = other.steps_for(self) if isinstance(other, Pipeline) else (other,)
+    
+    # While tracing, fused runs are split back into their verbs so each gets its own event
+    if current_trace() is not None:
+        steps = [inner for step in steps for inner in (step.steps if isinstance(step, FusedVerb) else (step,))]
+    
+    result = self
+    for step in steps:
+        result = _run_step(result, step)
+    return result
 
 # Monkey-patch Polars DataFrame
 pl.DataFrame.__rshift__ = _pipe_rshift
 
-# Make Polars GroupBy pipeable
+# Make Polars GroupBy and penguins' GroupedFrame pipeable
 pl.dataframe.group_by.GroupBy.__rshift__ = _pipe_rshift
+GroupedFrame.__rshift__ = _pipe_rshift
 
 # Add LazyFrame support
 pl.LazyFrame.__rshift__ = _pipe_rshift
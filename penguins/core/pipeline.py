@@ -0,0 +1,410 @@
+# Establish deferred, reusable pipelines for the pipe operator >>
+import polars as pl
+import functools
+import itertools
+import re
+from penguins.core.cache import plan_cache
+from penguins.core.schema import collect_schema, tag_schema, defer_schema, infer_schema
+from penguins.core.groups import GroupedFrame
+from penguins.core.sortedness import carry_sorted
+
+# Unique identities for pipelines, used as plan cache keys
+_pipeline_ids = itertools.count()
+
+def _format_arg(arg):
+    """Format a verb argument for display, showing expressions in Polars notation."""
+    if isinstance(arg, (pl.DataFrame, pl.LazyFrame)):
+        return f"<{type(arg).__name__}>"
+    if isinstance(arg, (list, tuple)):
+        return f"[{', '.join(_format_arg(item) for item in arg)}]"
+    if getattr(arg, "_is_negated", False):
+        return f"-{_format_arg(arg._original)}"
+    expr = getattr(arg, "_expr", arg)
+    if isinstance(expr, pl.Expr):
+        return _format_expr(expr)
+    return repr(arg)
+
+def _format_expr(expr):
+    """
+    Format a Polars expression readably, e.g. col("x") > 1 rather than Polars' own
+    [(col("x")) > (dyn int: 1)].
+    
+    Polars prints every binary operation as [(left) op (right)]; these are rewritten
+    with parentheses only where operations nest, and literal type tags are dropped.
+    """
+    text = _tidy_expr(re.sub(r"\bdyn \w+: ", "", str(expr)))
+    if text.startswith("(") and _closing(text, 0) == len(text) - 1:
+        text = text[1:-1]
+    return text
+
+def _closing(text, start):
+    # Index of the bracket closing the one at start, skipping quoted strings
+    depth = 0
+    quoted = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if char == '"' and text[i - 1] != "\\":
+            quoted = not quoted
+        elif not quoted and char in "([":
+            depth += 1
+        elif not quoted and char in ")]":
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(text) - 1
+
+def _tidy_expr(text):
+    # Rewrite every [(left) op (right)] in text as (left op right)
+    out = []
+    i = 0
+    while i < len(text):
+        if text.startswith("[(", i):
+            end = _closing(text, i)
+            left_end = _closing(text, i + 1)
+            right_start = text.find("(", left_end + 1)
+            right_end = _closing(text, right_start)
+            if 0 < right_start < right_end == end - 1:
+                left = _tidy_expr(text[i + 2:left_end])
+                op = text[left_end + 1:right_start].strip()
+                right = _tidy_expr(text[right_start + 1:right_end])
+                out.append(f"({left} {op} {right})")
+                i = end + 1
+                continue
+        out.append(text[i])
+        i += 1
+    return "".join(out)
+
+class Verb:
+    """
+    Represents a verb call waiting for a DataFrame.
+    
+    Wraps the closure built by a verb function (e.g. filter(_.x > 1)) together with
+    the name and arguments it was called with, so it can be chained with >> into a
+    Pipeline before any data is supplied.
+    
+    Verbs that resolve columns against a schema (e.g. select(starts_with("bill")))
+    supply a compile function instead: compile(schema) does all of the Python-side
+    resolution and returns the closure to run on the data.
+    
+    Only grouped verbs see a GroupedFrame; any other verb runs on its underlying frame
+    and the result is grouped again.
+    """
+    def __init__(self, func=None, name=None, args=(), kwargs=None, fusable=False,
+                 terminal=False, eager_only=False, compile=None, grouped=False):
+        self.func = func
+        self.compile = compile
+        self.name = name or getattr(func, "__name__", "verb").lstrip("_")
+        self.args = args
+        self.kwargs = kwargs or {}
+        # Fusable verbs only issue lazy-compatible column/row operations,
+        # so adjacent ones can share a single lazy plan
+        self.fusable = fusable
+        # Terminal verbs end an auto-lazy chain by collecting their result,
+        # eager-only verbs need a collected DataFrame as input
+        self.terminal = terminal
+        self.eager_only = eager_only
+        # Grouped verbs work within the groups of a GroupedFrame
+        self.grouped = grouped
+    
+    def __call__(self, df):
+        """
+        Execute the verb on a DataFrame, LazyFrame or GroupedFrame.
+        
+        df: The Polars object to apply the verb to
+        
+        Returns the result of the wrapped closure
+        """
+        if isinstance(df, GroupedFrame) and not self.grouped:
+            return df.regroup(self(df.frame))
+        
+        schema = None
+        if self.compile is not None:
+            schema = collect_schema(df)
+            if schema is None:
+                raise TypeError(f"{self.name}() requires a DataFrame or LazyFrame, got {type(df).__name__}")
+            func = self.compile(schema)
+        else:
+            func = self.func
+        
+        result = func(df)
+        
+        # Fusable verbs carry their output schema forward on LazyFrames (worked out only
+        # if a later verb asks), so a lazy chain resolves its plan's schema at most once
+        frame, output = df, result
+        if isinstance(df, GroupedFrame) and isinstance(result, GroupedFrame):
+            frame, output = df.frame, result.frame
+        if self.fusable and isinstance(frame, pl.LazyFrame) and output is not frame:
+            defer_schema(output, func, schema if schema is not None else frame)
+        return result
+    
+    def bind(self, schema):
+        """
+        Resolve the verb against a known input schema.
+        
+        schema: The pl.Schema of the frames the verb will receive
+        
+        Returns a Verb whose closure skips all schema-dependent resolution
+        """
+        if self.compile is None:
+            return self
+        return Verb(self.compile(schema), self.name, self.args, self.kwargs,
+                    fusable=self.fusable, terminal=self.terminal, eager_only=self.eager_only,
+                    grouped=self.grouped)
+    
+    def __rshift__(self, other):
+        """
+        Chain this verb with another verb, method call or pipeline.
+        
+        Usage: p = filter(_.x > 1) >> select(_.x)
+        """
+        return Pipeline([self]) >> other
+    
+    def __repr__(self):
+        parts = [_format_arg(arg) for arg in self.args]
+        parts += [f"{key}={_format_arg(value)}" for key, value in self.kwargs.items()]
+        return f"{self.name}({', '.join(parts)})"
+
+class FusedVerb(Verb):
+    """
+    Represents a run of adjacent fusable verbs executed as one query.
+    
+    For an eager DataFrame the verbs are applied to df.lazy() and collected once,
+    so the chain runs in a single pass instead of allocating a new DataFrame per verb.
+    LazyFrames simply have the verbs appended to their plan, and GroupedFrames are
+    handed to each verb in turn so grouped verbs keep their groups.
+    """
+    def __init__(self, steps):
+        self.steps = tuple(steps)
+        super().__init__(self._run, "fused", args=self.steps, fusable=True,
+                         terminal=any(step.terminal for step in self.steps), grouped=True)
+    
+    def _run(self, df):
+        if isinstance(df, pl.DataFrame):
+            lf = tag_schema(carry_sorted(df, df.lazy()), df.schema)
+            for step in self.steps:
+                lf = step(lf)
+            return carry_sorted(lf, lf.collect())
+        for step in self.steps:
+            df = step(df)
+        return df
+    
+    def __repr__(self):
+        return f"fused({', '.join(repr(step) for step in self.steps)})"
+
+def _fuse(steps):
+    """
+    Collapse runs of two or more adjacent fusable verbs into FusedVerbs.
+    
+    steps: Sequence of pipeline steps
+    
+    Returns a list of steps
+    """
+    fused = []
+    run = []
+    for step in list(steps) + [None]:
+        if step is not None and getattr(step, "fusable", False):
+            # Expand previously fused runs so they can merge with their neighbours
+            run.extend(step.steps if isinstance(step, FusedVerb) else [step])
+            continue
+        if len(run) > 1:
+            fused.append(FusedVerb(run))
+        else:
+            fused.extend(run)
+        run = []
+        if step is not None:
+            fused.append(step)
+    return fused
+
+def _bind_steps(steps, schema):
+    """
+    Bind each step to the schema it will receive, propagating schemas between steps.
+    
+    Once a step's output schema can't be inferred, the remaining steps are left
+    unbound and resolve their columns at run time as usual.
+    
+    steps: Sequence of pipeline steps
+    schema: The input schema of the first step
+    
+    Returns a (bound_steps, output_schema) tuple
+    """
+    bound = []
+    for step in steps:
+        if schema is None:
+            bound.append(step)
+        elif isinstance(step, FusedVerb):
+            inner, schema = _bind_steps(step.steps, schema)
+            bound.append(FusedVerb(inner))
+        else:
+            if isinstance(step, Verb):
+                step = step.bind(schema)
+            bound.append(step)
+            schema = infer_schema(step, schema)
+    return bound, schema
+
+class Pipeline:
+    """
+    An ordered, reusable sequence of verbs.
+    
+    Built by chaining verbs with >> without a DataFrame on the left-hand side,
+    and applied later by piping a DataFrame into it. Nothing is executed until then,
+    so the same Pipeline can be applied to any number of same-schema frames.
+    
+    Usage:
+        p = _ >> filter(_.year == 2008) >> select(_.species, _.body_mass_g)
+        p = filter(_.year == 2008) >> select(_.species, _.body_mass_g)
+        df >> p
+    """
+    def __init__(self, steps=()):
+        flat = []
+        for step in steps:
+            # Nested pipelines are flattened into a single sequence
+            if isinstance(step, Pipeline):
+                flat.extend(step.steps)
+            elif callable(step):
+                flat.append(step)
+            else:
+                raise TypeError(f"Pipeline steps must be callable, got {type(step).__name__}")
+        self.steps = tuple(flat)
+        self._plan = None
+        self._id = next(_pipeline_ids)
+    
+    def __call__(self, df):
+        """
+        Apply every step of the optimized pipeline in order.
+        
+        The plan is compiled against the input schema and cached, so repeated
+        applications to same-schema frames skip column resolution entirely.
+        
+        df: The Polars DataFrame or LazyFrame to run the pipeline on
+        
+        Returns the result of the final step
+        """
+        for step in self.steps_for(df):
+            df = step(df)
+        return df
+    
+    def steps_for(self, df):
+        """
+        Return the executable steps for a given input frame.
+        
+        df: The Polars object the pipeline will be applied to
+        
+        Returns the compiled steps for DataFrames, LazyFrames and GroupedFrames, or
+        the uncompiled plan for other objects (e.g. a Polars GroupBy)
+        """
+        schema = collect_schema(df)
+        if schema is None:
+            return self.plan
+        return self.compile(schema)
+    
+    def compile(self, schema):
+        """
+        Compile the pipeline for a given input schema, using the plan cache.
+        
+        schema: The pl.Schema of the frames the pipeline will receive
+        
+        Returns a tuple of steps with all schema-dependent resolution done
+        """
+        key = (self._id, tuple(schema.items()))
+        steps = plan_cache.get(key)
+        if steps is None:
+            steps = tuple(_bind_steps(self.plan, schema)[0])
+            plan_cache.put(key, steps)
+        return steps
+    
+    @property
+    def plan(self):
+        """The steps executed when the pipeline runs, with fusable verbs collapsed."""
+        if self._plan is None:
+            self._plan = tuple(_fuse(self.steps))
+        return self._plan
+    
+    def optimize(self):
+        """
+        Return the pipeline with adjacent fusable verbs collapsed.
+        
+        Consecutive verbs such as mutate(), filter(), select(), rename() and relocate()
+        are fused into a single lazy query, so an eager DataFrame is only collected once.
+        This is applied automatically when the pipeline runs; call it to inspect the plan.
+        
+        Usage: print(p.optimize())
+        """
+        return Pipeline(_fuse(self.steps))
+    
+    def __rshift__(self, other):
+        """Append a verb, method call or another pipeline."""
+        return Pipeline(self.steps + (other,))
+    
+    def __len__(self):
+        return len(self.steps)
+    
+    def __iter__(self):
+        return iter(self.steps)
+    
+    def __getitem__(self, index):
+        """Return a single step, or a sub-pipeline when sliced."""
+        if isinstance(index, slice):
+            return Pipeline(self.steps[index])
+        return self.steps[index]
+    
+    def __repr__(self):
+        if not self.steps:
+            return "Pipeline()"
+        lines = "\n  >> ".join(repr(step) for step in self.steps)
+        return f"Pipeline(\n  {lines}\n)"
+
+def schema_free(func):
+    """
+    Mark the closure returned by a compiled verb as not needing the input schema.
+    
+    A compiled verb's function can return a marked closure instead of a compile
+    function when every argument resolves inside the Polars plan (e.g. selectors that
+    translate to polars.selectors), so no schema is collected before it runs.
+    
+    Usage:
+        @schema_free
+        def _select(df):
+            return df.select(selectors)
+    """
+    func._schema_free = True
+    return func
+
+def verb(func=None, *, fusable=False, terminal=False, eager_only=False, compiled=False,
+         grouped=False):
+    """
+    Decorator for verb functions.
+    
+    Wraps the closure returned by a verb function in a Verb, recording the verb's
+    name and arguments so the call can be inspected and chained into a Pipeline.
+    
+    fusable: Whether the verb's closure works unchanged on a LazyFrame, allowing
+             adjacent fusable verbs in a Pipeline to run as one lazy query
+    terminal: Whether the verb ends an auto-lazy chain, collecting its result
+    eager_only: Whether the verb requires an eager DataFrame as input
+    compiled: Whether the verb function returns a compile(schema) function
+              rather than the closure itself (or a closure marked @schema_free)
+    grouped: Whether the closure handles a GroupedFrame itself; other verbs run on
+             the underlying frame of a GroupedFrame
+    
+    Usage:
+        @verb
+        def my_verb(n):
+            def _my_verb(df):
+                return df.head(n)
+            return _my_verb
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            built = func(*args, **kwargs)
+            if compiled and not getattr(built, "_schema_free", False):
+                return Verb(None, func.__name__, args, kwargs, fusable=fusable,
+                            terminal=terminal, eager_only=eager_only, compile=built,
+                            grouped=grouped)
+            return Verb(built, func.__name__, args, kwargs, fusable=fusable,
+                        terminal=terminal, eager_only=eager_only, grouped=grouped)
+        return wrapper
+    
+    if func is None:
+        return decorate
+    return decorate(func)
@@ -0,0 +1,203 @@
+# Establish schema access and tracking for polars frames
+import polars as pl
+from penguins.core.groups import group_parts
+
+# Attribute used to carry a known schema on a LazyFrame
+_SCHEMA_ATTR = "_penguins_schema"
+
+class SchemaTracker:
+    """
+    Counts how often a LazyFrame's schema had to be resolved by Polars.
+    
+    Resolving a schema walks the whole query plan, so deep lazy chains that resolve
+    it at every verb pay quadratic planning cost. Verbs carry their output schema
+    forward instead, and this counter shows how often that wasn't possible.
+    """
+    def __init__(self):
+        self.resolutions = 0
+    
+    def reset(self):
+        """Reset the resolution counter."""
+        self.resolutions = 0
+
+# Create the global schema tracker
+schema_tracker = SchemaTracker()
+
+class DeferredSchema:
+    """
+    A verb's output schema, only worked out when something first asks for it.
+    
+    Carrying these instead of computed schemas keeps piping a verb onto a LazyFrame
+    free; the schema is inferred step by step on empty LazyFrames only if a later verb
+    (e.g. one resolving selectors against the schema) needs it.
+    
+    func: The verb's closure
+    source: The closure's input: a pl.Schema, another DeferredSchema, or the input
+            LazyFrame itself when nothing was known about it
+    """
+    __slots__ = ("func", "source", "schema", "resolved")
+    
+    def __init__(self, func, source):
+        self.func = func
+        self.source = source
+        self.schema = None
+        self.resolved = False
+    
+    def resolve(self):
+        """Work out the schema, walking back to the nearest known one without recursion."""
+        pending = []
+        current = self
+        while isinstance(current, DeferredSchema) and not current.resolved:
+            pending.append(current)
+            current = current.source
+        
+        if isinstance(current, DeferredSchema):
+            schema = current.schema
+        elif isinstance(current, pl.LazyFrame):
+            schema = collect_schema(current)
+        else:
+            schema = current
+        
+        for deferred in reversed(pending):
+            schema = output_schema(deferred.func, schema) if schema is not None else None
+            deferred.schema = schema
+            deferred.resolved = True
+            # The closure and input are no longer needed once resolved
+            deferred.func = deferred.source = None
+        return schema
+
+def known_schema(df):
+    """
+    Get the schema of a DataFrame, or the schema carried by a LazyFrame, without
+    resolving the LazyFrame's own query plan.
+    
+    df: The Polars object to inspect (a GroupedFrame gives its frame's schema)
+    
+    Returns a pl.Schema, or None if the LazyFrame carries no schema
+    """
+    groups = group_parts(df)
+    if groups is not None:
+        df = groups[0]
+    if isinstance(df, pl.DataFrame):
+        return df.schema
+    carried = getattr(df, _SCHEMA_ATTR, None)
+    if isinstance(carried, DeferredSchema):
+        return carried.resolve()
+    return carried
+
+def carried_schema(df):
+    """
+    Get a DataFrame's schema, or a LazyFrame's carried schema only if it is already
+    worked out; never resolves or infers anything.
+    """
+    if isinstance(df, pl.DataFrame):
+        return df.schema
+    carried = getattr(df, _SCHEMA_ATTR, None)
+    if isinstance(carried, DeferredSchema):
+        return carried.schema
+    return carried
+
+def tag_schema(df, schema):
+    """
+    Attach a known schema to a LazyFrame so later verbs don't need to resolve it.
+    
+    df: The Polars object produced by a verb
+    schema: Its output schema (ignored if None)
+    
+    Returns df
+    """
+    if schema is not None and isinstance(df, pl.LazyFrame):
+        setattr(df, _SCHEMA_ATTR, pl.Schema(schema))
+    return df
+
+def defer_schema(result, func, source):
+    """
+    Attach a DeferredSchema to a LazyFrame produced by a lazy verb.
+    
+    result: The LazyFrame returned by func
+    func: The verb's closure
+    source: The closure's input schema, or its input LazyFrame
+    
+    Returns result
+    """
+    if not isinstance(result, pl.LazyFrame) or hasattr(result, _SCHEMA_ATTR):
+        return result
+    if isinstance(source, pl.LazyFrame):
+        source = getattr(source, _SCHEMA_ATTR, source)
+    setattr(result, _SCHEMA_ATTR, DeferredSchema(func, source))
+    return result
+
+def collect_schema(df):
+    """
+    Get the schema of a DataFrame or LazyFrame.
+    
+    A schema carried by the LazyFrame is used when available; otherwise the plan is
+    resolved (and counted), and the result is carried on the frame for next time.
+    
+    df: The Polars object to inspect
+    
+    Returns a pl.Schema, or None for objects without a schema (e.g. a Polars GroupBy)
+    """
+    groups = group_parts(df)
+    if groups is not None:
+        df = groups[0]
+    schema = known_schema(df)
+    if schema is not None or not isinstance(df, pl.LazyFrame):
+        return schema
+    schema_tracker.resolutions += 1
+    schema = df.collect_schema()
+    tag_schema(df, schema)
+    return schema
+
+def output_schema(func, schema):
+    """
+    Work out the output schema of a lazy operation from its input schema.
+    
+    func runs against an empty LazyFrame of the input schema, so resolving its
+    output only costs a one-step plan no matter how deep the real plan is.
+    
+    func: A function taking and returning a LazyFrame
+    schema: The input schema
+    
+    Returns the output pl.Schema, or None if it can't be worked out
+    """
+    try:
+        result = func(tag_schema(pl.LazyFrame(schema=schema), schema))
+    except Exception:
+        return None
+    if isinstance(result, pl.LazyFrame):
+        return result.collect_schema()
+    return None
+
+def infer_schema(step, schema):
+    """
+    Infer the output schema of a pipeline step without touching any data.
+    
+    Only fusable verbs are inferred, since they are pure lazy operations that are safe
+    to run against an empty LazyFrame; anything else (terminal verbs, sinks, verbs
+    that collect) returns None.
+    
+    step: A pipeline step
+    schema: The step's input schema
+    
+    Returns the output pl.Schema, or None if it can't be inferred
+    """
+    if schema is None or not getattr(step, "fusable", False):
+        return None
+    return output_schema(step, schema)
+
+def schema_resolutions():
+    """
+    Report how many times a LazyFrame schema was resolved by walking its plan.
+    
+    Usage: penguins.schema_resolutions()
+    """
+    return schema_tracker.resolutions
+
+def reset_schema_resolutions():
+    """
+    Reset the schema resolution counter.
+    
+    Usage: penguins.reset_schema_resolutions()
+    """
+    schema_tracker.reset()
@@ -0,0 +1,186 @@
+# Establish sortedness tracking for polars frames
+import itertools
+import polars as pl
+from penguins.core.groups import GroupedFrame, group_parts
+
+# Attribute used to carry the known sort order on a DataFrame or LazyFrame
+_SORTED_ATTR = "_penguins_sorted"
+
+def sort_keys(cols, descending):
+    """
+    Work out the sort order a sort by cols leaves behind.
+    
+    cols: Column names or expressions, as passed to Polars' sort()
+    descending: One flag per column
+    
+    Returns a tuple of (column, descending) pairs for the leading plain columns; a sort
+    by a computed expression orders rows by something no column holds, so the order
+    stops there
+    """
+    keys = []
+    for col, desc in zip(cols, descending):
+        if isinstance(col, pl.Expr) and col.meta.is_column():
+            col = col.meta.output_name()
+        if not isinstance(col, str):
+            break
+        keys.append((col, bool(desc)))
+    return tuple(keys)
+
+def sort_order(df, depth=None):
+    """
+    Get the order the rows of a frame are known to be sorted in.
+    
+    The order is recorded by arrange() and assume_sorted() and carried through verbs
+    that keep rows in place. A DataFrame can still be changed in place afterwards (e.g.
+    with replace_column()), so its recorded order is only trusted as far as the data
+    bears it out: the first column must still carry Polars' sorted flag, and any further
+    columns are checked against the rows in one pass. DataFrames sorted outside penguins
+    report the first column Polars has flagged.
+    
+    df: The Polars object to inspect (a GroupedFrame gives its frame's order)
+    depth: Number of leading columns the caller needs; columns past it are not checked
+    
+    Returns a tuple of (column, descending) pairs, lexicographic like arrange(); empty
+    when nothing is known
+    """
+    groups = group_parts(df)
+    if groups is not None:
+        df = groups[0]
+    if not isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+        return ()
+    order = getattr(df, _SORTED_ATTR, ())
+    if not isinstance(df, pl.DataFrame):
+        return order
+    if order:
+        name, desc = order[0]
+        if name in df.columns and _flagged(df.get_column(name)) == desc:
+            order = order[:depth] if depth is not None else order
+            return order[:_checked_prefix(df, order)]
+    for series in df.iter_columns():
+        desc = _flagged(series)
+        if desc is not None:
+            return ((series.name, desc),)
+    return ()
+
+def _checked_prefix(df, order):
+    # Number of leading keys of order the rows of df are actually sorted by (the first is
+    # vouched for by Polars' sorted flag)
+    if len(order) < 2:
+        return len(order)
+    if any(name not in df.columns for name, _ in order):
+        return 1
+    sorted_by = df.select([
+        unsorted_rows(order[:length]).any().not_().alias(str(length))
+        for length in range(2, len(order) + 1)
+    ]).row(0)
+    return 1 + sum(1 for _ in itertools.takewhile(bool, sorted_by))
+
+def _flagged(series):
+    # Direction of a column's Polars sorted flag: False ascending, True descending, None unsorted
+    flags = series.flags
+    if flags["SORTED_ASC"]:
+        return False
+    if flags["SORTED_DESC"]:
+        return True
+    return None
+
+def tag_sorted(df, order):
+    """
+    Record the sort order of a frame produced by a verb.
+    
+    DataFrames also get Polars' sorted flag on the first column when Polars dropped it
+    along the way (e.g. slicing a LazyFrame), so Polars' own fast paths still apply.
+    
+    df: A DataFrame or LazyFrame (for a GroupedFrame, its frame is tagged)
+    order: Tuple of (column, descending) pairs
+    
+    Returns the tagged frame
+    """
+    if isinstance(df, GroupedFrame):
+        df.frame = tag_sorted(df.frame, order)
+        return df
+    if isinstance(df, pl.DataFrame) and order:
+        name, desc = order[0]
+        if name in df.columns and _flagged(df.get_column(name)) != desc:
+            df = df.with_columns(pl.col(name).set_sorted(descending=desc))
+    if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+        setattr(df, _SORTED_ATTR, tuple(order))
+    return df
+
+def carry_sorted(source, result, changed=()):
+    """
+    Carry the sort order of a verb's input over to its result.
+    
+    Only for verbs that keep the remaining rows in their order (e.g. filter() or head()).
+    
+    source: The verb's input
+    result: The verb's output
+    changed: Columns the verb overwrote, or None if it may have overwritten any; the
+             order is cut off at the first of them
+    
+    Returns result, tagged with the order
+    """
+    order = getattr(_frame(source), _SORTED_ATTR, ())
+    if not order or changed is None or hasattr(_frame(result), _SORTED_ATTR):
+        return result
+    kept = []
+    for name, desc in order:
+        if name in changed:
+            break
+        kept.append((name, desc))
+    return tag_sorted(result, kept)
+
+def _frame(obj):
+    # The frame behind a GroupedFrame, or obj itself
+    groups = group_parts(obj)
+    return groups[0] if groups is not None else obj
+
+def is_sorted_by(df, columns):
+    """
+    Check whether equal values of columns are known to sit in adjacent rows.
+    
+    That holds when the columns, in any order, are exactly the leading columns of the
+    frame's sort order; then distinct rows and groups can be found in one pass over
+    neighbouring rows instead of by hashing.
+    
+    df: The Polars object to inspect
+    columns: List of column names
+    """
+    order = sort_order(df, len(columns))
+    if not columns or len(columns) > len(order):
+        return False
+    return set(columns) == {name for name, _ in order[:len(columns)]}
+
+def is_sorted_on(df, column, descending=False):
+    """Check whether a single column is known to be sorted in the given direction."""
+    order = sort_order(df, 1)
+    return bool(order) and order[0] == (column, descending)
+
+def changes(columns):
+    """
+    Build an expression that is True on the first row and wherever any of columns
+    differs from the row before (nulls compare equal to each other).
+    
+    On a frame sorted by columns, these are the first rows of each distinct value.
+    """
+    changed = pl.int_range(pl.len()) == 0
+    for name in columns:
+        changed = changed | pl.col(name).ne_missing(pl.col(name).shift(1))
+    return changed
+
+def unsorted_rows(order):
+    """
+    Build an expression that is True on every row out of place in the given order.
+    
+    Rows are compared with the row before, lexicographically over the columns; nulls
+    are expected first, as Polars sorts them by default.
+    """
+    violation = pl.lit(False)
+    equal = pl.lit(True)
+    for name, desc in order:
+        current, previous = pl.col(name), pl.col(name).shift(1)
+        wrong_way = (current > previous) if desc else (current < previous)
+        out_of_order = wrong_way.fill_null(False) | (current.is_null() & previous.is_not_null())
+        violation = violation | (equal & out_of_order)
+        equal = equal & current.eq_missing(previous)
+    return violation
@@ -1,5 +1,6 @@
 # Establish symbolic attribution for polars dataframes
 import polars as pl
+from penguins.core.pipeline import Pipeline
 
 class MethodCall:
     """
@@ -22,6 +23,19 @@ class MethodCall:
         """
         method = getattr(df, self.method_name)
         return method(*self.args, **self.kwargs)
+    
+    def __rshift__(self, other):
+        """
+        Chain the method call into a deferred Pipeline.
+        
+        Usage: p = _.head(5) >> select(_.species)
+        """
+        return Pipeline([self]) >> other
+    
+    def __repr__(self):
+        parts = [repr(arg) for arg in self.args]
+        parts += [f"{key}={value!r}" for key, value in self.kwargs.items()]
+        return f"_.{self.method_name}({', '.join(parts)})"
 
 class SymbolicAttr:
     """
@@ -44,14 +58,14 @@ class SymbolicAttr:
     def __getattr__(self, attr):
         """
         Forward attribute access to the Polars expression.
-    
+        
         Allows chaining like _.column_name.fill_null()
         """
         # Check if this is an aggregation method we need to track for pandas
         if attr in ['count', 'sum', 'mean', 'min', 'max', 'std', 'var', 'first', 'last', 'median']:
             # Return a ChainedSymbolicAttr that tracks the aggregation
             return ChainedSymbolicAttr(self.name, attr)
-    
+        
         return getattr(self._expr, attr)
     
     def __repr__(self):
@@ -60,7 +74,7 @@ class SymbolicAttr:
     def __neg__(self):
         """
         Support negation for descending sorts.
-    
+        
         Usage: df >> arrange(-_.column_name)
         """
         negated = SymbolicAttr(self.name)
@@ -70,33 +84,45 @@ class SymbolicAttr:
     
     def __eq__(self, other):
         """Support == comparisons"""
+        if isinstance(other, SymbolicAttr):
+            other = other._expr
         return self._expr.__eq__(other)
-
+    
     def __ne__(self, other):
         """Support != comparisons"""
+        if isinstance(other, SymbolicAttr):
+            other = other._expr
         return self._expr.__ne__(other)
-
+    
     def __lt__(self, other):
         """Support < comparisons"""
+        if isinstance(other, SymbolicAttr):
+            other = other._expr
         return self._expr.__lt__(other)
-
+    
     def __le__(self, other):
         """Support <= comparisons"""
+        if isinstance(other, SymbolicAttr):
+            other = other._expr
         return self._expr.__le__(other)
-
+    
     def __gt__(self, other):
         """Support > comparisons"""
+        if isinstance(other, SymbolicAttr):
+            other = other._expr
         return self._expr.__gt__(other)
-
+    
     def __ge__(self, other):
         """Support >= comparisons"""
+        if isinstance(other, SymbolicAttr):
+            other = other._expr
         return self._expr.__ge__(other)
     
     # Add invert method to select()
     def __invert__(self):
         """
         Support deselection with ~ operator.
-    
+        
         Usage: df >> select(~_.column_name)
         """
         return DeSelect(self)
@@ -105,7 +131,7 @@ class SymbolicAttr:
     def __or__(self, other):
         """
         Support range selection with | operator.
-    
+        
         Usage: df >> select(_.col1 | _.col2)
         """
         return ColumnRange(self, other)
@@ -137,52 +163,62 @@ class SymbolicAttr:
         if isinstance(other, SymbolicAttr):
             other = other._expr
         return self._expr.__add__(other)
-
+    
     def __sub__(self, other):
         """Support - subtraction"""
         if isinstance(other, SymbolicAttr):
             other = other._expr
         return self._expr.__sub__(other)
-
+    
     def __mul__(self, other):
         """Support * multiplication"""
         if isinstance(other, SymbolicAttr):
             other = other._expr
         return self._expr.__mul__(other)
-
+    
     def __truediv__(self, other):
         """Support / division"""
         if isinstance(other, SymbolicAttr):
             other = other._expr
         return self._expr.__truediv__(other)
-
+    
     def __floordiv__(self, other):
         """Support // floor division"""
         if isinstance(other, SymbolicAttr):
             other = other._expr
         return self._expr.__floordiv__(other)
-
+    
     def __mod__(self, other):
         """Support % modulo"""
         if isinstance(other, SymbolicAttr):
             other = other._expr
         return self._expr.__mod__(other)
-
+    
     def __pow__(self, other):
         """Support ** exponentiation"""
         if isinstance(other, SymbolicAttr):
             other = other._expr
         return self._expr.__pow__(other)
-    
+
 class ChainedSymbolicAttr(SymbolicAttr):
     """
     Tracks chained method calls on symbolic attributes for pandas compatibility.
+    
+    Both _.col.mean() and the pandas-style _.col.mean give the aggregation expression.
     """
     def __init__(self, name, agg_func):
         self.name = name
         self._agg_func = agg_func
-        self._expr = pl.col(name)
+        self._expr = getattr(pl.col(name), agg_func)()
     
+    def __call__(self, *args, **kwargs):
+        """
+        Called when used as _.col.mean() in an expression.
+        
+        Returns the Polars aggregation expression, e.g. pl.col("col").mean()
+        """
+        return getattr(pl.col(self.name), self._agg_func)(*args, **kwargs)
+
 # Establish symbolic class for polars dataframes
 class Symbolic:
     """
@@ -202,6 +238,14 @@ class Symbolic:
         """
         return SymbolicAttr(name)
     
+    def __rshift__(self, other):
+        """
+        Start a deferred Pipeline from the placeholder.
+        
+        Usage: p = _ >> filter(_.year == 2008) >> select(_.species)
+        """
+        return Pipeline([other])
+
 # Helper classes for column selection patterns
 class ColumnRange:
     """
@@ -226,5 +270,11 @@ class DeSelect:
     def __init__(self, col):
         self.col = col
     
+    def __repr__(self):
+        col = self.col
+        if isinstance(col, SymbolicAttr):
+            return f"~_.{col.name}"
+        return f"~{col!r}"
+
 # Create the global _ object for column references
 _ = Symbolic()
\ No newline at end of file
@@ -0,0 +1,251 @@
+# Establish per-verb tracing for the pipe operator >>
+import json
+import time
+from contextlib import contextmanager
+from collections import namedtuple
+import polars as pl
+from penguins.core.schema import carried_schema
+from penguins.core.groups import group_parts
+
+TraceEvent = namedtuple("TraceEvent", [
+    "step", "verb", "start", "duration",
+    "rows_in", "cols_in", "rows_out", "cols_out",
+    "size_out", "collected"
+])
+
+# Attribute used to record which traced steps built a LazyFrame
+_LINEAGE_ATTR = "_penguins_trace_steps"
+
+# Polars plan node keywords produced by each verb, used to map profile() timings back
+_NODE_KEYWORDS = {
+    "filter": ("filter",),
+    "mutate": ("with_column", "hstack"),
+    "round": ("with_column", "hstack"),
+    "select": ("select", "projection"),
+    "relocate": ("select", "projection"),
+    "rename": ("select", "projection", "rename"),
+    "arrange": ("sort",),
+    "assume_sorted": ("with_column", "hstack"),
+    "head": ("slice",),
+    "tail": ("slice",),
+    "slice": ("slice",),
+    "slice_max": ("filter", "sort"),
+    "slice_min": ("filter", "sort"),
+    "slice_head": ("slice", "group_by", "aggregate"),
+    "slice_tail": ("slice", "group_by", "aggregate"),
+    "distinct": ("unique",),
+    "drop_null": ("drop_nulls", "filter"),
+    "unite": ("with_column", "hstack"),
+    "separate": ("with_column", "hstack", "select"),
+    "join": ("join",),
+    "join_asof": ("join", "sort"),
+    "join_where": ("join", "cross", "filter"),
+    "join_many": ("join", "with_column", "hstack"),
+    "summarize": ("group_by", "aggregate"),
+    "reframe": ("group_by", "aggregate"),
+    "pivot_longer": ("unpivot", "melt"),
+    "bind_rows": ("union", "concat"),
+    "bind_cols": ("hconcat", "horizontal")
+}
+
+def _shape(df):
+    """Return (rows, cols) for a frame without resolving any query plan (None if unknown)."""
+    groups = group_parts(df)
+    if groups is not None:
+        df = groups[0]
+    if isinstance(df, pl.DataFrame):
+        return df.height, df.width
+    schema = carried_schema(df)
+    return None, (len(schema) if schema is not None else None)
+
+def _verb_name(step):
+    """Name of the verb (or method) behind a pipeline step."""
+    if hasattr(step, "name"):
+        return step.name
+    if hasattr(step, "method_name"):
+        return step.method_name
+    return getattr(step, "__name__", type(step).__name__)
+
+class Trace:
+    """
+    Records one TraceEvent per verb applied with >> while tracing is active.
+    
+    Each event holds the step, its wall time, rows and columns in and out (rows are
+    unknown for LazyFrames until collected), the estimated size of eager outputs and
+    whether a LazyFrame was collected along the way.
+    """
+    def __init__(self):
+        self.events = []
+        self._origin = time.perf_counter()
+    
+    def record(self, step, df, run):
+        """
+        Time a step and record its event.
+        
+        step: The pipeline step being applied
+        df: The step's input
+        run: Zero-argument callable applying the step to df
+        
+        Returns the step's result
+        """
+        start = time.perf_counter()
+        result = run()
+        duration = time.perf_counter() - start
+        
+        rows_in, cols_in = _shape(df)
+        rows_out, cols_out = _shape(result)
+        size_out = result.estimated_size() if isinstance(result, pl.DataFrame) else None
+        collected = isinstance(df, pl.LazyFrame) and isinstance(result, pl.DataFrame)
+        
+        self.events.append(TraceEvent(
+            repr(step), _verb_name(step), start - self._origin, duration,
+            rows_in, cols_in, rows_out, cols_out, size_out, collected
+        ))
+        
+        # Remember which traced steps built a LazyFrame, for profile()
+        if isinstance(result, pl.LazyFrame) and result is not df:
+            lineage = getattr(df, _LINEAGE_ATTR, ()) if isinstance(df, pl.LazyFrame) else ()
+            setattr(result, _LINEAGE_ATTR, lineage + (len(self.events) - 1,))
+        
+        return result
+    
+    def to_frame(self):
+        """
+        Return the trace as a DataFrame with one row per verb.
+        
+        Usage: t.to_frame().affiche()
+        """
+        return pl.DataFrame({
+            "step": [event.step for event in self.events],
+            "verb": [event.verb for event in self.events],
+            "duration_ms": [event.duration * 1000 for event in self.events],
+            "rows_in": [event.rows_in for event in self.events],
+            "cols_in": [event.cols_in for event in self.events],
+            "rows_out": [event.rows_out for event in self.events],
+            "cols_out": [event.cols_out for event in self.events],
+            "size_out": [event.size_out for event in self.events],
+            "collected": [event.collected for event in self.events]
+        }, schema={
+            "step": pl.String, "verb": pl.String, "duration_ms": pl.Float64,
+            "rows_in": pl.Int64, "cols_in": pl.Int64, "rows_out": pl.Int64,
+            "cols_out": pl.Int64, "size_out": pl.Int64, "collected": pl.Boolean
+        })
+    
+    def to_json(self, path=None):
+        """
+        Export the trace as JSON.
+        
+        path: Optional file to write to
+        
+        Returns the JSON string
+        """
+        text = json.dumps([event._asdict() for event in self.events], indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+    
+    def to_chrome_trace(self, path):
+        """
+        Write the trace in Chrome's trace event format.
+        
+        Open the file in chrome://tracing or https://ui.perfetto.dev to see a timeline.
+        
+        path: File to write to
+        """
+        trace_events = [
+            {
+                "name": event.verb,
+                "cat": "penguins",
+                "ph": "X",
+                "ts": event.start * 1e6,
+                "dur": event.duration * 1e6,
+                "pid": 0,
+                "tid": 0,
+                "args": {key: value for key, value in event._asdict().items()
+                         if key not in ("verb", "start", "duration")}
+            }
+            for event in self.events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+    
+    def profile(self, lf, **kwargs):
+        """
+        Collect a traced LazyFrame with Polars' profiler and map node timings to verbs.
+        
+        Polars reports timings per plan node rather than per verb, so nodes are matched
+        to the traced verbs that built lf by the kind of node each verb produces (e.g.
+        mutate() -> with_columns, arrange() -> sort). Nodes that no verb
+        accounts for (scans, optimization) get a null verb. Optimization can merge or
+        reorder nodes, so treat the mapping as a guide rather than an exact attribution.
+        
+        lf: A LazyFrame produced by >> while this trace was active
+        **kwargs: Passed on to LazyFrame.profile()
+        
+        Returns a (DataFrame, timings) tuple like LazyFrame.profile(), with a verb
+        column added to the timings
+        """
+        if not hasattr(pl.LazyFrame, "profile"):
+            raise NotImplementedError(
+                f"LazyFrame.profile() is not available in Polars {pl.__version__}, "
+                "so per-node timings can't be mapped to verbs"
+            )
+        
+        df, timings = lf.profile(**kwargs)
+        steps = [self.events[i] for i in getattr(lf, _LINEAGE_ATTR, ())]
+        
+        # The optimizer can reorder nodes (e.g. push a filter below a sort), so each node
+        # goes to the first verb producing that kind of node, preferring verbs no earlier
+        # node was matched to
+        verbs = []
+        matched = set()
+        for node in timings["node"].to_list():
+            node = node.lower()
+            candidates = [
+                i for i, step in enumerate(steps)
+                if any(keyword in node for keyword in _NODE_KEYWORDS.get(step.verb, ()))
+            ]
+            unmatched = [i for i in candidates if i not in matched]
+            match = (unmatched or candidates or [None])[0]
+            if match is None:
+                verbs.append(None)
+            else:
+                verbs.append(steps[match].step)
+                matched.add(match)
+        
+        return df, timings.with_columns(verb=pl.Series(verbs, dtype=pl.String))
+    
+    def __len__(self):
+        return len(self.events)
+    
+    def __iter__(self):
+        return iter(self.events)
+    
+    def __repr__(self):
+        return f"Trace({len(self.events)} events)\n{self.to_frame()}"
+
+# The trace currently recording, if any
+_active = []
+
+def current_trace():
+    """Return the active Trace, or None when tracing is off."""
+    return _active[-1] if _active else None
+
+@contextmanager
+def trace():
+    """
+    Record per-verb timings and shapes for everything piped with >> inside the block.
+    
+    Usage:
+        with trace() as t:
+            df >> filter(_.year == 2008) >> mutate(x = _.body_mass_g / 1000)
+        t.to_frame()
+        t.to_chrome_trace("trace.json")
+    """
+    recorder = Trace()
+    _active.append(recorder)
+    try:
+        yield recorder
+    finally:
+        _active.remove(recorder)
@@ -4,4 +4,6 @@ DATA_DIR = os.path.dirname(__file__)
 
 def get_data_path(filename):
     """Get the full path to a data file."""
-    return os.path.join(DATA_DIR, filename)
\ No newline at end of file
+    return os.path.join(DATA_DIR, filename)
+
+from penguins.data.generate import generate_penguins, load_penguins
@@ -0,0 +1,255 @@
+# Define the synthetic penguins data generator
+"""
+Scalable synthetic penguins data.
+
+generate_penguins() writes a penguins-shaped dataset of any size to disk in chunks,
+drawing species, island, sex and year from their joint frequencies in penguins.csv and
+the body measurements from normal distributions fitted per species and sex. Every value
+is derived from a hash of its row id and the seed, so each chunk is generated
+independently in a single lazy query and streamed straight to Parquet or IPC without
+ever holding the full dataset in memory.
+
+Generated datasets are cached on disk, keyed by their parameters, so asking for the
+same data again only scans the existing files.
+
+Usage:
+    path = generate_penguins(10_000_000, extra_cols=20)
+    lf = load_penguins(rows=10_000_000, extra_cols=20, lazy=True)
+"""
+import hashlib
+import json
+import math
+import os
+import shutil
+import tempfile
+import polars as pl
+
+DATA_DIR = os.path.dirname(__file__)
+
+# Bump when the generated values change, so stale caches are not reused
+_GENERATOR_VERSION = 1
+
+_MEASURES = {
+    "bill_length_mm": 1,
+    "bill_depth_mm": 1,
+    "flipper_length_mm": 0,
+    "body_mass_g": 0
+}
+_CATEGORIES = ["species", "island", "sex", "year"]
+_FORMATS = {"parquet": "parquet", "ipc": "arrow"}
+
+# Define function for reading the bundled dataset
+def _read_bundled(lazy=False):
+    path = os.path.join(DATA_DIR, "penguins.csv")
+    lf = pl.scan_csv(path, null_values="NA")
+    return lf if lazy else lf.collect()
+
+# Define function for fitting the generator to the bundled dataset
+def _fit(null_rate):
+    """
+    Summarize penguins.csv into the tables the generator samples from.
+    
+    Returns a (categories, null_rates) tuple: categories has one row per observed
+    species/island/sex/year combination with its cumulative probability and the mean
+    and standard deviation of every measure for its species and sex; null_rates maps
+    each column to the share of nulls to inject.
+    """
+    df = _read_bundled()
+    
+    # Observed sexes only when the null rate is set explicitly, so it is the only source of nulls
+    observed = df if null_rate is None else df.filter(pl.col("sex").is_not_null())
+    
+    # Measure distributions per species and sex, falling back to the species when sex is unknown
+    stats = [
+        agg
+        for name in _MEASURES
+        for agg in (pl.col(name).mean().alias(f"{name}_mean"), pl.col(name).std().alias(f"{name}_std"))
+    ]
+    by_sex = df.group_by("species", "sex").agg(stats)
+    by_species = df.group_by("species").agg(stats)
+    
+    categories = (
+        observed.group_by(_CATEGORIES).agg(weight=pl.len())
+        .sort(_CATEGORIES, nulls_last=True)
+        .join(by_sex, on=["species", "sex"], how="left")
+        .join(by_species, on="species", how="left", suffix="_species")
+        .with_columns(
+            pl.coalesce(pl.col(name), pl.col(f"{name}_species")).alias(name)
+            for name in by_species.columns if name != "species"
+        )
+        .select(
+            *_CATEGORIES,
+            *[name for name in by_species.columns if name != "species"],
+            cumulative=pl.col("weight").cum_sum() / pl.col("weight").sum()
+        )
+    )
+    
+    if null_rate is None:
+        null_rates = {name: df[name].null_count() / df.height for name in _MEASURES}
+    else:
+        null_rates = {name: null_rate for name in [*_MEASURES, "sex"]}
+    return categories, null_rates
+
+# Define function for building uniform random numbers from row ids
+def _uniform(seed, stream):
+    """
+    A uniform number in (0, 1) per row, from a hash of the row id.
+    
+    Each stream gives an independent sequence for the same rows, and since values only
+    depend on the row id, any chunk can be generated on its own.
+    """
+    stream_seed = int.from_bytes(hashlib.blake2b(f"{seed}:{stream}".encode(), digest_size=8).digest(), "little")
+    bits = pl.col("rowid").hash(seed=stream_seed) % (2 ** 53)
+    return (bits.cast(pl.Float64) + 0.5) / (2 ** 53)
+
+# Define function for building standard normal numbers from row ids
+def _normal(seed, stream):
+    """A standard normal number per row, from two uniform streams (Box-Muller)."""
+    radius = (-2 * _uniform(seed, 2 * stream).log()).sqrt()
+    return radius * (2 * math.pi * _uniform(seed, 2 * stream + 1)).cos()
+
+# Define function for building one chunk of the dataset
+def _chunk(start, end, categories, null_rates, extra_cols, seed):
+    """
+    Build the lazy query generating rows start + 1 to end.
+    
+    Returns a LazyFrame with the penguins columns followed by extra_1 ... extra_n
+    """
+    pick = pl.lit(categories["cumulative"]).search_sorted(_uniform(seed, 0)).clip(upper_bound=categories.height - 1)
+    
+    def column(name):
+        return pl.lit(categories[name]).gather(pl.col("category"))
+    
+    measures = []
+    for i, (name, decimals) in enumerate(_MEASURES.items()):
+        value = column(f"{name}_mean") + column(f"{name}_std") * _normal(seed, 10 + i)
+        value = value.round(decimals)
+        if decimals == 0:
+            value = value.cast(pl.Int64)
+        measures.append(value.alias(name))
+    
+    extras = [
+        (_uniform(seed, 100 + i) * 100).round(2).alias(f"extra_{i + 1}")
+        for i in range(extra_cols)
+    ]
+    
+    # Inject nulls column by column, each from its own stream
+    def with_nulls(expr, name, stream):
+        rate = null_rates.get(name, 0)
+        if not rate:
+            return expr
+        return pl.when(_uniform(seed, stream) >= rate).then(expr).alias(name)
+    
+    return (
+        pl.LazyFrame()
+        .select(rowid=pl.int_range(start + 1, end + 1, dtype=pl.Int64))
+        .with_columns(category=pick)
+        .select(
+            "rowid",
+            column("species").alias("species"),
+            column("island").alias("island"),
+            *[with_nulls(expr, name, 50 + i) for i, (expr, name) in enumerate(zip(measures, _MEASURES))],
+            with_nulls(column("sex"), "sex", 60).alias("sex"),
+            column("year").alias("year"),
+            *[with_nulls(expr, f"extra_{i + 1}", 1000 + i) for i, expr in enumerate(extras)]
+        )
+    )
+
+# Define function for locating the cache
+def _cache_root(cache_dir):
+    if cache_dir is not None:
+        return cache_dir
+    return os.environ.get("PENGUINS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "penguins"))
+
+def generate_penguins(rows, extra_cols=0, null_rate=None, seed=0, file_format="parquet",
+                      chunk_rows=1_000_000, cache_dir=None, overwrite=False):
+    """
+    Write a synthetic penguins dataset of any size to disk, in chunks.
+    
+    Species, island, sex and year follow their joint frequencies in penguins.csv, and
+    the measurements follow normal distributions fitted per species and sex. Chunks
+    are generated and written one at a time, so memory use depends on chunk_rows, not
+    rows. Datasets are cached by their parameters: calling again with the same ones
+    returns the existing directory without generating anything.
+    
+    rows: Number of rows to generate
+    extra_cols: Number of extra float columns (extra_1, extra_2, ...) for wide tables
+    null_rate: Share of nulls in every measure, sex and extra column (default None
+               keeps the null rates of penguins.csv)
+    seed: Seed for the random values
+    file_format: "parquet" or "ipc"
+    chunk_rows: Rows per file
+    cache_dir: Where datasets are cached (default $PENGUINS_CACHE_DIR, or ~/.cache/penguins)
+    overwrite: Regenerate even if the dataset is already cached
+    
+    Returns the path of the directory holding the chunk files
+    
+    Usage: generate_penguins(100_000_000, extra_cols=50, null_rate=0.05)
+    """
+    if file_format not in _FORMATS:
+        raise ValueError(f"file_format must be one of {list(_FORMATS)}, got {file_format!r}")
+    if rows < 0 or chunk_rows < 1:
+        raise ValueError("rows must be non-negative and chunk_rows positive")
+    if null_rate is not None and not 0 <= null_rate <= 1:
+        raise ValueError(f"null_rate must be between 0 and 1, got {null_rate}")
+    
+    # Key the cache on everything that changes the generated files
+    params = {
+        "rows": rows, "extra_cols": extra_cols, "null_rate": null_rate, "seed": seed,
+        "file_format": file_format, "chunk_rows": chunk_rows,
+        "generator": _GENERATOR_VERSION, "polars": pl.__version__
+    }
+    key = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+    root = _cache_root(cache_dir)
+    path = os.path.join(root, f"penguins-{key}")
+    
+    if os.path.isdir(path):
+        if not overwrite:
+            return path
+        shutil.rmtree(path)
+    
+    # Write into a scratch directory and move it into place, so an interrupted run
+    # never leaves a partial dataset in the cache
+    os.makedirs(root, exist_ok=True)
+    scratch = tempfile.mkdtemp(prefix=".penguins-", dir=root)
+    try:
+        categories, null_rates = _fit(null_rate)
+        extension = _FORMATS[file_format]
+        for part, start in enumerate(range(0, max(rows, 1), chunk_rows)):
+            end = min(start + chunk_rows, rows)
+            lf = _chunk(start, end, categories, null_rates, extra_cols, seed)
+            getattr(lf, f"sink_{file_format}")(os.path.join(scratch, f"part-{part:05d}.{extension}"))
+        with open(os.path.join(scratch, "params.json"), "w") as f:
+            json.dump(params, f, indent=2)
+        os.replace(scratch, path)
+    except BaseException:
+        shutil.rmtree(scratch, ignore_errors=True)
+        raise
+    
+    return path
+
+def load_penguins(rows=None, lazy=False, **kwargs):
+    """
+    Load the penguins dataset, or a synthetic version of any size.
+    
+    rows: If None, load the bundled penguins.csv (with "NA" read as null); otherwise
+          load a synthetic dataset of this many rows from generate_penguins(), which
+          is generated on first use and cached
+    lazy: If True, scan the files into a LazyFrame instead of reading them
+    **kwargs: Passed on to generate_penguins(), e.g. extra_cols, null_rate or seed
+    
+    Usage: df = load_penguins()
+           lf = load_penguins(rows=50_000_000, lazy=True)
+    """
+    if rows is None:
+        if kwargs:
+            raise TypeError(f"Unexpected arguments for the bundled dataset: {', '.join(kwargs)}")
+        return _read_bundled(lazy=lazy)
+    
+    path = generate_penguins(rows, **kwargs)
+    file_format = kwargs.get("file_format", "parquet")
+    pattern = os.path.join(path, f"*.{_FORMATS[file_format]}")
+    lf = pl.scan_parquet(pattern) if file_format == "parquet" else pl.scan_ipc(pattern)
+    return lf if lazy else lf.collect()
+
+__all__ = ['generate_penguins', 'load_penguins']
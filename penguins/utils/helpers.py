@@ -1,43 +1,133 @@
-from penguins.core.symbolic import DeSelect
+from penguins.core.symbolic import SymbolicAttr, DeSelect
 import polars as pl
+import polars.selectors as cs
 import re
 
-# Selector classes
-class StartsWithSelector:
+# Selector base class
+class Selector:
+    """
+    Base class for column selectors that compile to Polars selectors.
+    
+    Compiling lets column resolution happen inside the Polars plan, so no schema is
+    needed up front, and lets selectors combine with |, & and - like Polars selectors.
+    """
+    def to_polars(self):
+        """Return the equivalent polars.selectors selector, or None if there isn't one."""
+        return None
+    
+    def __invert__(self):
+        """Support ~ operator for deselection."""
+        return DeSelect(self)
+    
+    def __or__(self, other):
+        """Union of two selectors."""
+        return _combine(self, other, "__or__")
+    
+    def __and__(self, other):
+        """Intersection of two selectors."""
+        return _combine(self, other, "__and__")
+    
+    def __sub__(self, other):
+        """Difference of two selectors."""
+        return _combine(self, other, "__sub__")
+
+class StartsWithSelector(Selector):
     """Selects columns starting with a prefix."""
     def __init__(self, prefix):
         self.prefix = prefix
         # Check if the suffix contains regex special characters
         self.is_regex = bool(re.search(r'[|()[\]{}^$*+?\\.]', prefix))
     
-    def __invert__(self):
-        return DeSelect(self)
+    def to_polars(self):
+        if self.is_regex:
+            return cs.matches(f"^({self.prefix})")
+        return cs.starts_with(self.prefix)
+    
+    def __repr__(self):
+        return f"starts_with({self.prefix!r})"
 
-class EndsWithSelector:
+class EndsWithSelector(Selector):
     """Selects columns ending with a suffix or matching a regex pattern."""
     def __init__(self, suffix):
         self.suffix = suffix
         # Check if the suffix contains regex special characters
         self.is_regex = bool(re.search(r'[|()[\]{}^$*+?\\.]', suffix))
     
-    def __invert__(self):
-        """Support ~ operator for deselection."""
-        return DeSelect(self)
+    def to_polars(self):
+        if self.is_regex:
+            return cs.matches(f"({self.suffix})$")
+        return cs.ends_with(self.suffix)
+    
+    def __repr__(self):
+        return f"ends_with({self.suffix!r})"
 
-class ContainsSelector:
+class ContainsSelector(Selector):
     """Selects columns containing a substring."""
     def __init__(self, substring):
         self.substring = substring
         # Check if the suffix contains regex special characters
         self.is_regex = bool(re.search(r'[|()[\]{}^$*+?\\.]', substring))
     
-    def __invert__(self):
-        return DeSelect(self)
+    def to_polars(self):
+        if self.is_regex:
+            return cs.matches(self.substring)
+        return cs.contains(self.substring)
+    
+    def __repr__(self):
+        return f"contains({self.substring!r})"
 
-class WhereSelector:
+class WhereSelector(Selector):
     """Selects columns based on a predicate function applied to their data type."""
     def __init__(self, predicate):
         self.predicate = predicate
+    
+    def to_polars(self):
+        # Only the built-in type predicates have a Polars equivalent,
+        # custom predicates still need the schema
+        make_selector = _DTYPE_SELECTORS.get(self.predicate)
+        return make_selector() if make_selector is not None else None
+    
+    def __repr__(self):
+        return f"where({getattr(self.predicate, '__name__', repr(self.predicate))})"
+
+# Define function for translating a column specification into a Polars selector
+def to_selector(spec):
+    """
+    Translate a column specification into a polars.selectors selector.
+    
+    spec: A column name, SymbolicAttr, penguins selector, DeSelect, Polars selector,
+          or a list of those
+    
+    Returns the selector, or None if the specification needs the schema to be resolved
+    (e.g. column ranges or where() with a custom predicate)
+    """
+    if isinstance(spec, Selector):
+        return spec.to_polars()
+    if isinstance(spec, SymbolicAttr):
+        return cs.by_name(spec.name)
+    if isinstance(spec, str):
+        return cs.by_name(spec)
+    if isinstance(spec, DeSelect):
+        inner = to_selector(spec.col)
+        return None if inner is None else cs.all() - inner
+    if isinstance(spec, (list, tuple)):
+        selectors = [to_selector(item) for item in spec]
+        if not selectors or any(sel is None for sel in selectors):
+            return None
+        combined = selectors[0]
+        for sel in selectors[1:]:
+            combined = combined | sel
+        return combined
+    if cs.is_selector(spec):
+        return spec
+    return None
+
+# Define function for combining selectors with set operations
+def _combine(left, right, op):
+    left_sel, right_sel = to_selector(left), to_selector(right)
+    if left_sel is None or right_sel is None:
+        raise TypeError("Only selectors with a Polars equivalent can be combined with |, & or -")
+    return getattr(left_sel, op)(right_sel)
 
 # Pattern selector functions
 def starts_with(prefix):
@@ -59,26 +149,19 @@ def where(predicate):
 # Type predicate functions
 def is_numeric(dtype):
     """Check if a Polars data type is numeric."""
-    return dtype in [
-        pl.Int8, pl.Int16, pl.Int32, pl.Int64,
-        pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64,
-        pl.Float32, pl.Float64
-    ]
+    return dtype.is_numeric()
 
 def is_integer(dtype):
     """Check if a Polars data type is integer."""
-    return dtype in [
-        pl.Int8, pl.Int16, pl.Int32, pl.Int64,
-        pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64
-    ]
+    return dtype.is_integer()
 
 def is_float(dtype):
     """Check if a Polars data type is float."""
-    return dtype in [pl.Float32, pl.Float64]
+    return dtype.is_float()
 
 def is_string(dtype):
     """Check if a Polars data type is string."""
-    return dtype == pl.String or dtype == pl.Utf8
+    return dtype == pl.String
 
 def is_boolean(dtype):
     """Check if a Polars data type is boolean."""
@@ -86,12 +169,24 @@ def is_boolean(dtype):
 
 def is_temporal(dtype):
     """Check if a Polars data type is date/time related."""
-    return dtype in [pl.Date, pl.Datetime, pl.Time, pl.Duration]
+    return dtype.is_temporal()
 
 def is_null(dtype):
     """Check if a Polars data type is null."""
-    return dtype in [pl.Null]
+    return dtype == pl.Null
 
 def is_cat(dtype):
     """Check if a Polars data type is categorical."""
-    return dtype in [pl.Categorical]
\ No newline at end of file
+    return dtype == pl.Categorical
+
+# Polars selectors equivalent to the type predicates
+_DTYPE_SELECTORS = {
+    is_numeric: cs.numeric,
+    is_integer: cs.integer,
+    is_float: cs.float,
+    is_string: cs.string,
+    is_boolean: cs.boolean,
+    is_temporal: cs.temporal,
+    is_null: lambda: cs.by_dtype(pl.Null),
+    is_cat: cs.categorical
+}
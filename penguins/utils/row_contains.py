@@ -1,25 +1,91 @@
 import polars as pl
-from penguins.core.symbolic import SymbolicAttr
+import polars.selectors as cs
+from datetime import date, datetime
+from decimal import Decimal
+from penguins.utils.helpers import to_selector
 
-def row_contains(*values):
+# Define function for turning a cols= argument into a Polars selector
+def _to_selector(cols):
+    """
+    Convert a column restriction into a Polars selector.
+    
+    cols: None (every column), a column name, a symbolic column (_.col), a penguins
+          or Polars selector, or a list of those
+    """
+    if cols is None:
+        return cs.all()
+    selector = to_selector(cols)
+    if selector is None:
+        raise ValueError("row_contains() cols= must be column names or selectors with a Polars equivalent")
+    return selector
+
+def row_contains(*values, cols=None, ignore_case=False, contains=False):
     """
     Check if any rows in a DataFrame contain any of the specified values.
     
-    Handles mixed column types by only checking compatible columns.
+    Values are compared in their native type, and only against columns of a compatible
+    dtype (strings against string, categorical and enum columns, numbers against integer,
+    float and decimal columns, and so on), so no other column is ever cast to string.
+    None matches null values.
     
     *values: Values to search for across all columns
+    cols: Restrict the search to these columns: a name, a symbolic column (_.col),
+          a penguins or Polars selector, or a list of those (default: all columns)
+    ignore_case: Match string values case-insensitively (default False)
+    contains: Match string values as substrings anywhere in string columns rather than
+              as whole values (default False)
     
     Returns a Polars expression that evaluates to True when any column matches.
     
     Usage: df >> filter(row_contains("None", "NA"))
+           df >> filter(row_contains("bis", "dre", cols=_.island, ignore_case=True, contains=True))
     """
-    import polars as pl
+    selected = _to_selector(cols)
+    
+    # Group the values by the kind of column they can match
+    strings = [v for v in values if isinstance(v, str)]
+    booleans = [v for v in values if isinstance(v, bool)]
+    numbers = [v for v in values if isinstance(v, (int, float, Decimal)) and not isinstance(v, bool)]
+    datetimes = [v for v in values if isinstance(v, datetime)]
+    dates = [v for v in values if isinstance(v, date) and not isinstance(v, datetime)]
+    
+    checks = []
+    
+    if strings:
+        # Categorical and Enum columns are matched on their labels, as strings
+        text = (selected & (cs.string() | cs.categorical() | cs.enum())).cast(pl.String)
+        # Both sides are lower-cased to ignore case, so non-ASCII letters fold too
+        if ignore_case:
+            text = text.str.to_lowercase()
+            strings = [v.lower() for v in strings]
+        if contains:
+            checks.append(text.str.contains_any(strings))
+        else:
+            checks.append(text.is_in(strings))
+    
+    if booleans:
+        checks.append((selected & cs.boolean()).is_in(booleans))
+    
+    if numbers:
+        whole = [int(v) for v in numbers if float(v).is_integer()]
+        if whole:
+            checks.append((selected & cs.integer()).is_in(whole))
+        # Decimal columns are compared as floats, since Polars can't check Python
+        # numbers against a Decimal column directly
+        floats = [float(v) for v in numbers]
+        checks.append((selected & cs.float()).is_in(floats))
+        checks.append((selected & cs.decimal()).cast(pl.Float64).is_in(floats))
+    
+    if datetimes:
+        checks.append((selected & cs.datetime()).is_in(datetimes))
+    
+    if dates:
+        checks.append((selected & cs.date()).is_in(dates))
+    
+    if any(v is None for v in values):
+        checks.append(selected.is_null())
     
-    # Convert values to a list for checking
-    values_list = list(values)
+    if not checks:
+        return pl.lit(False)
     
-    # Get expressions for each column, handling type compatibility
-    # Cast all columns to string to avoid type mismatches
-    return pl.any_horizontal(
-        pl.all().cast(pl.String).is_in([str(v) for v in values_list])
-    )
\ No newline at end of file
+    return pl.any_horizontal(checks)
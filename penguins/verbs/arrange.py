@@ -1,6 +1,42 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.options import options
+from penguins.core.sortedness import sort_keys, tag_sorted, unsorted_rows
+import polars as pl
+
+# Define function for turning arrange()-style arguments into sort columns
+def _sort_columns(args, descending):
+    """
+    Split sort arguments into columns and per-column descending flags.
+    
+    Returns a (cols, desc_flags) tuple ready for Polars' sort()
+    """
+    cols = []
+    desc_flags = []
+    
+    for arg in args:
+        # Check if it's a SymbolicAttr
+        if isinstance(arg, SymbolicAttr):
+            # Check if negated
+            if hasattr(arg, '_is_negated') and arg._is_negated:
+                cols.append(arg._original)
+                desc_flags.append(True)
+            else:
+                cols.append(arg._expr)
+                desc_flags.append(False)
+        else:
+            # Regular string column name or Polars expression
+            cols.append(arg)
+            desc_flags.append(False)
+    
+    # Apply global descending flag
+    if descending:
+        desc_flags = [not flag for flag in desc_flags]
+    
+    return cols, desc_flags
 
 # Define the arrange() verb
+@verb(fusable=True)
 def arrange(*args, descending=False):
     """
     Sort rows by column expressions.
@@ -10,31 +46,56 @@ def arrange(*args, descending=False):
            Use -_.column_name for descending
     descending: If True, reverses all sort orders (default: False)
     
+    The sort order is remembered on the result and carried through verbs that keep
+    rows in place (filter(), mutate(), head(), ...), so later verbs can use it:
+    distinct() and group_by() on the sort columns find runs of equal rows instead of
+    hashing, and join_asof() skips sorting. Polars itself flags the first sort column.
+    
     Returns a function that performs the sort on a DataFrame.
     """
+    cols, desc_flags = _sort_columns(args, descending)
+    order = sort_keys(cols, desc_flags)
+    
     def _arrange(df):
-        cols = []
-        desc_flags = []
-        
-        for arg in args:
-            # Check if it's a SymbolicAttr
-            if isinstance(arg, SymbolicAttr):
-                # Check if negated
-                if hasattr(arg, '_is_negated') and arg._is_negated:
-                    cols.append(arg._original)
-                    desc_flags.append(True)
-                else:
-                    cols.append(arg._expr)
-                    desc_flags.append(False)
-            else:
-                # Regular string column name or Polars expression
-                cols.append(arg)
-                desc_flags.append(False)
-        
-        # Apply global descending flag
-        if descending:
-            desc_flags = [not flag for flag in desc_flags]
+        return tag_sorted(df.sort(cols, descending=desc_flags), order)
+    
+    return _arrange
+
+# Define the assume_sorted() verb
+@verb(fusable=True)
+def assume_sorted(*args, descending=False):
+    """
+    Declare that rows are already sorted by one or more columns, without sorting.
+    
+    *args: Column names (strings) or symbolic columns, in sort order
+           Use -_.column_name for a descending column
+    descending: If True, reverses all sort orders (default: False)
+    
+    Data that arrives sorted (e.g. time series read from a file) otherwise looks
+    unsorted to Polars. This sets Polars' sorted flag on the first column, so joins and
+    group-bys on it take Polars' sorted fast paths, and records the whole order like
+    arrange() does. Nothing is checked unless penguins.options.validate_sorted is True;
+    a wrong claim gives wrong results.
+    
+    Returns a function that marks a DataFrame or LazyFrame as sorted.
+    
+    Usage: df >> assume_sorted(_.ts) >> join_asof(quotes, on=_.ts)
+    """
+    cols, desc_flags = _sort_columns(args, descending)
+    order = sort_keys(cols, desc_flags)
+    if not order or len(order) != len(cols):
+        raise ValueError("assume_sorted() takes column names, not computed expressions")
+    
+    def _assume_sorted(df):
+        if options.validate_sorted:
+            check = df.select(unsorted_rows(order).any())
+            if isinstance(check, pl.LazyFrame):
+                check = check.collect()
+            if check.item():
+                names = ", ".join(("-" if desc else "") + name for name, desc in order)
+                raise ValueError(f"assume_sorted(): rows are not sorted by {names}")
         
-        return df.sort(cols, descending=desc_flags)
+        name, desc = order[0]
+        return tag_sorted(df.with_columns(pl.col(name).set_sorted(descending=desc)), order)
     
-    return _arrange
\ No newline at end of file
+    return _assume_sorted
@@ -1,7 +1,10 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.schema import collect_schema
 import polars as pl
 import warnings
 
+@verb
 def bind_cols(*dfs, suffix="_2"):
     """
     Join DataFrames horizontally (column-wise).
@@ -38,15 +41,14 @@ def bind_cols(*dfs, suffix="_2"):
                         f"but maximum is {max_rows}. Filling with nulls."
                     )
         
+        # Track the stacked column names as we go, so each frame's schema is only
+        # looked up once rather than re-resolving the growing plan on every loop
+        result_cols = collect_schema(result).names()
+        
         for other_df in dfs:
             # Check for duplicate column names
-            if is_lazy:
-                result_cols = result.collect_schema().names()
-                other_cols = other_df.collect_schema().names()
-            else:
-                result_cols = result.columns
-                other_cols = other_df.columns
-                
+            other_cols = collect_schema(other_df).names()
+            
             duplicate_cols = set(result_cols) & set(other_cols)
             
             if duplicate_cols:
@@ -66,6 +68,9 @@ def bind_cols(*dfs, suffix="_2"):
                     rename_map[col] = new_name
                 
                 other_df = other_df.rename(rename_map)
+                other_cols = [rename_map.get(col, col) for col in other_cols]
+            
+            result_cols = result_cols + other_cols
             
             # Stack horizontally
             if is_lazy:
@@ -1,6 +1,8 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
 import polars as pl
 
+@verb
 def bind_rows(*dfs):
     """
     Stack DataFrames vertically (row-wise).
@@ -0,0 +1,22 @@
+from penguins.core.pipeline import verb
+from penguins.core.sortedness import carry_sorted
+import polars as pl
+
+# Define the collect() verb
+@verb(terminal=True)
+def collect(**kwargs):
+    """
+    Execute a LazyFrame's query plan and return a DataFrame.
+    
+    **kwargs: Passed on to LazyFrame.collect() (e.g. engine="streaming")
+    
+    Returns a function that collects a LazyFrame; DataFrames are returned unchanged.
+    
+    Usage: lf >> filter(_.year == 2008) >> collect()
+    """
+    def _collect(df):
+        if isinstance(df, pl.LazyFrame):
+            return carry_sorted(df, df.collect(**kwargs))
+        return df
+    
+    return _collect
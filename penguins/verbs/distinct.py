@@ -1,6 +1,10 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.sortedness import carry_sorted, changes, is_sorted_by
+import polars as pl
 
 # Define the distinct() verb
+@verb(fusable=True)
 def distinct(*args):
     """
     Keep only unique rows based on specified columns.
@@ -8,6 +12,11 @@ def distinct(*args):
     *args: Column names (strings) or symbolic columns
            If no columns specified, uses all columns
     
+    When a DataFrame is known to be sorted by exactly these columns (see arrange() and
+    assume_sorted()), duplicates sit next to each other and are dropped in one pass
+    over neighbouring rows instead of by hashing, keeping the first row of each.
+    LazyFrames are left to Polars, whose optimizer drops a sort that unique() undoes.
+    
     Returns a function that removes duplicate rows.
     """
     def _distinct(df):
@@ -22,6 +31,8 @@ def distinct(*args):
                     cols.append(arg.name)
                 else:
                     cols.append(arg)
+            if isinstance(df, pl.DataFrame) and is_sorted_by(df, cols):
+                return carry_sorted(df, df.filter(changes(cols)))
             return df.unique(subset=cols)
     
     return _distinct
\ No newline at end of file
@@ -1,6 +1,9 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.sortedness import carry_sorted
 
 # Define the drop_na() verb
+@verb(fusable=True)
 def drop_null(subset=None):
     """
     Remove rows with null values.
@@ -20,5 +23,5 @@ def drop_null(subset=None):
             cols = subset.name
         else:
             cols = subset
-        return df.drop_nulls(subset=cols)
+        return carry_sorted(df, df.drop_nulls(subset=cols))
     return _drop_null
\ No newline at end of file
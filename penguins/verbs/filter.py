@@ -1,6 +1,10 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.groups import partition, keep_groups, over_groups
+from penguins.core.sortedness import carry_sorted
 
 # Define the filter() verb
+@verb(fusable=True, grouped=True)
 def filter(*conditions):
     """
     Filter rows based on boolean conditions.
@@ -8,6 +12,11 @@ def filter(*conditions):
     *conditions: One or more boolean expressions using _
                  Multiple conditions are combined with AND logic
     
+    After group_by(), conditions are evaluated within each group as one .over() window
+    predicate, so group-relative filters (e.g. _.x > _.x.mean(), or pl.len() > 10 to
+    keep groups with more than 10 rows) run in a single pass without building group
+    summaries. The result stays grouped.
+    
     Returns a function that performs the filtering on a DataFrame.
     """
     def _filter(df):
@@ -25,7 +34,8 @@ def filter(*conditions):
         for expr in exprs[1:]:
             combined = combined & expr
         
-        # Call Polars' filter method
-        return df.filter(combined)
+        # Call Polars' filter method, evaluating the predicate per group if grouped
+        frame, by = partition(df, "filter", [combined])
+        return keep_groups(df, carry_sorted(df, frame.filter(over_groups(combined, by))))
     
     return _filter
\ No newline at end of file
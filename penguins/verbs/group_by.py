@@ -1,13 +1,19 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.groups import GroupedFrame
 
 # Define the group_by() verb
+@verb
 def group_by(*args):
     """
     Group DataFrame by one or more columns.
     
     *args: Column names (strings) or symbolic columns
     
-    Returns a function that performs the grouping on a DataFrame.
+    Returns a function that groups a DataFrame or LazyFrame into a GroupedFrame.
+    The grouping persists across verbs: mutate(), filter() and the slice_*() verbs
+    work within each group, summarize() and reframe() aggregate each group, and
+    ungroup() drops it. Grouping a GroupedFrame again replaces its keys.
     """
     def _group_by(df):
         cols = []
@@ -18,6 +24,24 @@ def group_by(*args):
             else:
                 cols.append(arg)
         
-        return df.group_by(cols)
+        return GroupedFrame(df, cols)
     
-    return _group_by
\ No newline at end of file
+    return _group_by
+
+# Define the ungroup() verb
+@verb(grouped=True)
+def ungroup():
+    """
+    Drop the grouping of a GroupedFrame.
+    
+    Returns a function that returns the underlying DataFrame or LazyFrame (ungrouped
+    frames are returned unchanged).
+    
+    Usage: df >> group_by(_.species) >> mutate(n=pl.len()) >> ungroup()
+    """
+    def _ungroup(df):
+        if isinstance(df, GroupedFrame):
+            return df.ungroup()
+        return df
+    
+    return _ungroup
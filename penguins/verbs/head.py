@@ -1,6 +1,9 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.sortedness import carry_sorted
 
 # Define the head() verb
+@verb(fusable=True, terminal=True)
 def head(n=5):
     """
     Return first n rows.
@@ -10,6 +13,6 @@ def head(n=5):
     Returns a function that selects the first n rows.
     """
     def _head(df):
-        return df.head(n)
+        return carry_sorted(df, df.head(n))
     
     return _head
\ No newline at end of file
@@ -1,6 +1,41 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.sortedness import is_sorted_on
+from penguins.core.schema import collect_schema
+import polars as pl
+
+# Define function for turning column arguments into names or expressions
+def _column(col):
+    if isinstance(col, SymbolicAttr):
+        return col.name
+    if isinstance(col, (list, tuple)):
+        return [_column(c) for c in col]
+    return col
+
+# Define function for matching the right-hand table to the piped one
+def _right_table(df, other):
+    if isinstance(df, pl.LazyFrame) and isinstance(other, pl.DataFrame):
+        return other.lazy()
+    return other
+
+# Define function for sorting an as-of join input by its key
+def _sorted_by(frame, key):
+    """
+    Sort one side of an as-of join by its key, unless it is already sorted.
+    
+    Frames known to be sorted by the key (see arrange() and assume_sorted()) are left
+    as they are. Other eager frames are only sorted when the key isn't (a single pass,
+    skipped entirely when Polars has flagged the column as sorted); LazyFrames get the
+    sort in their plan.
+    """
+    if is_sorted_on(frame, key):
+        return frame
+    if isinstance(frame, pl.DataFrame) and frame.select(key).to_series().is_sorted():
+        return frame
+    return frame.sort(key)
 
 # Define the join() verb
+@verb
 def join(other, on=None, left_on=None, right_on=None, how="inner"):
     """
     Join two DataFrames together.
@@ -18,5 +53,186 @@ def join(other, on=None, left_on=None, right_on=None, how="inner"):
         df >> join(other_df, left_on="id", right_on="user_id", how="inner")
     """
     def _join(df):
-        return df.join(other, on=on, left_on=left_on, right_on=right_on, how=how)
-    return _join
\ No newline at end of file
+        # Convert the right-hand table to a LazyFrame if the piped one is lazy
+        right = _right_table(df, other)
+        return df.join(right, on=on, left_on=left_on, right_on=right_on, how=how)
+    return _join
+
+# Define the join_asof() verb
+@verb
+def join_asof(other, on=None, left_on=None, right_on=None, by=None, by_left=None, by_right=None,
+              strategy="backward", tolerance=None, allow_exact_matches=True, suffix="_right"):
+    """
+    Join each row to the nearest row of another table, rather than an exact match.
+    
+    For time series, the default strategy="backward" matches each row with the last
+    row of other at or before it (e.g. the latest quote before each trade), in a single
+    merge over both tables sorted by the key. Both sides are sorted by the key first if
+    they aren't already, so the result is in key order.
+    
+    Parameters:
+    - other: DataFrame or LazyFrame to join with
+    - on: Key column (symbolic or name) used when names match, e.g. a timestamp
+    - left_on: Key column of the piped table
+    - right_on: Key column of other
+    - by: Column(s) that must match exactly, so matches are searched within groups
+    - by_left, by_right: As by, for differently named columns
+    - strategy: "backward" (last row at or before), "forward" (first row at or after)
+                or "nearest"
+    - tolerance: Largest distance to a match, as a number or a duration such as "5m"
+                 or a timedelta; rows without a match that close get nulls
+    - allow_exact_matches: If False, only strictly earlier (or later) rows match
+    - suffix: Suffix for clashing column names from other
+    
+    Usage:
+        trades >> join_asof(quotes, on=_.time, by=_.ticker, tolerance="1m")
+    """
+    left_key = _column(on if on is not None else left_on)
+    right_key = _column(on if on is not None else right_on)
+    if left_key is None or right_key is None:
+        raise ValueError("join_asof() needs on= or both left_on= and right_on=")
+    
+    def _join_asof(df):
+        right = _right_table(df, other)
+        
+        return _sorted_by(df, left_key).join_asof(
+            _sorted_by(right, right_key),
+            on=_column(on), left_on=_column(left_on), right_on=_column(right_on),
+            by=_column(by), by_left=_column(by_left), by_right=_column(by_right),
+            strategy=strategy, tolerance=tolerance, allow_exact_matches=allow_exact_matches,
+            suffix=suffix, check_sortedness=False
+        )
+    return _join_asof
+
+# Define the join_where() verb
+@verb
+def join_where(other, *predicates, how="inner", suffix="_right", engine="auto"):
+    """
+    Join two tables on inequality (or any other) conditions between their columns.
+    
+    Range and interval joins (e.g. events falling between a start and an end) run as
+    Polars inequality joins, which only produce the matching pairs rather than a cross
+    join filtered afterwards, so memory grows with the matches, not the product of
+    the table sizes.
+    
+    Parameters:
+    - other: DataFrame or LazyFrame to join with
+    - *predicates: Boolean expressions using _ (all must hold). Columns of other whose
+                   names clash with the piped table are referred to with the suffix,
+                   e.g. _.time_right
+    - how: "inner", "left" (keep unmatched rows of the piped table) or "right"
+    - suffix: Suffix for clashing column names from other
+    - engine: Polars engine used to collect the join for eager DataFrames (default
+              "auto"), e.g. "streaming"
+    
+    Usage:
+        events >> join_where(shifts, _.time >= _.start, _.time < _.end)
+    """
+    if not predicates:
+        raise ValueError("join_where() needs at least one predicate")
+    
+    def _join_where(df):
+        exprs = [pred._expr if isinstance(pred, SymbolicAttr) else pred for pred in predicates]
+        if isinstance(df, pl.LazyFrame):
+            return df.join_where(_right_table(df, other), *exprs, how=how, suffix=suffix)
+        
+        # DataFrame.join_where() always runs on the in-memory engine; planned lazily,
+        # the join can use the streaming engine's inequality join, which is much faster
+        return (
+            df.lazy()
+            .join_where(other.lazy(), *exprs, how=how, suffix=suffix)
+            .collect(engine=engine)
+        )
+    return _join_where
+
+# Define function for reading a join_many() spec
+def _lookup_spec(spec):
+    """
+    Split a join_many() spec into its table, key pairs and columns to bring in.
+    
+    Returns a (table, left_keys, right_keys, columns) tuple, with columns a dict of
+    output names to dimension columns, or None for every non-key column
+    """
+    if not isinstance(spec, (list, tuple)) or len(spec) not in (2, 3):
+        raise ValueError("join_many() specs are (table, keys) or (table, keys, columns) tuples")
+    table, keys = spec[0], spec[1]
+    columns = spec[2] if len(spec) == 3 else None
+    
+    # Keys match by name, or map piped columns to differently named dimension columns
+    if isinstance(keys, dict):
+        left_keys = [_column(key) for key in keys]
+        right_keys = [_column(key) for key in keys.values()]
+    else:
+        left_keys = right_keys = _column(keys if isinstance(keys, (list, tuple)) else [keys])
+    
+    # Columns are kept under their own names, or renamed with a dict of new names
+    if columns is not None:
+        if isinstance(columns, dict):
+            columns = {new: _column(col) for new, col in columns.items()}
+        else:
+            columns = {name: name for name in _column(columns if isinstance(columns, (list, tuple)) else [columns])}
+    return table, left_keys, right_keys, columns
+
+# Define the join_many() verb
+@verb
+def join_many(specs, how="left", validate="m:1", engine="in-memory"):
+    """
+    Enrich a table with columns looked up from several other tables at once.
+    
+    Typical of a star schema, where a fact table gets descriptive columns from many
+    dimension tables. Instead of a chain of join() calls, each dimension is pruned to
+    its keys and the requested columns, and all the joins are planned as one lazy
+    query, so no intermediate copy of the piped table is materialized.
+    
+    Parameters:
+    - specs: List of (table, keys) or (table, keys, columns) tuples, one per table
+        - table: DataFrame or LazyFrame to look columns up in
+        - keys: Key column(s) with the same names in both tables, or a dict mapping
+                the piped table's key columns to the table's, e.g. {"store_id": "id"}
+        - columns: Column(s) to bring in (default: all non-key columns), or a dict of
+                   new names to columns, e.g. {"store_name": "name"}
+    - how: "left" (keep rows without a match, with nulls) or "inner"
+    - validate: Check the keys are unique in each table (default "m:1"), so every row
+                of the piped table matches at most one row and no rows are duplicated;
+                a table with duplicate keys raises a polars ComputeError when the plan
+                is collected. Takes the values of Polars' join(validate=...); "m:m"
+                allows a row to match several
+    - engine: Polars engine used to collect the plan for eager DataFrames (default
+              "in-memory", which gathers many looked-up columns much faster than
+              the streaming engine); LazyFrames get the joins added to their plan
+    
+    Looked-up columns must not clash with the piped table's columns or each other;
+    rename them with a columns dict instead of relying on suffixes.
+    
+    Usage:
+        sales >> join_many([
+            (stores, _.store_id, [_.region, _.city]),
+            (products, {"sku": "product_sku"}, {"product": "name"}),
+            (calendar, _.date)
+        ])
+    """
+    if how not in ("left", "inner"):
+        raise ValueError(f"join_many() joins with how='left' or how='inner', not {how!r}")
+    lookups = [_lookup_spec(spec) for spec in specs]
+    
+    def _join_many(df):
+        seen = set(collect_schema(df).names())
+        lf = df.lazy()
+        for table, left_keys, right_keys, columns in lookups:
+            if columns is None:
+                columns = {name: name for name in collect_schema(table).names() if name not in right_keys}
+            
+            # Every new column needs a unique name, so no suffixes are ever added
+            clashes = [name for name in columns if name in seen]
+            if clashes:
+                raise ValueError(f"join_many(): columns {clashes} are already in the table; rename them with a columns dict")
+            seen.update(columns)
+            
+            # Each table is pruned to its keys and columns, and joined within the one plan
+            right = table.lazy().select(*right_keys, *[pl.col(col).alias(new) for new, col in columns.items()])
+            lf = lf.join(right, left_on=left_keys, right_on=right_keys, how=how, validate=validate)
+        
+        if isinstance(df, pl.LazyFrame):
+            return lf
+        return lf.collect(engine=engine)
+    return _join_many
@@ -1,10 +1,13 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb, schema_free, _format_arg
+from penguins.core.groups import partition, keep_groups, with_partition, over_groups
+from penguins.core.sortedness import carry_sorted
 import polars as pl
-import re
 
 from penguins.utils.helpers import (
     WhereSelector,
     where,
+    to_selector,
     is_numeric,
     is_integer,
     is_float,
@@ -26,6 +29,11 @@ class Across:
         self.cols = cols
         self.func = func
         self.names = names  # Optional naming pattern like "{col}_new"
+    
+    def __repr__(self):
+        func = getattr(self.func, "__name__", repr(self.func))
+        names = f", names={self.names!r}" if self.names else ""
+        return f"across({_format_arg(self.cols)}, {func}{names})"
 
 # Define across() helper function
 def across(cols, func, names=None):
@@ -43,72 +51,105 @@ def across(cols, func, names=None):
     return Across(cols, func, names)
 
 # Define resolve_across_columns() helper function
-def _resolve_across_columns(cols, all_columns, df=None):
+def _resolve_across_columns(cols, all_columns, schema=None):
     """
     Resolve column specifications for across() to actual column names.
     
     cols: Column specification (list, selector function, or single column)
     all_columns: List of all column names in the DataFrame
-    df: The DataFrame (needed for where() selectors to check dtypes)
+    schema: The DataFrame's schema (needed for where() selectors to check dtypes)
     
     Returns a list of column names to operate on.
     """
-    from penguins.verbs.select import StartsWithSelector, EndsWithSelector, ContainsSelector
-    
-    # Handle where() selector
-    if isinstance(cols, WhereSelector):
-        if df is None:
-            raise ValueError("DataFrame required for where() selector")
-        if isinstance(df, pl.LazyFrame):
-            schema = df.collect_schema()
-            return [col for col in all_columns if cols.predicate(schema[col])]
-        else:
-            return [col for col in all_columns if cols.predicate(df[col].dtype)]
-    
-    # Handle selector functions
-    if isinstance(cols, StartsWithSelector):
-        if isinstance(cols, StartsWithSelector):
-            if cols.is_regex:
-                pattern = re.compile(f"({cols.prefix})$")
-                return [col for col in all_columns if pattern.search(col)]
-            else:
-                return [col for col in all_columns if col.startswith(cols.prefix)]
-    
-    if isinstance(cols, EndsWithSelector):
-        if isinstance(cols, EndsWithSelector):
-            if cols.is_regex:
-                pattern = re.compile(f"({cols.suffix})$")
-                return [col for col in all_columns if pattern.search(col)]
-            else:
-                return [col for col in all_columns if col.endswith(cols.suffix)]
-    
-    if isinstance(cols, ContainsSelector):
-        if isinstance(cols, ContainsSelector):
-            if cols.is_regex:
-                pattern = re.compile(f"({cols.substring})$")
-                return [col for col in all_columns if pattern.search(col)]
-            else:
-                return [col for col in all_columns if cols.substring in col]
+    from penguins.verbs.select import _resolve_column_spec
     
     # Handle list of columns
     if isinstance(cols, list):
         result = []
         for col in cols:
-            if isinstance(col, SymbolicAttr):
-                result.append(col.name)
-            elif isinstance(col, str):
-                result.append(col)
+            result.extend(_resolve_column_spec(col, all_columns, schema))
         return result
     
-    # Handle single column
-    if isinstance(cols, SymbolicAttr):
-        return [cols.name]
+    return _resolve_column_spec(cols, all_columns, schema)
+
+# Placeholder column used to see which column an across() function's result is named after
+_ACROSS_PROBE = "__penguins_across"
+
+# Define function for building an across() expression inside the Polars plan
+def _across_expr(across_obj):
+    """
+    Build a single expression applying an across() function to a Polars selector.
+    
+    Output columns are named after the column each result is computed from, as in the
+    per-column path. That name comes from the leftmost column the expression reads, so
+    functions that ignore their column or lead with another one (e.g. lambda c: pl.lit(0))
+    are left to the per-column path.
+    
+    Returns the expression, or None if the columns need the schema to be resolved.
+    """
+    selector = to_selector(across_obj.cols)
+    if selector is None:
+        return None
+    
+    # Check which column the function's result is named after
+    probe = across_obj.func(pl.col(_ACROSS_PROBE))
+    if not isinstance(probe, pl.Expr) or probe.meta.root_names()[:1] != [_ACROSS_PROBE]:
+        return None
+    
+    expr = across_obj.func(selector.as_expr())
+    if across_obj.names:
+        return expr.name.map(lambda col: across_obj.names.format(col=col))
+    return expr.name.keep()
+
+# Define function for building the mutate closure
+def _build_mutate(across_exprs, assignments, new_order=None):
+    """
+    Build the closure that adds the mutated columns to a DataFrame or LazyFrame.
+    
+    across_exprs: Multi-column expressions from across()
+    assignments: Dict of output names to expressions, lists or Series
+    new_order: Optional final column order for _before/_after placement
     
-    if isinstance(cols, str):
-        return [cols]
+    After group_by(), every expression is evaluated within its group as an .over()
+    window on the underlying frame, all in a single with_columns().
+    """
+    def _mutate(df):
+        exprs = [*across_exprs, *assignments.values()]
+        frame, by = partition(df, "mutate", [getattr(expr, "_expr", expr) for expr in exprs])
+        
+        # Convert any Series or lists to expressions
+        # LazyFrames have no known length, so Polars checks those at collect time
+        is_lazy = isinstance(frame, pl.LazyFrame)
+        processed_kwargs = {}
+        for key, value in assignments.items():
+            if isinstance(value, SymbolicAttr):
+                processed_kwargs[key] = over_groups(value._expr, by)
+            elif isinstance(value, list):
+                series = pl.Series(key, value)
+                if not is_lazy and len(series) != len(frame):
+                    raise ValueError(f"List length ({len(series)}) must match DataFrame length ({len(frame)})")
+                processed_kwargs[key] = series.alias(key)
+            elif isinstance(value, pl.Series):
+                if not is_lazy and len(value) != len(frame):
+                    raise ValueError(f"Series length ({len(value)}) must match DataFrame length ({len(frame)})")
+                processed_kwargs[key] = value.alias(key)
+            else:
+                processed_kwargs[key] = over_groups(value, by)
+        
+        # Add the new columns
+        result = frame.with_columns(*[over_groups(expr, by) for expr in across_exprs], **processed_kwargs)
+        
+        # Reorder columns if positioning was specified
+        if new_order is not None:
+            result = result.select(with_partition(new_order, by))
+        
+        # Rows stay in place, so the sort order holds up to the first overwritten column
+        changed = None if across_exprs else assignments
+        return keep_groups(df, carry_sorted(df, result, changed))
     
-    return []
+    return _mutate
 
+@verb(fusable=True, compiled=True, grouped=True)
 def mutate(*args, _before=None, _after=None, **kwargs):
     """
     Create new columns or modify existing ones.
@@ -121,19 +162,34 @@ def mutate(*args, _before=None, _after=None, **kwargs):
     _before: Column name (string) to place new columns before
     _after: Column name (string) to place new columns after
     
-    Returns a function that performs the mutation on a DataFrame.
+    After group_by(), expressions are computed within each group (e.g. _.x - _.x.mean()
+    centres x per group) and the result stays grouped.
+    
+    Returns a function that applies the mutation to a DataFrame or LazyFrame.
+    across() columns are resolved inside the Polars plan when they translate to Polars
+    selectors; column ranges, custom where() predicates and _before/_after placement
+    are resolved against the schema instead.
     """
-    def _mutate(df):
+    across_args = [arg for arg in args if isinstance(arg, Across)]
+    across_args += [value for value in kwargs.values() if isinstance(value, Across)]
+    assignments = {key: value for key, value in kwargs.items() if not isinstance(value, Across)}
+    
+    # Resolve everything inside the plan when no schema is needed
+    if _before is None and _after is None:
+        across_exprs = [_across_expr(arg) for arg in across_args]
+        if all(expr is not None for expr in across_exprs):
+            return schema_free(_build_mutate(across_exprs, assignments))
+    
+    def _compile(schema):
+        all_columns = schema.names()
+        
         # First, expand any across() calls
         expanded_kwargs = {}
         
         # Handle positional Across objects
         for arg in args:
             if isinstance(arg, Across):
-                if isinstance(df, pl.LazyFrame):
-                    target_cols = _resolve_across_columns(arg.cols, df.collect_schema().names(), df)
-                else:
-                    target_cols = _resolve_across_columns(arg.cols, df.columns, df)
+                target_cols = _resolve_across_columns(arg.cols, all_columns, schema)
                 
                 for col_name in target_cols:
                     col_expr = pl.col(col_name)
@@ -149,7 +205,7 @@ def mutate(*args, _before=None, _after=None, **kwargs):
         # Handle keyword arguments (including Across objects)
         for key, value in kwargs.items():
             if isinstance(value, Across):
-                target_cols = _resolve_across_columns(value.cols, df.columns)
+                target_cols = _resolve_across_columns(value.cols, all_columns, schema)
                 
                 for col_name in target_cols:
                     col_expr = pl.col(col_name)
@@ -164,37 +220,11 @@ def mutate(*args, _before=None, _after=None, **kwargs):
             else:
                 expanded_kwargs[key] = value
         
-        # Convert any Series or lists to expressions
-        processed_kwargs = {}
-        for key, value in expanded_kwargs.items():
-            if isinstance(value, list):
-                series = pl.Series(key, value)
-                if len(series) != len(df):
-                    raise ValueError(f"List length ({len(series)}) must match DataFrame length ({len(df)})")
-                processed_kwargs[key] = series.alias(key)
-            elif isinstance(value, pl.Series):
-                if len(value) != len(df):
-                    raise ValueError(f"Series length ({len(value)}) must match DataFrame length ({len(df)})")
-                processed_kwargs[key] = value.alias(key)
-            else:
-                processed_kwargs[key] = value
-        
-        # Add the new columns
-        result = df.with_columns(**processed_kwargs)
-        
-        # If positioning is specified, reorder columns
+        # If positioning is specified, work out the new column order up front
+        new_order = None
         if _before is not None or _after is not None:
-            new_col_names = list(processed_kwargs.keys())
-            
-            if isinstance(df, pl.LazyFrame):
-                existing_columns = df.collect_schema().names()
-            else:
-                existing_columns = df.columns
-            
-            if isinstance(result, pl.LazyFrame):
-                other_cols = [c for c in result.collect_schema().names() if c not in new_col_names]
-            else:
-                other_cols = [c for c in result.columns if c not in new_col_names]
+            new_col_names = list(expanded_kwargs.keys())
+            other_cols = [c for c in all_columns if c not in new_col_names]
             
             if _before is not None:
                 anchor_idx = other_cols.index(_before)
@@ -202,9 +232,7 @@ def mutate(*args, _before=None, _after=None, **kwargs):
             else:
                 anchor_idx = other_cols.index(_after)
                 new_order = other_cols[:anchor_idx + 1] + new_col_names + other_cols[anchor_idx + 1:]
-            
-            result = result.select(new_order)
         
-        return result
+        return _build_mutate([], expanded_kwargs, new_order)
     
-    return _mutate
\ No newline at end of file
+    return _compile
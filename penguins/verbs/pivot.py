@@ -1,6 +1,8 @@
 from penguins.core.symbolic import SymbolicAttr, DeSelect, ColumnRange
+from penguins.core.pipeline import verb
 
 # Define the pivot_wider() verb
+@verb(eager_only=True)
 def pivot_wider(names_from, values_from=None, id_cols=None, 
                 values_fill=None, values_fn="first", names_sep="_",
                 names_prefix="", sort_columns=False):
@@ -65,6 +67,7 @@ def pivot_wider(names_from, values_from=None, id_cols=None,
     return _pivot_wider
 
 # Define the pivot_longer() verb
+@verb
 def pivot_longer(cols=None, names_to="name", values_to="value", 
                  cols_vary="fastest"):
     """
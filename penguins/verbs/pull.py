@@ -1,7 +1,9 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
 import polars as pl
 
 # Define the pull() verb
+@verb(terminal=True)
 def pull(column, to_series=False):
     """
     Extract a single column as a Series or scalar value.
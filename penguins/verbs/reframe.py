@@ -1,7 +1,11 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.groups import GroupedFrame, aggregate
+from penguins.core.schema import collect_schema
 from penguins.verbs.mutate import _resolve_across_columns, Across
 import polars as pl
 
+@verb(grouped=True)
 def reframe(*args, **kwargs):
     """
     Group-wise computation that creates new rows based on group summaries.
@@ -10,16 +14,19 @@ def reframe(*args, **kwargs):
     *args: Across objects (used without keyword assignment)
     **kwargs: Column names as keys, Polars expressions as values
     
-    Returns a function that performs the reframe operation on a DataFrame.
+    Returns a function that performs the reframe operation on a GroupedFrame (or a
+    Polars GroupBy); the result is no longer grouped.
     """
     def _reframe(df):
+        schema = collect_schema(df)
+        
         # First, expand any across() calls
         expanded_kwargs = {}
         
         # Handle positional Across objects
         for arg in args:
             if isinstance(arg, Across):
-                target_cols = _resolve_across_columns(arg.cols, df.columns, df)
+                target_cols = _resolve_across_columns(arg.cols, schema.names(), schema)
                 
                 for col_name in target_cols:
                     col_expr = pl.col(col_name)
@@ -35,7 +42,7 @@ def reframe(*args, **kwargs):
         # Handle keyword arguments
         for key, value in kwargs.items():
             if isinstance(value, Across):
-                target_cols = _resolve_across_columns(value.cols, df.columns, df)
+                target_cols = _resolve_across_columns(value.cols, schema.names(), schema)
                 
                 for col_name in target_cols:
                     col_expr = pl.col(col_name)
@@ -51,6 +58,8 @@ def reframe(*args, **kwargs):
                 expanded_kwargs[key] = value
         
         # Perform the aggregation
+        if isinstance(df, GroupedFrame):
+            return aggregate(df, [getattr(expr, "_expr", expr).alias(name) for name, expr in expanded_kwargs.items()])
         result = df.agg(**expanded_kwargs)
         
         return result
@@ -1,6 +1,10 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb, schema_free
+from penguins.core.sortedness import carry_sorted
+import polars.selectors as cs
 
 # Define the relocate() verb
+@verb(fusable=True, compiled=True)
 def relocate(*args, before=None, after=None):
     """
     Reorder columns in a DataFrame.
@@ -14,18 +18,25 @@ def relocate(*args, before=None, after=None):
     before: Column expression to place args before
     after: Column expression to place args after
     
-    Returns a function that reorders columns in a DataFrame
+    Returns a function that works out the new column order (from a schema, when
+    before or after is given) and returns the reordering for a DataFrame
     """
-    def _relocate(df):
-        # Extract column names from symbolic expressions
-        cols_to_move = [arg._expr.meta.output_name() for arg in args]
-        all_cols = df.columns
+    # Extract column names from symbolic expressions
+    cols_to_move = [arg._expr.meta.output_name() for arg in args]
+    
+    # Moving to the front needs no schema: the rest follow in their current order
+    if before is None and after is None:
+        @schema_free
+        def _relocate(df):
+            return carry_sorted(df, df.select(cols_to_move + [cs.all() - cs.by_name(cols_to_move)]))
+        
+        return _relocate
+    
+    def _compile(schema):
+        all_cols = schema.names()
         remaining_cols = [c for c in all_cols if c not in cols_to_move]
         
-        if before is None and after is None:
-            # Move to front
-            new_order = cols_to_move + remaining_cols
-        elif before is not None:
+        if before is not None:
             # Insert before specified column
             anchor = before._expr.meta.output_name()
             anchor_idx = remaining_cols.index(anchor)
@@ -36,6 +47,9 @@ def relocate(*args, before=None, after=None):
             anchor_idx = remaining_cols.index(anchor)
             new_order = remaining_cols[:anchor_idx + 1] + cols_to_move + remaining_cols[anchor_idx + 1:]
         
-        return df.select(new_order)
+        def _relocate(df):
+            return carry_sorted(df, df.select(new_order))
+        
+        return _relocate
     
-    return _relocate
\ No newline at end of file
+    return _compile
\ No newline at end of file
@@ -1,6 +1,8 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
 
 # Define the rename() verb
+@verb(fusable=True)
 def rename(**kwargs):
     """
     Rename columns.
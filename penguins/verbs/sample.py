@@ -1,6 +1,8 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
 
 # Define the sample() verb
+@verb(eager_only=True)
 def sample(n=None, frac=None, with_replacement=False, shuffle=False, seed=None):
     """
     Sample rows from a DataFrame.
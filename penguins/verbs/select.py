@@ -1,48 +1,30 @@
 from penguins.core.symbolic import SymbolicAttr, DeSelect, ColumnRange
+from penguins.core.pipeline import verb, schema_free
 import polars as pl 
-import re
+import polars.selectors as cs
 
 from penguins.utils.helpers import (
     StartsWithSelector, 
     EndsWithSelector, 
     ContainsSelector,
+    WhereSelector,
     starts_with,
     ends_with,
-    contains
+    contains,
+    to_selector
 )
 
 # Define function for handling conflicts
-def _resolve_column_spec(spec, all_columns, df=None): 
+def _resolve_column_spec(spec, all_columns, schema=None): 
     """
     Resolve a column specification to a list of column names.
     
     spec: A column specification (string, SymbolicAttr, ColumnRange, or selector)
     all_columns: List of all column names in the DataFrame
-    df: The DataFrame (needed for where() selectors to check dtypes)
+    schema: The DataFrame's schema (needed for where() selectors to check dtypes)
     
     Returns a list of column names matching the specification.
     """
-    # Import WhereSelector here to avoid circular imports
-    from penguins.verbs.mutate import WhereSelector
-    
-    # Handle where() selector
-    if isinstance(spec, WhereSelector):
-        if df is None:
-            raise ValueError("DataFrame required for where() selector")
-        if isinstance(df, pl.LazyFrame):
-            schema = df.collect_schema()
-            return [col for col in all_columns if spec.predicate(schema[col])]
-        else:
-            return [col for col in all_columns if spec.predicate(df[col].dtype)]
-    
-    # Handle SymbolicAttr
-    if isinstance(spec, SymbolicAttr):
-        return [spec.name]
-    
-    # Handle string column names
-    if isinstance(spec, str):
-        return [spec]
-    
     # Handle column ranges (_.col1 : _.col2)
     if isinstance(spec, ColumnRange):
         start_name = spec.start.name if isinstance(spec.start, SymbolicAttr) else spec.start
@@ -53,33 +35,28 @@ def _resolve_column_spec(spec, all_columns, df=None):
         
         return all_columns[start_idx:end_idx + 1]
     
-    # Handle starts_with()
-    if isinstance(spec, StartsWithSelector):
-        if spec.is_regex:
-            pattern = re.compile(f"^({spec.prefix})")
-            return [col for col in all_columns if pattern.search(col)]
-        else:
-            return [col for col in all_columns if col.startswith(spec.prefix)]
+    # Handle SymbolicAttr and string column names
+    if isinstance(spec, SymbolicAttr):
+        return [spec.name]
+    
+    if isinstance(spec, str):
+        return [spec]
     
-    # Handle ends_with()
-    if isinstance(spec, EndsWithSelector):
-        if spec.is_regex:
-            pattern = re.compile(f"({spec.suffix})$")
-            return [col for col in all_columns if pattern.search(col)]
-        else:
-            return [col for col in all_columns if col.endswith(spec.suffix)]
+    # Handle where() selectors with a custom predicate
+    if isinstance(spec, WhereSelector) and spec.to_polars() is None:
+        if schema is None:
+            raise ValueError("Schema required for where() selector")
+        return [col for col in all_columns if spec.predicate(schema[col])]
     
-    # Handle contains()
-    if isinstance(spec, ContainsSelector):
-        if spec.is_regex:
-            pattern = re.compile(f"({spec.substring})")
-            return [col for col in all_columns if pattern.search(col)]
-        else:
-            return [col for col in all_columns if spec.substring in col]
+    # Expand anything with a Polars selector equivalent against the schema
+    selector = to_selector(spec)
+    if selector is not None:
+        return list(cs.expand_selector(schema, selector))
     
     return []
 
 # Modified select() verb
+@verb(fusable=True, compiled=True)
 def select(*cols):
     """
     Select specific columns from a DataFrame or LazyFrame.
@@ -89,27 +66,42 @@ def select(*cols):
     - Range selection: _.col1 : _.col2
     - Deselection: ~_.col_name
     - Pattern matching: starts_with(), ends_with(), contains()
+    - Polars selectors, and penguins selectors combined with |, & and -
     
     *cols: Variable number of column specifications
     
-    Returns a function that performs the selection on a DataFrame or LazyFrame.
+    Returns a function that selects the columns from a DataFrame or LazyFrame.
+    When every specification translates to a Polars selector the selection is
+    resolved inside the Polars plan; otherwise it is resolved against the schema.
     """
-    def _select(df):
-        # Handle schema access efficiently for LazyFrames
-        if isinstance(df, pl.LazyFrame):
-            all_columns = df.collect_schema().names()
-        else:
-            all_columns = df.columns
-            
+    included = [col for col in cols if not isinstance(col, DeSelect)]
+    excluded = [col.col for col in cols if isinstance(col, DeSelect)]
+    
+    # Translate everything into Polars selectors if possible
+    included_selectors = [to_selector(col) for col in included]
+    excluded_selector = to_selector(excluded) if excluded else None
+    
+    if all(sel is not None for sel in included_selectors) and (excluded_selector is not None or not excluded):
+        selections = included_selectors or [cs.all()]
+        if excluded_selector is not None:
+            selections = [sel - excluded_selector for sel in selections]
+        
+        @schema_free
+        def _select(df):
+            return df.select(selections)
+        
+        return _select
+    
+    def _compile(schema):
+        all_columns = schema.names()
+        
         selected_cols = []
         excluded_cols = []
         
-        for col in cols:
-            # Handle deselection with ~
-            if isinstance(col, DeSelect):
-                excluded_cols.extend(_resolve_column_spec(col.col, all_columns, df))
-            else:
-                selected_cols.extend(_resolve_column_spec(col, all_columns, df))
+        for col in included:
+            selected_cols.extend(_resolve_column_spec(col, all_columns, schema))
+        for col in excluded:
+            excluded_cols.extend(_resolve_column_spec(col, all_columns, schema))
         
         # If we have selections, use those; otherwise use all columns
         if not selected_cols:
@@ -118,6 +110,9 @@ def select(*cols):
         # Remove excluded columns
         final_cols = [c for c in selected_cols if c not in excluded_cols]
         
-        return df.select(final_cols)
+        def _select(df):
+            return df.select(final_cols)
+        
+        return _select
     
-    return _select
\ No newline at end of file
+    return _compile
@@ -1,8 +1,10 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
 import polars as pl
 import warnings
 
-def separate(col, into, sep, regex=False, drop=True, fill="right"):
+@verb(compiled=True)
+def separate(col, into, sep, regex=False, drop=True, fill="right", validate=None):
     """
     Split one column into multiple columns.
     
@@ -12,109 +14,80 @@ def separate(col, into, sep, regex=False, drop=True, fill="right"):
     regex: Whether sep is a regex pattern (default False)
     drop: Whether to drop source column (default True)
     fill: How to handle too few splits - "right", "left", or "error" (default "right")
+    validate: Whether to check split counts, warning about extra parts and raising
+              for fill="error". The check is a single min/max aggregation, which on a
+              LazyFrame means running the query an extra time, so by default (None)
+              only DataFrames are checked, and LazyFrames only with fill="error";
+              True always checks, False never does
     
     Returns a function that takes a DataFrame and returns the modified DataFrame
     
     Usage: df >> separate(_.col, into=["a", "b"], sep="_")
     """
-    def _separate(df):
-    # Extract column name
+    def _compile(schema):
+        # Extract column name
         col_name = col.name if isinstance(col, SymbolicAttr) else col
-    
-        # Check if we're working with a LazyFrame
-        is_lazy = isinstance(df, pl.LazyFrame)
-    
-        # Get column index - use collect_schema() for LazyFrames
-        if is_lazy:
-            col_idx = df.collect_schema().names().index(col_name)
-        else:
-            col_idx = df.columns.index(col_name)
-    
-        # Split the column
-        if regex:
-            split_expr = pl.col(col_name).str.split(sep)
-        else:
-            # Escape special regex chars for literal split
-            import re
-            escaped_sep = re.escape(sep)
-            split_expr = pl.col(col_name).str.split(escaped_sep)
-    
-        # Create list column
-        result = df.with_columns(split_expr.alias("__temp_split__"))
-    
-        # Check split counts and warn if mismatched
-        # For LazyFrames, collect only the length column to check
-        if is_lazy:
-            split_lengths = result.select(
-                pl.col("__temp_split__").list.len().alias("len")
-            ).collect()["len"]
-        else:
-            split_lengths = result.select(
-                pl.col("__temp_split__").list.len().alias("len")
-            )["len"]
-    
-        max_len = split_lengths.max()
-        min_len = split_lengths.min()
+        
+        original_cols = schema.names()
+        col_idx = original_cols.index(col_name)
         expected_len = len(into)
-    
-        if max_len > expected_len:
-            warnings.warn(
-                f"Some splits produced {max_len} parts but only {expected_len} columns requested. "
-                f"Extra parts will be ignored."
-            )
-    
-        if min_len < expected_len and fill == "error":
-            raise ValueError(
-                f"Some splits produced fewer than {expected_len} parts. "
-                f"Use fill='right' or fill='left' to handle this."
-            )
-    
+        
+        # Build the split, on the regex pattern itself for regex separators
+        source = pl.col(col_name)
+        parts = source.str.split(sep, literal=not regex)
+        
         # Extract each position into new columns
-        new_cols = []
-        for i, col_name_new in enumerate(into):
-            if fill == "left":
-                # Fill from the right, so adjust index
-                idx_expr = pl.col("__temp_split__").list.len() - expected_len + i
-                new_cols.append(
-                    pl.when(idx_expr >= 0)
-                    .then(pl.col("__temp_split__").list.get(idx_expr))
-                    .otherwise(None)
-                    .alias(col_name_new)
-                )
-            else:  # "right" or "error"
-                new_cols.append(
-                    pl.col("__temp_split__").list.get(i).alias(col_name_new)
-                )
-    
-        result = result.with_columns(new_cols)
-    
-        # Drop temporary column
-        result = result.drop("__temp_split__")
-    
-        # Reorder columns to insert new ones after original
-        # Use collect_schema().names() for LazyFrames
-        if is_lazy:
-            original_cols = df.collect_schema().names()
-        else:
-            original_cols = df.columns
+        if fill == "left" or regex:
+            # fill="left" aligns parts to the right, so negative indices count back from the end
+            offset = expected_len if fill == "left" else 0
+            new_cols = [
+                parts.list.get(i - offset, null_on_oob=True).alias(col_name_new)
+                for i, col_name_new in enumerate(into)
+            ]
+        else:  # "right" or "error" on a literal separator
+            # split_exact yields a struct with exactly len(into) fields, padding with nulls
+            new_cols = [
+                source.str.split_exact(sep, expected_len - 1)
+                .struct.rename_fields(into)
+                .struct.unnest()
+            ]
         
+        # Insert new columns at the source column's position in a single select
         if drop:
-            # Remove source column and insert new ones at its position
-            reordered = (
-                original_cols[:col_idx] + 
-                into + 
-                original_cols[col_idx + 1:]
-            )
+            reordered = original_cols[:col_idx] + new_cols + original_cols[col_idx + 1:]
         else:
-            # Insert new columns after source column
-            reordered = (
-                original_cols[:col_idx + 1] + 
-                into + 
-                original_cols[col_idx + 1:]
-            )
-    
-        result = result.select(reordered)
-    
-        return result
+            reordered = original_cols[:col_idx + 1] + new_cols + original_cols[col_idx + 1:]
+        
+        def _separate(df):
+            if validate is None:
+                check = isinstance(df, pl.DataFrame) or fill == "error"
+            else:
+                check = validate
+            
+            if check:
+                # Check split counts with a single aggregation
+                counts = df.select(
+                    parts.list.len().min().alias("min_len"),
+                    parts.list.len().max().alias("max_len")
+                )
+                if isinstance(counts, pl.LazyFrame):
+                    counts = counts.collect()
+                min_len, max_len = counts.row(0)
+                
+                if max_len is not None and max_len > expected_len:
+                    warnings.warn(
+                        f"Some splits produced {max_len} parts but only {expected_len} columns requested. "
+                        f"Extra parts will be ignored."
+                    )
+                
+                if min_len is not None and min_len < expected_len and fill == "error":
+                    raise ValueError(
+                        f"Some splits produced fewer than {expected_len} parts. "
+                        f"Use fill='right' or fill='left' to handle this."
+                    )
+            
+            return df.select(reordered)
+        
+        return _separate
     
-    return _separate
\ No newline at end of file
+    return _compile
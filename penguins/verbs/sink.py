@@ -0,0 +1,77 @@
+from penguins.core.pipeline import verb
+import polars as pl
+
+# Define function for streaming or writing a table to disk
+def _sink(df, path, file_format, kwargs):
+    """
+    Write a DataFrame or stream a LazyFrame to disk.
+    
+    df: The DataFrame or LazyFrame to write
+    path: Destination file path
+    file_format: One of "parquet", "csv" or "ipc"
+    kwargs: Options passed on to Polars' sink_*() or write_*() method
+    
+    LazyFrames are streamed straight to the file, so the result is never
+    materialized in memory; DataFrames are written directly.
+    """
+    if isinstance(df, pl.LazyFrame):
+        getattr(df, f"sink_{file_format}")(path, **kwargs)
+    elif isinstance(df, pl.DataFrame):
+        getattr(df, f"write_{file_format}")(path, **kwargs)
+    else:
+        raise TypeError(f"sink_{file_format}() requires a DataFrame or LazyFrame, got {type(df).__name__}")
+    return None
+
+# Define the sink_parquet() verb
+@verb(terminal=True)
+def sink_parquet(path, **kwargs):
+    """
+    Write the result of a chain to a Parquet file.
+    
+    path: Destination file path
+    **kwargs: Passed on to LazyFrame.sink_parquet() or DataFrame.write_parquet()
+    
+    Returns a function that streams a LazyFrame (or writes a DataFrame) to disk.
+    
+    Usage: pl.scan_csv("big.csv") >> filter(_.year == 2008) >> sink_parquet("out.parquet")
+    """
+    def _sink_parquet(df):
+        return _sink(df, path, "parquet", kwargs)
+    
+    return _sink_parquet
+
+# Define the sink_csv() verb
+@verb(terminal=True)
+def sink_csv(path, **kwargs):
+    """
+    Write the result of a chain to a CSV file.
+    
+    path: Destination file path
+    **kwargs: Passed on to LazyFrame.sink_csv() or DataFrame.write_csv()
+    
+    Returns a function that streams a LazyFrame (or writes a DataFrame) to disk.
+    
+    Usage: pl.scan_parquet("big.parquet") >> select(_.species, _.year) >> sink_csv("out.csv")
+    """
+    def _sink_csv(df):
+        return _sink(df, path, "csv", kwargs)
+    
+    return _sink_csv
+
+# Define the sink_ipc() verb
+@verb(terminal=True)
+def sink_ipc(path, **kwargs):
+    """
+    Write the result of a chain to an Arrow IPC (Feather) file.
+    
+    path: Destination file path
+    **kwargs: Passed on to LazyFrame.sink_ipc() or DataFrame.write_ipc()
+    
+    Returns a function that streams a LazyFrame (or writes a DataFrame) to disk.
+    
+    Usage: pl.scan_csv("big.csv") >> mutate(kg = _.body_mass_g / 1000) >> sink_ipc("out.arrow")
+    """
+    def _sink_ipc(df):
+        return _sink(df, path, "ipc", kwargs)
+    
+    return _sink_ipc
@@ -1,6 +1,11 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.groups import GroupedFrame, partition, keep_groups, with_partition, over_groups
+from penguins.core.sortedness import carry_sorted
+import polars as pl
 
 # Define the slice() verb
+@verb(fusable=True)
 def slice(*args):
     """
     Select rows by position.
@@ -17,11 +22,161 @@ def slice(*args):
     def _slice(df):
         if len(args) == 1:
             n = args[0]
-            return df.slice(0, n) if n >= 0 else df.slice(n, abs(n))
+            return carry_sorted(df, df.slice(0, n) if n >= 0 else df.slice(n, abs(n)))
         elif len(args) == 2:
             offset, n = args
-            return df.slice(offset, n)
+            return carry_sorted(df, df.slice(offset, n))
         else:
             raise ValueError("slice() takes 1 or 2 arguments")
     
-    return _slice
\ No newline at end of file
+    return _slice
+
+# Define function for finding the groups a slice_*() verb works within
+def _slice_groups(df, by, verb_name, exprs=()):
+    """
+    Split the input of a slice_*() verb into its frame, group keys and partition.
+    
+    Keys come from a preceding group_by() or the verb's by= argument (not both); the
+    partition is the columns windows and group-bys run over (see partition()).
+    
+    Returns a (frame, keys, partition) tuple, with keys and partition None when slicing
+    the whole frame
+    """
+    frame, partition_by = partition(df, verb_name, exprs)
+    if by is None:
+        keys = df.keys if isinstance(df, GroupedFrame) else None
+        return frame, keys, partition_by
+    if partition_by:
+        raise ValueError(f"{verb_name}() takes by= or a preceding group_by(), not both")
+    by = by if isinstance(by, (list, tuple)) else [by]
+    keys = [col.name if isinstance(col, SymbolicAttr) else col for col in by]
+    return frame, keys, keys
+
+# Define function for slicing the rows with the largest or smallest values
+def _slice_extreme(order_by, n, with_ties, by, largest, verb_name):
+    # A negated column (-_.x) reverses the order, as in arrange()
+    if getattr(order_by, "_is_negated", False):
+        order_by, largest = order_by._original, not largest
+    order = order_by._expr if isinstance(order_by, SymbolicAttr) else order_by
+    order = pl.col(order) if isinstance(order, str) else order
+    
+    def _slice_by_order(df):
+        frame, keys, partition_by = _slice_groups(df, by, verb_name, [order])
+        
+        # The n-th largest (or smallest) value per group, found by partial selection
+        # rather than a sort, is the cut-off for the rows to keep
+        if largest:
+            keep = order >= over_groups(order.top_k(n).min(), partition_by)
+        else:
+            keep = order <= over_groups(order.bottom_k(n).max(), partition_by)
+        result = frame.filter(keep)
+        
+        # Only the few rows past the cut-off are ranked to break ties
+        if not with_ties:
+            rank = order.rank("ordinal", descending=largest)
+            result = result.filter(over_groups(rank, partition_by) <= n)
+        
+        result = result.sort([*(keys or []), order], descending=[*[False] * len(keys or []), largest],
+                             nulls_last=True, maintain_order=True)
+        return keep_groups(df, result)
+    
+    return _slice_by_order
+
+# Define the slice_max() verb
+@verb(fusable=True, grouped=True)
+def slice_max(order_by, n=1, with_ties=True, by=None):
+    """
+    Keep the n rows with the largest values of a column, per group after group_by().
+    
+    Rows are found by partial selection (top_k) within each group rather than sorting
+    the whole frame, so top-n-per-group queries stay fast on large data.
+    
+    order_by: Column (symbolic, name or expression) to order by; -_.column keeps the
+              smallest values instead
+    n: Number of rows to keep per group (default: 1)
+    with_ties: If True (default), rows tied with the n-th value are kept too, so more
+               than n rows can be returned; if False, exactly n rows per group
+    by: Optional column(s) to slice within, instead of a preceding group_by()
+    
+    Returns a function that applies the slice to a DataFrame or LazyFrame, sorted by the
+    group keys and then descending order_by.
+    
+    Usage: df >> group_by(_.species) >> slice_max(_.body_mass_g, n=3)
+    """
+    return _slice_extreme(order_by, n, with_ties, by, True, "slice_max")
+
+# Define the slice_min() verb
+@verb(fusable=True, grouped=True)
+def slice_min(order_by, n=1, with_ties=True, by=None):
+    """
+    Keep the n rows with the smallest values of a column, per group after group_by().
+    
+    Rows are found by partial selection (bottom_k) within each group rather than
+    sorting the whole frame.
+    
+    order_by: Column (symbolic, name or expression) to order by; -_.column keeps the
+              largest values instead
+    n: Number of rows to keep per group (default: 1)
+    with_ties: If True (default), rows tied with the n-th value are kept too; if False,
+               exactly n rows per group
+    by: Optional column(s) to slice within, instead of a preceding group_by()
+    
+    Returns a function that applies the slice to a DataFrame or LazyFrame, sorted by the
+    group keys and then ascending order_by.
+    
+    Usage: df >> slice_min(_.bill_length_mm, n=5, by=_.island)
+    """
+    return _slice_extreme(order_by, n, with_ties, by, False, "slice_min")
+
+# Define function for building the slice_head() and slice_tail() compile functions
+def _slice_ends(n, by, from_head, verb_name):
+    def _compile(schema):
+        columns = schema.names()
+        
+        def _slice_ends_of_groups(df):
+            frame, keys, partition_by = _slice_groups(df, by, verb_name)
+            if not keys:
+                return frame.head(n) if from_head else frame.tail(n)
+            
+            # Group head/tail moves the keys first, so restore the column order
+            grouped = frame.group_by(partition_by, maintain_order=True)
+            result = grouped.head(n) if from_head else grouped.tail(n)
+            return keep_groups(df, result.select(with_partition(columns, partition_by)))
+        
+        return _slice_ends_of_groups
+    
+    return _compile
+
+# Define the slice_head() verb
+@verb(fusable=True, compiled=True, grouped=True)
+def slice_head(n=1, by=None):
+    """
+    Keep the first n rows of each group after group_by() (or of the whole frame).
+    
+    Unlike head(), this doesn't end an auto-lazy chain.
+    
+    n: Number of rows to keep per group (default: 1)
+    by: Optional column(s) to slice within, instead of a preceding group_by()
+    
+    Returns a function that applies the slice to a DataFrame or LazyFrame, with groups
+    in order of first appearance.
+    
+    Usage: df >> group_by(_.species) >> slice_head(n=2)
+    """
+    return _slice_ends(n, by, True, "slice_head")
+
+# Define the slice_tail() verb
+@verb(fusable=True, compiled=True, grouped=True)
+def slice_tail(n=1, by=None):
+    """
+    Keep the last n rows of each group after group_by() (or of the whole frame).
+    
+    n: Number of rows to keep per group (default: 1)
+    by: Optional column(s) to slice within, instead of a preceding group_by()
+    
+    Returns a function that applies the slice to a DataFrame or LazyFrame, with groups
+    in order of first appearance.
+    
+    Usage: df >> slice_tail(n=2, by=_.island)
+    """
+    return _slice_ends(n, by, False, "slice_tail")
@@ -1,7 +1,10 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.groups import GroupedFrame, aggregate
 import polars as pl
 
 # Define the summarize() verb
+@verb(grouped=True)
 def summarize(**kwargs):
     """
     Aggregate data, typically after group_by().
@@ -9,7 +12,8 @@ def summarize(**kwargs):
     **kwargs: Column names as keys, aggregation expressions as values
               Use _.column_name with aggregation methods
     
-    Returns a function that performs the aggregation on a DataFrame or GroupBy.
+    Returns a function that performs the aggregation on a DataFrame or GroupBy, with
+    one row per group of a GroupedFrame (the result is no longer grouped).
     """
     def _summarize(df_or_group):
         # Extract expressions from kwargs
@@ -26,7 +30,9 @@ def summarize(**kwargs):
                 exprs.append(pl.lit(expr).alias(new_name))
         
         # Check if grouped or ungrouped
-        if isinstance(df_or_group, (pl.dataframe.group_by.GroupBy, pl.lazyframe.group_by.LazyGroupBy)):
+        if isinstance(df_or_group, GroupedFrame):
+            return aggregate(df_or_group, exprs)
+        elif isinstance(df_or_group, (pl.dataframe.group_by.GroupBy, pl.lazyframe.group_by.LazyGroupBy)):
             # Grouped: use agg()
             return df_or_group.agg(*exprs)
         else:
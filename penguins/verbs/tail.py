@@ -1,6 +1,9 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
+from penguins.core.sortedness import carry_sorted
 
 # Define the tail() verb
+@verb(fusable=True, terminal=True)
 def tail(n=5):
     """
     Return last n rows.
@@ -10,6 +13,6 @@ def tail(n=5):
     Returns a function that selects the last n rows.
     """
     def _tail(df):
-        return df.tail(n)
+        return carry_sorted(df, df.tail(n))
     
     return _tail
\ No newline at end of file
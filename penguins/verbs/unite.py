@@ -1,6 +1,8 @@
 from penguins.core.symbolic import SymbolicAttr
+from penguins.core.pipeline import verb
 import polars as pl
 
+@verb(fusable=True)
 def unite(new_col, from_cols, sep="_", drop=True):
     """
     Combine multiple columns into one with a separator.
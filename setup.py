@@ -11,7 +11,7 @@ setup(
         'penguins.data': ['*.csv'],
     },
     python_requires='>=3.8',
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     install_requires=requirements,
     author="Connor Burruss",
     author_email="cburru2@gmail.com",
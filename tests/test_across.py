@@ -0,0 +1,50 @@
+import polars as pl
+import pytest
+from penguins import _, mutate, across, starts_with, where, is_numeric
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({"x1": [1, 2], "x2": [3, 4], "total": [10, 20]})
+
+def test_keeps_column_names(df):
+    result = df >> mutate(across(starts_with("x"), lambda c: c * 2))
+    
+    assert result.columns == ["x1", "x2", "total"]
+    assert result["x2"].to_list() == [6, 8]
+
+def test_names_pattern(df):
+    result = df >> mutate(across([_.x1, _.x2], lambda c: c + 1, names="{col}_inc"))
+    
+    assert result.columns == ["x1", "x2", "total", "x1_inc", "x2_inc"]
+    assert result["x1_inc"].to_list() == [2, 3]
+
+def test_literal_function_overwrites_each_column(df):
+    result = df >> mutate(across(starts_with("x"), lambda c: pl.lit(0)))
+    
+    assert result.columns == ["x1", "x2", "total"]
+    assert result["x1"].to_list() == [0, 0]
+    assert result["x2"].to_list() == [0, 0]
+
+def test_aliasing_function_keeps_column_names(df):
+    result = df >> mutate(across(starts_with("x"), lambda c: (c * 2).alias("dbl")))
+    
+    assert result.columns == ["x1", "x2", "total"]
+    assert result["x1"].to_list() == [2, 4]
+
+def test_function_leading_with_other_column(df):
+    result = df >> mutate(across(starts_with("x"), lambda c: pl.col("total") - c))
+    
+    assert result.columns == ["x1", "x2", "total"]
+    assert result["x1"].to_list() == [9, 18]
+    assert result["x2"].to_list() == [7, 16]
+
+def test_matches_per_column_path(df):
+    fused = df >> mutate(across(starts_with("x"), lambda c: c / pl.col("total"), names="{col}_share"))
+    compiled = df >> mutate(across(where(is_numeric), lambda c: c / pl.col("total"), names="{col}_share"))
+    
+    assert compiled.drop("total_share").equals(fused)
+
+def test_lazy_matches_eager(df):
+    spec = mutate(across(starts_with("x"), lambda c: pl.lit(0)))
+    
+    assert (df.lazy() >> spec).collect().equals(df >> spec)
@@ -0,0 +1,99 @@
+import re
+import polars as pl
+import pytest
+from penguins import affiche
+
+def _lines(capsys):
+    # Printed lines with the ANSI styling removed
+    return re.sub(r"\x1b\[[0-9;]*m", "", capsys.readouterr().out).splitlines()
+
+def _rows(lines):
+    # The data rows of a rendered table, between the header rule and the bottom border
+    start = next(i for i, line in enumerate(lines) if line.startswith("╠"))
+    end = next(i for i, line in enumerate(lines) if line.startswith("╚"))
+    return lines[start + 1:end]
+
+@pytest.fixture
+def wide():
+    return pl.DataFrame({f"c{i}": list(range(100)) for i in range(30)})
+
+def test_small_frames_are_shown_whole(capsys):
+    pl.DataFrame({"x": [1, None], "s": ["a", "b"]}).affiche()
+    lines = _lines(capsys)
+    
+    assert len(_rows(lines)) == 2
+    assert "null" in _rows(lines)[1]
+    assert "str" in lines[2]
+    assert lines[-1].startswith("╚")
+
+def test_rows_are_truncated_to_head_and_tail(capsys, wide):
+    wide.affiche(max_rows=6)
+    lines = _lines(capsys)
+    rows = _rows(lines)
+    
+    assert len(rows) == 7
+    assert rows[0].split()[1] == "0"
+    assert "…" in rows[3]
+    assert rows[-1].split()[1] == "99"
+    assert lines[-1] == "100 rows × 30 columns"
+
+def test_columns_are_truncated_to_both_ends(capsys, wide):
+    wide.affiche(max_cols=4)
+    header = _lines(capsys)[1]
+    
+    assert [cell.strip() for cell in header.strip("║").split("║")] == ["c0", "c1", "…", "c28", "c29"]
+
+def test_no_limits_show_everything(capsys, wide):
+    wide.affiche(max_rows=None, max_cols=None)
+    lines = _lines(capsys)
+    
+    assert len(_rows(lines)) == 100
+    assert lines[-1].startswith("╚")
+
+def test_empty_frames(capsys):
+    pl.DataFrame().affiche()
+    
+    assert "That table doesn't exist!" in capsys.readouterr().out
+
+def test_verb_returns_nothing(capsys, wide):
+    assert (wide >> affiche(max_rows=4)) is None
+    assert len(_rows(_lines(capsys))) == 5
+
+def test_unknown_theme_raises(wide):
+    with pytest.raises(ValueError):
+        wide.affiche(theme="plain")
+
+def test_lazy_frames_fetch_only_the_preview(capsys, wide):
+    wide.lazy().affiche(max_rows=5)
+    lines = _lines(capsys)
+    
+    assert len(_rows(lines)) == 6
+    assert lines[-1] == "more than 5 rows × 30 columns"
+
+def test_lazy_preview_pushes_limit_into_plan(tmp_path, wide):
+    from penguins.acutis.affiche import _fetch_preview
+    
+    path = tmp_path / "wide.parquet"
+    wide.write_parquet(path)
+    df, total = _fetch_preview(pl.scan_parquet(path), 5, count_rows=False)
+    
+    assert df.height == 6
+    assert total is None
+
+def test_lazy_frames_count_rows_on_request(capsys, wide):
+    wide.lazy().affiche(max_rows=5, count_rows=True)
+    
+    assert _lines(capsys)[-1] == "100 rows × 30 columns"
+
+def test_short_lazy_frames_have_no_footer(capsys):
+    pl.LazyFrame({"x": [1, 2]}).affiche()
+    lines = _lines(capsys)
+    
+    assert len(_rows(lines)) == 2
+    assert lines[-1].startswith("╚")
+
+def test_lazy_preview_shows_the_head(capsys, wide):
+    wide.lazy().affiche(max_rows=4)
+    rows = _rows(_lines(capsys))
+    
+    assert [row.split()[1] for row in rows[:4]] == ["0", "1", "2", "3"]
@@ -0,0 +1,64 @@
+import polars as pl
+import pytest
+from penguins import (
+    _, options, lazy_mode, filter, mutate, arrange, head, tail, pull, collect, sample, group_by,
+    summarize
+)
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({"x": [5, 1, 4, 2, 3], "g": ["a", "b", "a", "b", "a"]})
+
+def test_off_by_default(df):
+    assert options.auto_lazy is False
+    assert isinstance(df >> filter(_.x > 1), pl.DataFrame)
+
+def test_chain_stays_lazy_until_terminal_verb(df):
+    with lazy_mode():
+        lf = df >> filter(_.x > 1) >> mutate(y=_.x * 2)
+        result = lf >> head(2)
+    
+    assert isinstance(lf, pl.LazyFrame)
+    assert isinstance(result, pl.DataFrame)
+    assert result.equals(df.filter(pl.col("x") > 1).with_columns(y=pl.col("x") * 2).head(2))
+
+@pytest.mark.parametrize("terminal", [tail(2), collect()])
+def test_terminal_verbs_collect(df, terminal):
+    with lazy_mode():
+        result = df >> arrange(_.x) >> terminal
+    
+    assert isinstance(result, pl.DataFrame)
+
+def test_pull_returns_a_series(df):
+    with lazy_mode():
+        result = df >> arrange(_.x) >> pull(_.x)
+    
+    assert result.to_list() == [1, 2, 3, 4, 5]
+
+def test_eager_only_verbs_get_collected_input(df):
+    with lazy_mode():
+        result = df >> filter(_.x > 1) >> sample(n=2, seed=1)
+    
+    assert isinstance(result, pl.DataFrame)
+    assert result.height == 2
+
+def test_grouped_chain_matches_eager(df):
+    chain = lambda frame: frame >> group_by(_.g) >> summarize(total=_.x.sum()) >> collect()
+    
+    with lazy_mode():
+        lazy = chain(df)
+    
+    assert lazy.sort("g").equals(chain(df).sort("g"))
+
+def test_lazy_mode_restores_previous_setting(df):
+    with lazy_mode():
+        with lazy_mode(False):
+            assert isinstance(df >> filter(_.x > 1), pl.DataFrame)
+        assert options.auto_lazy is True
+    assert options.auto_lazy is False
+
+def test_explicit_lazy_frames_are_not_collected(df):
+    with lazy_mode():
+        result = df.lazy() >> filter(_.x > 1) >> head(2)
+    
+    assert isinstance(result, pl.LazyFrame)
@@ -0,0 +1,89 @@
+import importlib.util
+import json
+import os
+import tempfile
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal, assert_series_equal
+import penguins
+
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "bench_verbs.py")
+
+def _load():
+    spec = importlib.util.spec_from_file_location("bench_verbs", _PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+bench = _load()
+
+with tempfile.TemporaryDirectory() as _tmpdir:
+    _NAMES = [case.name for case in bench.make_cases(_tmpdir) if case.gate]
+
+def _result(fn, df):
+    result = fn(df)
+    if isinstance(result, penguins.GroupedFrame):
+        result = result.ungroup()
+    if isinstance(result, pl.LazyFrame):
+        result = result.collect()
+    return result
+
+def test_frames_have_the_requested_shape():
+    assert bench.make_frame(100, 10).shape == (100, 10)
+    assert bench.make_frame(100, 30).shape == (100, 30)
+
+def test_case_names_are_unique(tmp_path):
+    names = [case.name for case in bench.make_cases(str(tmp_path))]
+    
+    assert len(names) == len(set(names))
+
+@pytest.mark.parametrize("mode", ["eager", "lazy"])
+@pytest.mark.parametrize("name", _NAMES)
+def test_penguins_and_polars_agree(tmp_path, name, mode):
+    case = next(case for case in bench.make_cases(str(tmp_path)) if case.name == name)
+    if mode == "lazy" and not case.lazy:
+        pytest.skip("eager only")
+    frame = bench.make_frame(500, 12)
+    df = frame if mode == "eager" else frame.lazy()
+    
+    ours, theirs = _result(case.penguins, df), _result(case.polars, df)
+    
+    # The Polars reference may skip presentation extras (e.g. null_percent) and column placement
+    if isinstance(ours, pl.DataFrame):
+        assert_frame_equal(ours.select(theirs.columns), theirs, check_row_order=False)
+    elif isinstance(ours, pl.Series):
+        assert_series_equal(ours, theirs)
+    else:
+        assert ours == theirs
+
+def test_run_reports_every_case(tmp_path):
+    cases = [case for case in bench.make_cases(str(tmp_path)) if case.name in ("select", "filter")]
+    
+    results = bench.run([200], [10], 1, cases)
+    
+    assert results.height == 4
+    assert results["error"].is_null().all()
+    assert {"overhead_ms", "ratio"} <= set(results.columns)
+
+def test_main_checks_the_threshold(capsys):
+    assert bench.main(["--rows", "200", "--widths", "10", "--repeat", "1", "--cases", "filter", "--min-overhead-ms", "1000"]) == 0
+    assert bench.main(["--rows", "200", "--widths", "10", "--repeat", "1", "--cases", "filter",
+                       "--threshold", "0", "--min-overhead-ms", "-1"]) == 1
+
+def test_main_flags_regressions_against_a_baseline(tmp_path, capsys):
+    saved, baseline = str(tmp_path / "saved.json"), str(tmp_path / "baseline.json")
+    args = ["--rows", "200", "--widths", "10", "--repeat", "1", "--cases", "filter", "--threshold", "1000"]
+    
+    assert bench.main([*args, "--save", saved]) == 0
+    
+    with open(saved) as f:
+        results = json.load(f)
+    assert {row["mode"] for row in results} == {"eager", "lazy"}
+    
+    for row in results:
+        row["ratio"] = 1e-6
+    with open(baseline, "w") as f:
+        json.dump(results, f)
+    
+    assert bench.main([*args, "--baseline", baseline, "--min-overhead-ms", "-1000"]) == 1
+    assert "exceeded the overhead limits" in capsys.readouterr().out
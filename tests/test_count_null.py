@@ -0,0 +1,46 @@
+import polars as pl
+import pytest
+import penguins
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({
+        "g": ["a", "a", "b", "b"],
+        "x": [1, None, None, None],
+        "y": [None, 2.0, 3.0, 4.0],
+        "z": ["p", "q", "r", "s"]
+    })
+
+def test_counts_and_percentages(df):
+    result = df.count_null()
+    
+    assert result.columns == ["col", "null_count", "null_percent"]
+    assert result.rows() == [("x", 3, "75%"), ("y", 1, "25%"), ("g", 0, "0%"), ("z", 0, "0%")]
+
+def test_lazy_frames_give_the_same_table(df):
+    assert df.lazy().count_null().equals(df.count_null())
+
+def test_by_groups(df):
+    result = df.count_null(by="g")
+    
+    assert result.columns == ["g", "col", "null_count", "null_percent"]
+    assert result.filter(pl.col("g") == "a").rows() == [
+        ("a", "x", 1, "50%"), ("a", "y", 1, "50%"), ("a", "z", 0, "0%")
+    ]
+    assert result.filter(pl.col("g") == "b").rows() == [
+        ("b", "x", 2, "100%"), ("b", "y", 0, "0%"), ("b", "z", 0, "0%")
+    ]
+
+def test_by_several_columns(df):
+    result = df.with_columns(h=pl.lit(1)).count_null(by=["g", "h"])
+    
+    assert result.columns[:2] == ["g", "h"]
+    assert result.height == 6
+
+def test_small_shares_are_marked(df):
+    frame = pl.DataFrame({"x": [None] + [1] * 199})
+    
+    assert frame.count_null()["null_percent"].to_list() == ["<1%"]
+
+def test_streaming_engine(df):
+    assert df.lazy().count_null(engine="streaming").equals(df.count_null())
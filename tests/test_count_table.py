@@ -0,0 +1,65 @@
+import polars as pl
+import pytest
+import penguins
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({
+        "species": ["a", "a", "a", "b", "b", "c", None, "a"],
+        "island": ["x", "y", "x", "x", "y", "y", "x", "x"],
+        "mass": [1.0, 2.0, 3.5, 4.0, 5.0, 10.0, None, 9.9]
+    })
+
+def test_series_counts(df):
+    result = df["species"].count_table()
+    
+    assert result.columns == ["species", "count", "percent"]
+    assert result.row(0) == ("a", 4, 50.0)
+    assert result["count"].sum() == 8
+
+def test_frame_column_matches_series(df):
+    assert df.count_table("species").equals(df["species"].count_table())
+
+def test_lazy_frames(df):
+    assert df.lazy().count_table("species").equals(df.count_table("species"))
+
+def test_top_n_keeps_percentages_of_full_total(df):
+    result = df.count_table("species", top_n=2)
+    
+    assert result["species"].to_list() == ["a", "b"]
+    assert result["percent"].to_list() == [50.0, 25.0]
+
+def test_crosstab(df):
+    result = df.count_table("species", "island")
+    expected = df.group_by("species", "island").len("count")
+    
+    assert result.columns == ["species", "island", "count", "percent"]
+    assert result.drop("percent").sort("species", "island").equals(expected.sort("species", "island"))
+
+def test_equal_width_bins(df):
+    result = df.count_table("mass", bins=3)
+    
+    assert result["mass"].to_list() == [1.0, 4.0, 7.0, None]
+    assert result["count"].to_list() == [3, 2, 2, 1]
+
+def test_break_points(df):
+    result = df.count_table("mass", bins=[2, 5])
+    
+    assert result["mass"].to_list() == [float("-inf"), 2.0, 5.0, None]
+    assert result["count"].to_list() == [1, 3, 3, 1]
+
+def test_bins_leave_other_columns_alone(df):
+    result = df.count_table("species", "mass", bins=[5])
+    
+    assert result.schema["species"] == pl.String
+    assert result.height == 6
+
+def test_series_rejects_column_names(df):
+    with pytest.raises(ValueError):
+        df["species"].count_table("species")
+
+def test_ties_are_ordered_by_value(df):
+    result = df.count_table("species")
+    
+    assert result["species"].to_list() == ["a", "b", "c", None]
+    assert df.count_table("species", top_n=3)["species"].to_list() == ["a", "b", "c"]
@@ -0,0 +1,116 @@
+import os
+import polars as pl
+import pytest
+from penguins.data import generate_penguins, load_penguins
+from penguins.data import generate
+
+def _parts(path):
+    return sorted(name for name in os.listdir(path) if name.startswith("part-"))
+
+def test_writes_one_file_per_chunk(tmp_path):
+    path = generate_penguins(250, chunk_rows=100, cache_dir=tmp_path)
+    
+    assert _parts(path) == ["part-00000.parquet", "part-00001.parquet", "part-00002.parquet"]
+    
+    df = pl.read_parquet(os.path.join(path, "*.parquet"))
+    assert df.height == 250
+    assert df.columns == ["rowid", "species", "island", "bill_length_mm", "bill_depth_mm",
+                          "flipper_length_mm", "body_mass_g", "sex", "year"]
+    assert df["rowid"].to_list() == list(range(1, 251))
+
+def test_same_parameters_reuse_the_cache(tmp_path, monkeypatch):
+    path = generate_penguins(50, cache_dir=tmp_path)
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("the cached dataset was regenerated")
+    monkeypatch.setattr(generate, "_chunk", fail)
+    
+    assert generate_penguins(50, cache_dir=tmp_path) == path
+
+@pytest.mark.parametrize("change", [
+    {"rows": 60}, {"extra_cols": 2}, {"null_rate": 0.1}, {"seed": 1},
+    {"file_format": "ipc"}, {"chunk_rows": 10}
+])
+def test_every_parameter_is_part_of_the_cache_key(tmp_path, change):
+    params = {"rows": 50, "cache_dir": tmp_path}
+    
+    assert generate_penguins(**params) != generate_penguins(**{**params, **change})
+
+def test_cache_key_includes_the_generator_version(tmp_path, monkeypatch):
+    path = generate_penguins(50, cache_dir=tmp_path)
+    monkeypatch.setattr(generate, "_GENERATOR_VERSION", generate._GENERATOR_VERSION + 1)
+    
+    assert generate_penguins(50, cache_dir=tmp_path) != path
+
+def test_overwrite_regenerates(tmp_path):
+    path = generate_penguins(50, cache_dir=tmp_path)
+    marker = os.path.join(path, "marker")
+    open(marker, "w").close()
+    
+    assert generate_penguins(50, cache_dir=tmp_path, overwrite=True) == path
+    assert not os.path.exists(marker)
+
+def test_no_scratch_directories_are_left_behind(tmp_path):
+    generate_penguins(50, cache_dir=tmp_path)
+    
+    assert [name for name in os.listdir(tmp_path) if name.startswith(".")] == []
+
+def test_values_do_not_depend_on_the_chunk_size(tmp_path):
+    whole = load_penguins(rows=120, chunk_rows=1000, cache_dir=tmp_path)
+    chunked = load_penguins(rows=120, chunk_rows=7, cache_dir=tmp_path)
+    
+    assert chunked.sort("rowid").equals(whole)
+
+def test_seed_changes_the_values(tmp_path):
+    first = load_penguins(rows=100, cache_dir=tmp_path)
+    second = load_penguins(rows=100, seed=1, cache_dir=tmp_path)
+    
+    assert not first.equals(second)
+
+def test_categories_and_nulls_follow_the_parameters(tmp_path):
+    df = load_penguins(rows=2000, extra_cols=3, null_rate=0, cache_dir=tmp_path)
+    bundled = load_penguins()
+    
+    assert df.columns[-3:] == ["extra_1", "extra_2", "extra_3"]
+    assert df.null_count().sum_horizontal().item() == 0
+    assert set(df["species"]) <= set(bundled["species"])
+    assert set(df["island"]) <= set(bundled["island"])
+    assert df["extra_1"].is_between(0, 100).all()
+
+def test_null_rate_injects_nulls(tmp_path):
+    df = load_penguins(rows=2000, null_rate=0.5, cache_dir=tmp_path)
+    
+    assert 0.4 < df["body_mass_g"].null_count() / df.height < 0.6
+    assert df["species"].null_count() == 0
+
+def test_ipc_format(tmp_path):
+    path = generate_penguins(30, file_format="ipc", cache_dir=tmp_path)
+    
+    assert _parts(path) == ["part-00000.arrow"]
+    assert load_penguins(rows=30, file_format="ipc", cache_dir=tmp_path).height == 30
+
+def test_cache_dir_from_the_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("PENGUINS_CACHE_DIR", str(tmp_path))
+    
+    assert os.path.dirname(generate_penguins(20)) == str(tmp_path)
+
+def test_load_lazy(tmp_path):
+    assert isinstance(load_penguins(rows=20, lazy=True, cache_dir=tmp_path), pl.LazyFrame)
+    assert isinstance(load_penguins(lazy=True), pl.LazyFrame)
+
+def test_load_bundled():
+    df = load_penguins()
+    
+    assert df.height == 344
+    assert df["sex"].null_count() > 0
+
+def test_bundled_dataset_rejects_generator_arguments():
+    with pytest.raises(TypeError):
+        load_penguins(seed=1)
+
+@pytest.mark.parametrize("kwargs", [
+    {"rows": -1}, {"rows": 10, "chunk_rows": 0}, {"rows": 10, "null_rate": 2}, {"rows": 10, "file_format": "csv"}
+])
+def test_invalid_parameters(tmp_path, kwargs):
+    with pytest.raises(ValueError):
+        generate_penguins(cache_dir=tmp_path, **kwargs)
@@ -0,0 +1,196 @@
+import polars as pl
+import pytest
+from penguins import (
+    _, GroupedFrame, group_by, ungroup, mutate, filter, summarize, reframe, arrange,
+    select, across, slice_max, slice_min, slice_head, slice_tail
+)
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({
+        "g": ["a", "b", "a", "b", "a", "c"],
+        "h": [1, 1, 2, 1, 1, 2],
+        "x": [1, 5, 3, 2, 4, 6],
+        "y": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    })
+
+@pytest.fixture(params=["eager", "lazy"])
+def frame(request, df):
+    return df if request.param == "eager" else df.lazy()
+
+def _collect(result):
+    if isinstance(result, GroupedFrame):
+        result = result.ungroup()
+    return result.collect() if isinstance(result, pl.LazyFrame) else result
+
+@pytest.mark.parametrize("keys", [["g"], ["g", "h"]])
+def test_mutate_matches_over(frame, keys):
+    result = frame >> group_by(*keys) >> mutate(centred=_.x - _.x.mean(), n=pl.len())
+    expected = frame.with_columns(
+        centred=(pl.col("x") - pl.col("x").mean()).over(keys),
+        n=pl.len().over(keys)
+    )
+    
+    assert isinstance(result, GroupedFrame)
+    assert _collect(result).equals(_collect(expected))
+
+def test_mutate_compiles_to_one_window_pass(df):
+    result = df.lazy() >> group_by(_.g) >> mutate(z=(_.x - _.x.mean()) / _.x.std(), n=pl.len())
+    plan = result.ungroup().explain()
+    
+    assert plan.count("WITH_COLUMNS") == 1
+    assert ".over(" in plan
+    assert "JOIN" not in plan and "AGGREGATE" not in plan
+
+def test_mutate_standardizes_within_groups(frame):
+    result = _collect(frame >> group_by(_.g) >> mutate(z=(_.x - _.x.mean()) / _.x.std()))
+    
+    groups = result.group_by("g").agg(mean=pl.col("z").mean(), std=pl.col("z").std()).sort("g")
+    
+    assert result.columns == ["g", "h", "x", "y", "z"]
+    assert groups["mean"].round(10).to_list() == [0.0, 0.0, None]
+    assert groups["std"].round(10).to_list() == [1.0, 1.0, None]
+
+def test_mutate_across_within_groups(frame):
+    result = frame >> group_by(_.g) >> mutate(across([_.x, _.y], lambda col: col.sum(), names="{col}_total"))
+    expected = frame.with_columns(pl.col("x", "y").sum().over("g").name.suffix("_total"))
+    
+    assert _collect(result).equals(_collect(expected))
+
+def test_mutate_placement_within_groups(frame):
+    result = frame >> group_by(_.g) >> mutate(total=_.x.sum(), _after="g")
+    
+    assert _collect(result).columns == ["g", "total", "h", "x", "y"]
+    assert _collect(result)["total"].to_list() == [8, 7, 8, 7, 8, 6]
+
+def test_mutate_values_and_bare_columns_within_groups(df):
+    result = df >> group_by(_.g) >> mutate(copy=_.x, fixed=[6, 5, 4, 3, 2, 1])
+    
+    assert result.ungroup()["copy"].equals(df["x"].alias("copy"))
+    assert result.ungroup()["fixed"].to_list() == [6, 5, 4, 3, 2, 1]
+
+@pytest.mark.parametrize("keys", [["g"], ["g", "h"]])
+def test_filter_matches_over(frame, keys):
+    result = frame >> group_by(*keys) >> filter(_.x > _.x.mean())
+    expected = frame.filter(pl.col("x") > pl.col("x").mean().over(keys))
+    
+    assert _collect(result).equals(_collect(expected))
+
+def test_filter_on_group_size(frame):
+    result = frame >> group_by(_.g) >> filter(pl.len() > 1)
+    
+    assert _collect(result)["g"].to_list() == ["a", "b", "a", "b", "a"]
+
+def test_filter_compiles_to_one_window_predicate(df):
+    result = df.lazy() >> group_by(_.g) >> filter(_.x > _.x.mean(), pl.len() > 1)
+    plan = result.ungroup().explain()
+    
+    assert plan.count("FILTER") == 1
+    assert ".over(" in plan
+    assert "JOIN" not in plan and "AGGREGATE" not in plan
+
+def test_filter_combines_conditions_within_groups(frame):
+    result = frame >> group_by(_.g) >> filter(_.x >= _.x.median(), pl.len() > 1)
+    
+    assert isinstance(result, GroupedFrame)
+    assert _collect(result)["x"].to_list() == [5, 3, 4]
+
+def test_filter_keeps_whole_groups(frame):
+    result = frame >> group_by(_.g) >> filter(_.y.max() > 4.5)
+    
+    assert _collect(result)["g"].to_list() == ["a", "a", "a", "c"]
+
+@pytest.mark.parametrize("keys", [["g"], ["g", "h"]])
+def test_summarize_matches_agg(frame, keys):
+    result = frame >> group_by(*keys) >> summarize(total=_.x.sum(), mean_y=_.y.mean())
+    expected = frame.group_by(keys).agg(total=pl.col("x").sum(), mean_y=pl.col("y").mean())
+    
+    assert not isinstance(result, GroupedFrame)
+    assert _collect(result).sort(keys).equals(_collect(expected).sort(keys))
+
+def test_reframe_matches_agg(frame):
+    result = frame >> group_by(_.g) >> reframe(q=_.x.quantile(0.5))
+    expected = frame.group_by("g").agg(q=pl.col("x").quantile(0.5))
+    
+    assert _collect(result).sort("g").equals(_collect(expected).sort("g"))
+
+def test_grouping_persists_across_verbs(df):
+    result = (
+        df >> group_by(_.g, _.h)
+        >> mutate(z=_.x - _.x.min())
+        >> filter(_.z == 0)
+        >> mutate(n=pl.len())
+    )
+    expected = (
+        df.with_columns(z=pl.col("x") - pl.col("x").min().over("g", "h"))
+        .filter(pl.col("z") == 0)
+        .with_columns(n=pl.len().over("g", "h"))
+    )
+    
+    assert isinstance(result, GroupedFrame)
+    assert result.ungroup().equals(expected)
+
+def test_index_never_leaks(df):
+    result = df >> group_by(_.g, _.h) >> mutate(n=pl.len()) >> select(pl.all())
+    
+    assert _collect(result).columns == ["g", "h", "x", "y", "n"]
+
+def test_index_is_reused(df):
+    grouped = df >> group_by(_.g, _.h) >> mutate(n=pl.len())
+    
+    assert grouped._index is not None
+    assert (grouped >> filter(_.x > 1))._index is not None
+
+def test_sorted_frame_matches_unsorted(df):
+    plain = df >> group_by(_.g, _.h) >> mutate(total=_.x.sum())
+    runs = df >> arrange(_.g, _.h) >> group_by(_.g, _.h) >> mutate(total=_.x.sum())
+    
+    assert runs.ungroup().sort("g", "h", "x").equals(plain.ungroup().sort("g", "h", "x"))
+
+def test_ungroup(df):
+    assert (df >> group_by(_.g) >> ungroup()).equals(df)
+
+def test_regroup_drops_groups_without_keys(df):
+    result = df >> group_by(_.g) >> select(_.x)
+    
+    assert isinstance(result, pl.DataFrame)
+
+@pytest.mark.parametrize("verb, largest", [(slice_max, True), (slice_min, False)])
+def test_slice_extremes_match_top_k(frame, verb, largest):
+    result = frame >> group_by(_.g) >> verb(_.x, n=2, with_ties=False)
+    ranked = pl.col("x").rank("ordinal", descending=largest).over("g")
+    expected = frame.filter(ranked <= 2)
+    
+    assert _collect(result).sort("g", "x").equals(_collect(expected).sort("g", "x"))
+
+def test_slice_max_keeps_ties():
+    df = pl.DataFrame({"g": ["a", "a", "a"], "x": [2, 2, 1]})
+    
+    assert (df >> slice_max(_.x, by=_.g)).height == 2
+    assert (df >> slice_max(_.x, by=_.g, with_ties=False)).height == 1
+
+def test_slice_head_and_tail(frame):
+    head = frame >> group_by(_.g) >> slice_head(n=1)
+    tail = frame >> group_by(_.g) >> slice_tail(n=1)
+    
+    assert _collect(head).sort("g")["x"].to_list() == [1, 5, 6]
+    assert _collect(tail).sort("g")["x"].to_list() == [4, 2, 6]
+
+@pytest.mark.parametrize("verb, expected", [(slice_max, [1]), (slice_min, [6])])
+def test_slice_extremes_honour_negation(frame, verb, expected):
+    result = frame >> verb(-_.x, n=1)
+    
+    assert _collect(result)["x"].to_list() == expected
+
+def test_negated_slice_max_matches_slice_min(frame):
+    result = frame >> group_by(_.g) >> slice_max(-_.x, n=2)
+    expected = frame >> group_by(_.g) >> slice_min(_.x, n=2)
+    
+    assert _collect(result).equals(_collect(expected))
+
+def test_iterates_like_polars_group_by(df):
+    result = [(key, sub) for key, sub in df >> group_by(_.g)]
+    expected = list(df.group_by("g", maintain_order=True))
+    
+    assert [key for key, sub in result] == [("a",), ("b",), ("c",)]
+    assert all(sub.equals(other) for (key, sub), (key, other) in zip(result, expected))
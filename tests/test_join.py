@@ -0,0 +1,191 @@
+from datetime import datetime
+import polars as pl
+import pytest
+from penguins import _, arrange, assume_sorted, join, join_asof, join_where, join_many
+
+@pytest.fixture
+def sales():
+    return pl.DataFrame({
+        "store_id": [1, 2, 1, 3],
+        "sku": ["a", "b", "b", "c"],
+        "amount": [10, 20, 30, 40]
+    })
+
+@pytest.fixture
+def stores():
+    return pl.DataFrame({"id": [1, 2, 3], "region": ["N", "S", "N"], "city": ["X", "Y", "Z"]})
+
+@pytest.fixture
+def products():
+    return pl.DataFrame({"product_sku": ["a", "b"], "name": ["apple", "banana"]})
+
+def test_join_matches_polars(sales, stores):
+    result = sales >> join(stores, left_on="store_id", right_on="id", how="left")
+    
+    assert result.equals(sales.join(stores, left_on="store_id", right_on="id", how="left"))
+
+def test_join_lazy(sales, stores):
+    result = sales.lazy() >> join(stores, left_on="store_id", right_on="id")
+    
+    assert isinstance(result, pl.LazyFrame)
+    assert result.collect().equals(sales.join(stores, left_on="store_id", right_on="id"))
+
+def test_join_asof_matches_polars():
+    trades = pl.DataFrame({"time": [5, 1, 3], "qty": [1, 2, 3]})
+    quotes = pl.DataFrame({"time": [0, 2, 4], "price": [1.0, 2.0, 3.0]})
+    
+    result = trades >> join_asof(quotes, on=_.time)
+    expected = trades.sort("time").join_asof(quotes, on="time")
+    
+    assert result.equals(expected)
+
+def test_join_asof_on_assumed_sorted():
+    trades = pl.DataFrame({"time": [1, 3, 5], "qty": [1, 2, 3]})
+    quotes = pl.DataFrame({"time": [0, 2, 4], "price": [1.0, 2.0, 3.0]})
+    
+    result = trades >> assume_sorted(_.time) >> join_asof(quotes >> assume_sorted(_.time), on=_.time)
+    
+    assert result["price"].to_list() == [1.0, 2.0, 3.0]
+
+@pytest.fixture
+def trades():
+    return pl.DataFrame({"time": [5, 1, 3, 8], "ticker": ["x", "y", "x", "y"], "qty": [1, 2, 3, 4]})
+
+@pytest.fixture
+def quotes():
+    return pl.DataFrame({"time": [0, 2, 4, 4], "ticker": ["x", "y", "x", "y"], "price": [1.0, 2.0, 3.0, 4.0]})
+
+@pytest.mark.parametrize("kwargs", [
+    {"strategy": "forward"}, {"strategy": "nearest"}, {"tolerance": 1},
+    {"allow_exact_matches": False}, {"by": "ticker"}
+])
+def test_join_asof_options_match_polars(trades, quotes, kwargs):
+    result = trades >> join_asof(quotes, on=_.time, **kwargs)
+    expected = trades.sort("time").join_asof(quotes.sort("time"), on="time", check_sortedness=False, **kwargs)
+    
+    assert result.equals(expected)
+
+def test_join_asof_by_groups(trades, quotes):
+    result = trades >> join_asof(quotes, on=_.time, by=_.ticker)
+    
+    assert result.select("time", "ticker", "price").rows() == [
+        (1, "y", None), (3, "x", 1.0), (5, "x", 3.0), (8, "y", 4.0)
+    ]
+
+def test_join_asof_different_key_names(trades, quotes):
+    result = trades >> join_asof(quotes.rename({"time": "quoted"}), left_on=_.time, right_on="quoted",
+                                 by_left="ticker", by_right="ticker")
+    
+    assert result["price"].to_list() == [None, 1.0, 3.0, 4.0]
+
+def test_join_asof_duration_tolerance():
+    trades = pl.DataFrame({"time": [datetime(2024, 1, 1, 0, minute) for minute in (0, 10, 20)]})
+    quotes = pl.DataFrame({"time": [datetime(2024, 1, 1, 0, 8)], "price": [1.0]})
+    
+    result = trades >> join_asof(quotes, on=_.time, tolerance="5m")
+    
+    assert result["price"].to_list() == [None, 1.0, None]
+
+def test_join_asof_lazy(trades, quotes):
+    result = trades.lazy() >> join_asof(quotes, on=_.time, by=_.ticker)
+    
+    assert isinstance(result, pl.LazyFrame)
+    assert result.collect().equals(trades >> join_asof(quotes, on=_.time, by=_.ticker))
+
+def test_join_asof_skips_sorting_sorted_frames(trades, quotes):
+    result = trades.lazy() >> arrange(_.time) >> join_asof(quotes.lazy() >> arrange(_.time), on=_.time)
+    
+    assert result.explain().count("SORT") == 2
+
+def test_join_asof_needs_a_key(trades, quotes):
+    with pytest.raises(ValueError):
+        join_asof(quotes, left_on=_.time)
+
+def test_join_where_matches_polars():
+    events = pl.DataFrame({"time": [1, 5, 9]})
+    shifts = pl.DataFrame({"start": [0, 4], "end": [4, 8], "shift": ["a", "b"]})
+    
+    result = events >> join_where(shifts, _.time >= _.start, _.time < _.end)
+    expected = events.join_where(shifts, pl.col("time") >= pl.col("start"), pl.col("time") < pl.col("end"))
+    
+    assert result.sort("time").equals(expected.sort("time"))
+
+def test_join_where_left_keeps_unmatched():
+    events = pl.DataFrame({"time": [1, 5, 9]})
+    shifts = pl.DataFrame({"start": [0, 4], "end": [4, 8], "shift": ["a", "b"]})
+    
+    result = events >> join_where(shifts, _.time >= _.start, _.time < _.end, how="left")
+    
+    assert result.sort("time")["shift"].to_list() == ["a", "b", None]
+
+def test_join_where_lazy():
+    events = pl.LazyFrame({"time": [1, 5, 9]})
+    shifts = pl.DataFrame({"start": [0, 4], "end": [4, 8], "shift": ["a", "b"]})
+    
+    result = events >> join_where(shifts, _.time >= _.start, _.time < _.end)
+    
+    assert isinstance(result, pl.LazyFrame)
+    assert result.collect().sort("time")["shift"].to_list() == ["a", "b"]
+
+def test_join_where_suffix():
+    left = pl.DataFrame({"t": [1, 5], "v": [1, 2]})
+    right = pl.DataFrame({"t": [0, 4], "v": [10, 20]})
+    
+    result = left >> join_where(right, _.t > _.t_other, suffix="_other")
+    
+    assert result.columns == ["t", "v", "t_other", "v_other"]
+    assert result.height == 3
+
+@pytest.mark.parametrize("engine", ["in-memory", "streaming"])
+def test_join_where_engines_agree(engine):
+    events = pl.DataFrame({"time": list(range(20))})
+    shifts = pl.DataFrame({"start": [0, 5, 12], "end": [6, 12, 30]})
+    
+    result = events >> join_where(shifts, _.time >= _.start, _.time < _.end, engine=engine)
+    
+    assert result.sort("time", "start")["time"].to_list() == [*range(6), 5, *range(6, 20)]
+
+def test_join_where_needs_a_predicate():
+    with pytest.raises(ValueError):
+        join_where(pl.DataFrame())
+
+def test_join_many_matches_chained_joins(sales, stores, products):
+    result = sales >> join_many([
+        (stores, {"store_id": "id"}, [_.region]),
+        (products, {"sku": "product_sku"}, {"product": "name"})
+    ])
+    expected = (
+        sales
+        .join(stores.select("id", "region"), left_on="store_id", right_on="id", how="left")
+        .join(products.rename({"name": "product"}), left_on="sku", right_on="product_sku", how="left")
+    )
+    
+    assert result.equals(expected)
+
+def test_join_many_lazy(sales, stores):
+    result = sales.lazy() >> join_many([(stores, {"store_id": "id"})])
+    
+    assert isinstance(result, pl.LazyFrame)
+    assert result.collect().columns == ["store_id", "sku", "amount", "region", "city"]
+
+def test_join_many_inner(sales, products):
+    result = sales >> join_many([(products, {"sku": "product_sku"})], how="inner")
+    
+    assert result["sku"].to_list() == ["a", "b", "b"]
+
+def test_join_many_rejects_duplicate_keys(sales):
+    stores = pl.DataFrame({"id": [1, 1, 2, 3], "region": ["N", "E", "S", "N"]})
+    
+    with pytest.raises(pl.exceptions.ComputeError):
+        sales >> join_many([(stores, {"store_id": "id"})])
+
+def test_join_many_many_to_many(sales):
+    stores = pl.DataFrame({"id": [1, 1, 2, 3], "region": ["N", "E", "S", "N"]})
+    
+    result = sales >> join_many([(stores, {"store_id": "id"})], validate="m:m")
+    
+    assert result.height == 6
+
+def test_join_many_rejects_clashing_columns(sales, stores):
+    with pytest.raises(ValueError):
+        sales >> join_many([(stores.rename({"region": "amount"}), {"store_id": "id"})])
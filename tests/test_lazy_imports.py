@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+import polars as pl
+import pytest
+import penguins
+from penguins import acutis
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Define function for running a snippet in a fresh interpreter
+def _run(code, **env):
+    """Run code in a new interpreter with penguins importable, returning its stripped stdout."""
+    environ = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [_ROOT, os.environ.get("PYTHONPATH")])))
+    environ.pop("PENGUINS_NO_ACUTIS", None)
+    environ.update(env)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=_ROOT, env=environ)
+    return output.stdout.strip()
+
+def test_import_only_loads_the_core():
+    loaded = _run(
+        "import sys, penguins\n"
+        "print(sorted(name for name in sys.modules if name.startswith(('penguins.verbs', 'penguins.acutis.', 'penguins.data'))))"
+    )
+    
+    assert loaded == "[]"
+
+def test_verbs_load_on_first_access():
+    loaded = _run(
+        "import sys, penguins\n"
+        "penguins.mutate\n"
+        "print('penguins.verbs.mutate' in sys.modules, 'penguins.verbs.join' in sys.modules, 'mutate' in vars(penguins))"
+    )
+    
+    assert loaded == "True False True"
+
+def test_acutis_methods_load_on_first_use():
+    loaded = _run(
+        "import sys, polars as pl, penguins\n"
+        "before = 'penguins.acutis.count_null' in sys.modules\n"
+        "pl.DataFrame({'x': [1, None]}).count_null()\n"
+        "print(before, 'penguins.acutis.count_null' in sys.modules, 'penguins.acutis.affiche' in sys.modules)"
+    )
+    
+    assert loaded == "False True False"
+
+def test_acutis_can_be_disabled():
+    loaded = _run("import polars as pl, penguins\nprint(hasattr(pl.DataFrame, 'affiche'))", PENGUINS_NO_ACUTIS="1")
+    
+    assert loaded == "False"
+
+def test_star_import_resolves_every_name():
+    names = _run("from penguins import *\nimport penguins\nprint(all(name in globals() for name in penguins.__all__))")
+    
+    assert names == "True"
+
+def test_lazy_names_are_exported():
+    assert set(penguins._LAZY_IMPORTS) <= set(penguins.__all__)
+    assert set(penguins._LAZY_IMPORTS) <= set(dir(penguins))
+
+def test_lazy_names_match_their_modules():
+    from penguins.verbs.slice import slice_max
+    from penguins.core.trace import trace
+    
+    assert penguins.slice_max is slice_max
+    assert penguins.trace is trace
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError, match="no attribute 'nope'"):
+        penguins.nope
+    assert not hasattr(penguins, "nope")
+
+def test_uninstall_and_install():
+    df = pl.DataFrame({"x": [1, None]})
+    try:
+        acutis.uninstall("count_null")
+        assert not hasattr(pl.DataFrame, "count_null")
+        assert hasattr(pl.DataFrame, "affiche")
+    finally:
+        acutis.install("count_null")
+    
+    assert df.count_null()["null_count"].to_list() == [1]
+
+def test_install_rejects_unknown_methods():
+    with pytest.raises(ValueError):
+        acutis.install("nope")
+    with pytest.raises(ValueError):
+        acutis.uninstall("nope")
+
+def test_acutis_functions_load_lazily():
+    from penguins.acutis.pasteurize import pasteurize
+    
+    assert acutis.pasteurize is pasteurize
+    with pytest.raises(AttributeError):
+        acutis.nope
+
+def test_importing_a_method_module_keeps_the_function():
+    loaded = _run(
+        "import penguins, penguins.acutis.count_null\n"
+        "print(callable(penguins.acutis.count_null), callable(penguins.count_null))"
+    )
+    
+    assert loaded == "True True"
@@ -0,0 +1,45 @@
+import polars as pl
+import pytest
+import penguins
+from penguins.core.schema import carried_schema
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({
+        "Species Name": [" adelie ", "adelie", "GENTOO", None, "NA", "chinstrap"],
+        "Body-Mass (g)": [3750, 3750, 5000, None, None, 3500],
+        "Island": ["dream", "dream", "biscoe", None, "NULL", " "]
+    })
+
+def test_cleans_names_and_strings(df):
+    result = df.pasteurize()
+    
+    assert result.columns == ["species_name", "body_mass_g", "island"]
+    assert result.rows() == [
+        ("Adelie", 3750, "Dream"),
+        ("Gentoo", 5000, "Biscoe"),
+        ("Chinstrap", 3500, None)
+    ]
+
+def test_rows_becoming_duplicates_after_cleaning_are_dropped(df):
+    assert df.pasteurize().height == 3
+
+def test_rows_of_na_strings_are_dropped_as_empty(df):
+    result = df.pasteurize()
+    
+    assert not result.select(pl.all_horizontal(pl.all().is_null())).to_series().any()
+
+def test_lazy_frames_stay_lazy(df):
+    lf = df.lazy().pasteurize()
+    
+    assert isinstance(lf, pl.LazyFrame)
+    assert carried_schema(lf) == pl.Schema({"species_name": pl.String, "body_mass_g": pl.Int64, "island": pl.String})
+    assert lf.collect().equals(df.pasteurize())
+
+def test_unordered_dedup_keeps_the_same_rows(df):
+    result = df.pasteurize(maintain_order=False)
+    
+    assert result.sort("body_mass_g").equals(df.pasteurize().sort("body_mass_g"))
+
+def test_frames_without_columns():
+    assert pl.DataFrame().pasteurize().shape == (0, 0)
@@ -0,0 +1,123 @@
+import polars as pl
+import pytest
+from penguins import (
+    _, Pipeline, group_by, mutate, filter, select, rename, relocate, arrange, summarize, head,
+    starts_with
+)
+from penguins.core.pipeline import FusedVerb
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({
+        "bill_length": [39.1, 39.5, 40.3, 36.7, 39.3],
+        "bill_depth": [18.7, 17.4, 18.0, 19.3, 20.6],
+        "species": ["a", "b", "a", "b", "a"],
+        "year": [2007, 2008, 2008, 2009, 2007]
+    })
+
+@pytest.fixture
+def pipeline():
+    return (
+        _ >> filter(_.year > 2007)
+        >> mutate(ratio=_.bill_length / _.bill_depth)
+        >> rename(kind="species")
+        >> select(starts_with("bill"), _.kind, _.ratio)
+    )
+
+def _one_by_one(df, pipeline):
+    # Apply each verb on its own, as chaining them directly would
+    for step in pipeline.steps:
+        df = step(df)
+    return df
+
+def test_pipeline_is_deferred(pipeline):
+    assert isinstance(pipeline, Pipeline)
+    assert [step.name for step in pipeline] == ["filter", "mutate", "rename", "select"]
+
+def test_adjacent_fusable_verbs_are_fused(pipeline):
+    plan = pipeline.optimize().steps
+    
+    assert len(plan) == 1
+    assert isinstance(plan[0], FusedVerb)
+    assert [step.name for step in plan[0].steps] == ["filter", "mutate", "rename", "select"]
+
+def test_non_fusable_verbs_split_runs(pipeline):
+    plan = (pipeline >> group_by(_.kind) >> summarize(n=pl.len()) >> filter(_.n > 0)).optimize().steps
+    
+    assert [step.name for step in plan] == ["fused", "group_by", "summarize", "filter"]
+
+def test_fused_matches_unfused(df, pipeline):
+    result = df >> pipeline
+    
+    assert isinstance(result, pl.DataFrame)
+    assert result.equals(_one_by_one(df, pipeline))
+
+def test_lazy_matches_eager(df, pipeline):
+    result = df.lazy() >> pipeline
+    
+    assert isinstance(result, pl.LazyFrame)
+    assert result.collect().equals(df >> pipeline)
+
+def test_pipelines_compose(df, pipeline):
+    longer = pipeline >> (arrange(-_.ratio) >> relocate(_.ratio) >> head(2))
+    
+    assert len(longer) == 7
+    assert (df >> longer).equals(_one_by_one(df, longer))
+
+def test_grouped_frames_keep_groups_through_fused_verbs(df):
+    pipeline = _ >> group_by(_.species) >> mutate(n=pl.len()) >> filter(_.n > 2) >> mutate(m=_.year.max())
+    expected = (
+        df.with_columns(n=pl.len().over("species"))
+        .filter(pl.col("n") > 2)
+        .with_columns(m=pl.col("year").max().over("species"))
+    )
+    
+    assert (df >> pipeline).ungroup().equals(expected)
+
+def test_pipeline_is_reusable(df, pipeline):
+    first = df >> pipeline
+    second = df.head(3) >> pipeline
+    
+    assert second.equals(_one_by_one(df.head(3), pipeline))
+    assert first.height == 3
+
+def test_rejects_non_callable_steps():
+    with pytest.raises(TypeError):
+        Pipeline([1])
+
+def test_parenthesised_eager_chain_is_fused(df):
+    chain = filter(_.year > 2007) >> mutate(ratio=_.bill_length / _.bill_depth)
+    
+    assert isinstance(chain, Pipeline)
+    assert [step.name for step in chain.optimize()] == ["fused"]
+    assert (df >> chain).equals(df >> filter(_.year > 2007) >> mutate(ratio=_.bill_length / _.bill_depth))
+
+def test_verbs_record_name_and_arguments():
+    step = filter(_.year > 2007)
+    
+    assert step.name == "filter"
+    assert repr(step) == 'filter(col("year") > 2007)'
+
+def test_chained_verbs_build_a_pipeline(df):
+    pipeline = filter(_.year > 2007) >> select(_.species)
+    
+    assert isinstance(pipeline, Pipeline)
+    assert (df >> pipeline).equals(df.filter(pl.col("year") > 2007).select("species"))
+
+def test_method_calls_join_pipelines(df):
+    pipeline = _.head(3) >> select(_.year)
+    
+    assert (df >> pipeline).equals(df.head(3).select("year"))
+
+def test_nested_pipelines_are_flattened(pipeline):
+    combined = Pipeline([pipeline, head(1)])
+    
+    assert len(combined) == 5
+    assert [step.name for step in combined[-2:]] == ["select", "head"]
+
+def test_pipeline_runs_when_called(df, pipeline):
+    assert pipeline(df).equals(df >> pipeline)
+
+def test_pipeline_repr_lists_steps(pipeline):
+    assert repr(pipeline).splitlines()[1] == '  filter(col("year") > 2007)'
+    assert repr(Pipeline()) == "Pipeline()"
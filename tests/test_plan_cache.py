@@ -0,0 +1,65 @@
+import polars as pl
+import pytest
+from penguins import _, mutate, select, filter, where, is_numeric, starts_with, plan_cache_info, clear_plan_cache
+from penguins.core.cache import PlanCache
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_plan_cache()
+    yield
+    clear_plan_cache()
+
+@pytest.fixture
+def pipeline():
+    return _ >> select(starts_with("x"), _.g) >> mutate(total=pl.sum_horizontal(pl.col("^x.*$"))) >> filter(_.total > 2)
+
+def test_same_schema_hits(pipeline):
+    for day in range(3):
+        pl.DataFrame({"x1": [day, 2], "x2": [1, 2], "g": ["a", "b"]}) >> pipeline
+    
+    info = plan_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+def test_new_schema_misses(pipeline):
+    pl.DataFrame({"x1": [1, 2], "g": ["a", "b"]}) >> pipeline
+    result = pl.DataFrame({"x1": [1, 2], "x2": [3, 4], "g": ["a", "b"]}) >> pipeline
+    
+    assert plan_cache_info().misses == 2
+    assert result.columns == ["x1", "x2", "g", "total"]
+
+def test_cached_plan_matches_fresh_plan():
+    pipeline = _ >> select(where(is_numeric))
+    df = pl.DataFrame({"a": [1, 2], "b": ["x", "y"], "c": [1.5, 2.5]})
+    
+    first = df >> pipeline
+    second = df >> pipeline
+    
+    assert plan_cache_info().hits == 1
+    assert first.equals(second)
+    assert second.columns == ["a", "c"]
+
+def test_lazy_frames_share_the_cache(pipeline):
+    df = pl.DataFrame({"x1": [1, 2], "x2": [3, 4], "g": ["a", "b"]})
+    
+    eager = df >> pipeline
+    lazy = (df.lazy() >> pipeline).collect()
+    
+    assert plan_cache_info().hits == 1
+    assert lazy.equals(eager)
+
+def test_least_recently_used_plan_is_evicted():
+    cache = PlanCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.info().currsize == 2
+
+def test_clear_resets_counters(pipeline):
+    pl.DataFrame({"x1": [1], "g": ["a"]}) >> pipeline
+    clear_plan_cache()
+    
+    assert plan_cache_info() == (0, 0, 128, 0)
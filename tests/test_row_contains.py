@@ -0,0 +1,50 @@
+import polars as pl
+import pytest
+from penguins import _, filter, row_contains
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({
+        "name": ["Adelie", "Gentoo", "Chinstrap"],
+        "cat": pl.Series(["x", "y", "z"], dtype=pl.Categorical),
+        "enum": pl.Series(["low", "high", "low"], dtype=pl.Enum(["low", "high"])),
+        "n": [1, 2, 3]
+    })
+
+def test_matches_categorical_column(df):
+    assert (df >> filter(row_contains("x"))).height == 1
+
+def test_matches_enum_column(df):
+    assert (df >> filter(row_contains("high"))).height == 1
+
+def test_categorical_ignore_case(df):
+    assert (df >> filter(row_contains("X", ignore_case=True))).height == 1
+
+def test_enum_contains(df):
+    assert (df >> filter(row_contains("IG", contains=True, ignore_case=True))).height == 1
+
+def test_categoricals_keep_their_dtype(df):
+    result = df >> filter(row_contains("z", cols=_.cat))
+    
+    assert result.schema == df.schema
+    assert result["n"].to_list() == [3]
+
+def test_numbers_do_not_match_strings(df):
+    assert (df >> filter(row_contains(2))).height == 1
+    assert (df >> filter(row_contains("2"))).height == 0
+
+def test_ignore_case_folds_non_ascii():
+    df = pl.DataFrame({"name": ["ÉCOLE", "ecole", "bureau"]})
+    
+    assert (df >> filter(row_contains("éc", ignore_case=True, contains=True))).height == 1
+    assert (df >> filter(row_contains("école", ignore_case=True))).height == 1
+
+def test_matches_decimal_columns():
+    from decimal import Decimal
+    
+    df = pl.DataFrame({"price": pl.Series([Decimal("1.50"), Decimal("2.00"), None], dtype=pl.Decimal(10, 2))})
+    
+    assert (df >> filter(row_contains(1.5))).height == 1
+    assert (df >> filter(row_contains(2))).height == 1
+    assert (df >> filter(row_contains(Decimal("2.00")))).height == 1
+    assert (df >> filter(row_contains(3))).height == 0
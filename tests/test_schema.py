@@ -0,0 +1,60 @@
+import polars as pl
+import pytest
+from penguins import (
+    _, mutate, filter, select, rename, relocate, arrange, where, is_numeric, starts_with,
+    schema_resolutions, reset_schema_resolutions
+)
+from penguins.core.schema import carried_schema, known_schema, collect_schema
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({"x1": [1, 2, 3], "x2": [4.0, 5.0, 6.0], "name": ["a", "b", "c"]})
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    reset_schema_resolutions()
+
+def _chain(frame):
+    return (
+        frame
+        >> mutate(x3=_.x1 * 2)
+        >> filter(_.x1 > 1)
+        >> rename(label="name")
+        >> select(where(is_numeric), _.label)
+        >> relocate(_.label)
+        >> arrange(-_.x3)
+    )
+
+def test_lazy_chain_matches_eager(df):
+    assert _chain(df.lazy()).collect().equals(_chain(df))
+
+def test_deep_lazy_chain_resolves_plan_at_most_once(df):
+    lf = df.lazy()
+    for i in range(20):
+        lf = lf >> mutate(**{f"y{i}": _.x1 + i}) >> select(where(is_numeric))
+    
+    assert schema_resolutions() <= 1
+    assert lf.collect_schema().names()[-1] == "y19"
+
+def test_schema_is_deferred_until_needed(df):
+    lf = df.lazy() >> mutate(x3=_.x1 * 2)
+    
+    assert carried_schema(lf) is None
+    assert known_schema(lf) == lf.collect_schema()
+    assert carried_schema(lf) == lf.collect_schema()
+
+def test_carried_schema_matches_polars(df):
+    lf = _chain(df.lazy())
+    
+    assert collect_schema(lf) == lf.collect_schema()
+    assert schema_resolutions() == 1
+
+def test_dtype_selectors_see_new_columns(df):
+    lf = df.lazy() >> mutate(x3=_.name.str.len_chars()) >> select(where(is_numeric))
+    
+    assert lf.collect().columns == ["x1", "x2", "x3"]
+
+def test_unfusable_verbs_fall_back_to_polars(df):
+    lf = df.lazy() >> mutate(x3=_.x1.cast(pl.String)) >> select(starts_with("x"))
+    
+    assert lf.collect().schema == pl.Schema({"x1": pl.Int64, "x2": pl.Float64, "x3": pl.String})
@@ -0,0 +1,61 @@
+import polars as pl
+import pytest
+from penguins import (
+    _, select, filter, mutate, arrange, across, starts_with, ends_with, contains, where,
+    is_numeric, is_string
+)
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({
+        "bill_length_mm": [39.1, 39.5],
+        "bill_depth_mm": [18.7, 17.4],
+        "species": ["Adelie", "Gentoo"],
+        "year": [2007, 2008]
+    })
+
+@pytest.mark.parametrize("selector, expected", [
+    (starts_with("bill"), ["bill_length_mm", "bill_depth_mm"]),
+    (ends_with("mm"), ["bill_length_mm", "bill_depth_mm"]),
+    (contains("depth"), ["bill_depth_mm"]),
+    (starts_with("bill|spec"), ["bill_length_mm", "bill_depth_mm", "species"]),
+    (where(is_numeric), ["bill_length_mm", "bill_depth_mm", "year"]),
+    (where(is_string), ["species"]),
+    (~starts_with("bill"), ["species", "year"]),
+    (starts_with("bill") - contains("depth"), ["bill_length_mm"]),
+])
+def test_selectors_match_columns(df, selector, expected):
+    assert (df >> select(selector)).columns == expected
+    assert (df.lazy() >> select(selector)).collect().columns == expected
+
+def test_custom_predicates_resolve_against_schema(df):
+    result = df >> select(where(lambda dtype: dtype == pl.Int64))
+    
+    assert result.columns == ["year"]
+
+def test_selector_reprs():
+    assert repr(starts_with("bill")) == "starts_with('bill')"
+    assert repr(ends_with("mm")) == "ends_with('mm')"
+    assert repr(contains("depth")) == "contains('depth')"
+    assert repr(where(is_numeric)) == "where(is_numeric)"
+    assert repr(~_.year) == "~_.year"
+
+def test_pipeline_display_is_readable():
+    pipeline = (
+        _ >> select(starts_with("bill"), ~_.year)
+        >> filter(_.x > 1, (_.a > 1) & (_.b < 2))
+        >> mutate(across(where(is_numeric), abs, names="{col}_abs"), y=(_.x * 2).alias("z"))
+        >> arrange(-_.x)
+    )
+    
+    assert repr(pipeline).splitlines() == [
+        "Pipeline(",
+        "  select(starts_with('bill'), ~_.year)",
+        '  >> filter(col("x") > 1, (col("a") > 1) & (col("b") < 2))',
+        "  >> mutate(across(where(is_numeric), abs, names='{col}_abs'), y=(col(\"x\") * 2).alias(\"z\"))",
+        '  >> arrange(-col("x"))',
+        ")"
+    ]
+
+def test_string_literals_with_brackets_are_kept():
+    assert repr(filter(_.s == "a) > (b")) == 'filter(col("s") == "a) > (b")'
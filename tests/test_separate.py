@@ -0,0 +1,55 @@
+import polars as pl
+import pytest
+from penguins import _, separate
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({"t": ["a1b22c", "x\x1fy9z", None, "q"], "k": [1, 2, 3, 4]})
+
+def test_regex_separator_keeps_unit_separator_characters(df):
+    result = df >> separate(_.t, into=["a", "b"], sep=r"\d+", regex=True, validate=False)
+    
+    assert result.columns == ["a", "b", "k"]
+    assert result["a"].to_list() == ["a", "x\x1fy", None, "q"]
+    assert result["b"].to_list() == ["b", "z", None, None]
+
+def test_regex_separator_fill_left(df):
+    result = df >> separate(_.t, into=["a", "b"], sep=r"\d+", regex=True, fill="left", validate=False)
+    
+    assert result["a"].to_list() == ["b", "x\x1fy", None, None]
+    assert result["b"].to_list() == ["c", "z", None, "q"]
+
+def test_eager_and_lazy_agree(df):
+    step = separate(_.t, into=["a", "b"], sep=r"\d+", regex=True, validate=False)
+    
+    assert (df.lazy() >> step).collect().equals(df >> step)
+
+def test_literal_separator(df):
+    result = df >> separate(_.t, into=["a", "b"], sep="1", validate=False)
+    
+    assert result["a"].to_list() == ["a", "x\x1fy9z", None, "q"]
+    assert result["b"].to_list() == ["b22c", None, None, None]
+
+def test_eager_input_is_validated(df):
+    with pytest.warns(UserWarning):
+        df >> separate(_.t, into=["a", "b"], sep=r"\d+", regex=True)
+
+def test_lazy_input_is_not_collected_by_default(df):
+    runs = []
+    
+    def count_runs(frame):
+        runs.append(1)
+        return frame
+    
+    lf = df.lazy().map_batches(count_runs) >> separate(_.t, into=["a", "b"], sep=r"\d+", regex=True)
+    
+    assert isinstance(lf, pl.LazyFrame)
+    assert runs == []
+
+def test_lazy_input_checked_for_fill_error(df):
+    with pytest.raises(ValueError):
+        df.lazy() >> separate(_.t, into=["a", "b"], sep="1", fill="error")
+
+def test_lazy_input_checked_on_request(df):
+    with pytest.warns(UserWarning):
+        df.lazy() >> separate(_.t, into=["a", "b"], sep=r"\d+", regex=True, validate=True)
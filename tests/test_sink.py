@@ -0,0 +1,46 @@
+import polars as pl
+import pytest
+from penguins import _, filter, mutate, lazy_mode, sink_parquet, sink_csv, sink_ipc
+
+_READERS = {sink_parquet: pl.read_parquet, sink_csv: pl.read_csv, sink_ipc: pl.read_ipc}
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({"x": [1, 2, 3], "s": ["a", "b", "c"]})
+
+@pytest.mark.parametrize("sink", list(_READERS))
+def test_lazy_chain_streams_to_file(df, tmp_path, sink):
+    path = tmp_path / "out"
+    
+    result = df.lazy() >> filter(_.x > 1) >> mutate(y=_.x * 10) >> sink(path)
+    
+    assert result is None
+    assert _READERS[sink](path).equals(df.filter(pl.col("x") > 1).with_columns(y=pl.col("x") * 10))
+
+@pytest.mark.parametrize("sink", list(_READERS))
+def test_dataframe_is_written(df, tmp_path, sink):
+    path = tmp_path / "out"
+    
+    df >> sink(path)
+    
+    assert _READERS[sink](path).equals(df)
+
+def test_options_are_passed_on(df, tmp_path):
+    path = tmp_path / "out.csv"
+    
+    df.lazy() >> sink_csv(path, separator=";")
+    
+    assert path.read_text().splitlines()[0] == "x;s"
+
+def test_ends_an_auto_lazy_chain(df, tmp_path):
+    path = tmp_path / "out.parquet"
+    
+    with lazy_mode():
+        result = df >> filter(_.x < 3) >> sink_parquet(path)
+    
+    assert result is None
+    assert pl.read_parquet(path)["x"].to_list() == [1, 2]
+
+def test_rejects_other_objects(tmp_path):
+    with pytest.raises(TypeError):
+        sink_parquet(tmp_path / "out.parquet")([1, 2])
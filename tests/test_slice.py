@@ -0,0 +1,87 @@
+import polars as pl
+import pytest
+from penguins import _, GroupedFrame, group_by, slice, slice_max, slice_min, slice_head, slice_tail
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({
+        "g": ["a", "b", "a", "b", "a", "c"],
+        "h": [1, 1, 2, 1, 1, 2],
+        "x": [3, 5, 1, 2, 3, 6]
+    })
+
+@pytest.fixture(params=["eager", "lazy"])
+def frame(request, df):
+    return df if request.param == "eager" else df.lazy()
+
+def _collect(result):
+    if isinstance(result, GroupedFrame):
+        result = result.ungroup()
+    return result.collect() if isinstance(result, pl.LazyFrame) else result
+
+def test_slice_by_position(df):
+    assert (df >> slice(2))["x"].to_list() == [3, 5]
+    assert (df >> slice(-2))["x"].to_list() == [3, 6]
+    assert (df >> slice(1, 3))["x"].to_list() == [5, 1, 2]
+
+def test_slice_rejects_extra_arguments(df):
+    with pytest.raises(ValueError):
+        df >> slice(1, 2, 3)
+
+def test_slice_max_sorts_descending(frame):
+    result = _collect(frame >> slice_max(_.x, n=3))
+    
+    assert result["x"].to_list() == [6, 5, 3, 3]
+
+def test_slice_min_sorts_ascending(frame):
+    result = _collect(frame >> slice_min("x", n=2, with_ties=False))
+    
+    assert result["x"].to_list() == [1, 2]
+
+def test_n_larger_than_the_frame(frame):
+    assert _collect(frame >> slice_max(_.x, n=100)).height == 6
+
+def test_expressions_as_order(frame):
+    result = _collect(frame >> slice_max(pl.col("x") * -1, n=1))
+    
+    assert result["x"].to_list() == [1]
+
+@pytest.mark.parametrize("by", ["g", _.g, [_.g], ["g", "h"]])
+def test_by_matches_group_by(frame, by):
+    keys = by if isinstance(by, list) else [by]
+    result = frame >> slice_max(_.x, n=1, by=by)
+    expected = frame >> group_by(*keys) >> slice_max(_.x, n=1)
+    
+    assert not isinstance(result, GroupedFrame)
+    assert _collect(result).equals(_collect(expected))
+
+def test_by_sorts_by_keys_then_order(frame):
+    result = _collect(frame >> slice_min(_.x, n=2, by=_.g, with_ties=False))
+    
+    assert result.select("g", "x").rows() == [("a", 1), ("a", 3), ("b", 2), ("b", 5), ("c", 6)]
+
+def test_grouped_result_stays_grouped(frame):
+    result = frame >> group_by(_.g) >> slice_max(_.x)
+    
+    assert isinstance(result, GroupedFrame)
+    assert result.keys == ["g"]
+
+@pytest.mark.parametrize("verb", [
+    lambda: slice_max(_.x, by=_.h), lambda: slice_min(_.x, by=_.h),
+    lambda: slice_head(by=_.h), lambda: slice_tail(by=_.h)
+])
+def test_by_and_group_by_together_raise(frame, verb):
+    with pytest.raises(ValueError, match="not both"):
+        _collect(frame >> group_by(_.g) >> verb())
+
+def test_slice_head_and_tail_by(frame):
+    head = _collect(frame >> slice_head(n=2, by=_.g))
+    tail = _collect(frame >> slice_tail(n=1, by="g"))
+    
+    assert head.columns == ["g", "h", "x"]
+    assert head.select("g", "x").rows() == [("a", 3), ("a", 1), ("b", 5), ("b", 2), ("c", 6)]
+    assert tail.select("g", "x").rows() == [("a", 3), ("b", 2), ("c", 6)]
+
+def test_slice_head_and_tail_of_the_whole_frame(frame):
+    assert _collect(frame >> slice_head(n=2))["x"].to_list() == [3, 5]
+    assert _collect(frame >> slice_tail(n=2))["x"].to_list() == [3, 6]
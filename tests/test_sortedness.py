@@ -0,0 +1,152 @@
+import polars as pl
+import pytest
+from penguins import (
+    _, arrange, assume_sorted, distinct, filter, group_by, summarize, mutate, head, tail, slice,
+    drop_null, relocate, collect, join_asof
+)
+from penguins.core.sortedness import sort_order, is_sorted_by, is_sorted_on
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({
+        "a": [2, 1, 1, 2, 1, 2],
+        "b": ["y", "x", "y", "x", "x", "y"],
+        "v": [1, 2, 3, 4, 5, 6]
+    })
+
+def _unique(df, cols):
+    return df.unique(cols, maintain_order=True).sort(cols)
+
+def test_arrange_records_order(df):
+    result = df >> arrange(_.a, -_.b)
+    
+    assert sort_order(result) == (("a", False), ("b", True))
+
+def test_order_carried_through_filter(df):
+    result = df >> arrange(_.a, _.b) >> filter(_.v > 1)
+    
+    assert is_sorted_by(result, ["b", "a"])
+
+def test_order_cut_at_overwritten_column(df):
+    result = df >> arrange(_.a, _.b) >> mutate(b=_.v)
+    
+    assert sort_order(result) == (("a", False),)
+
+@pytest.mark.parametrize("cols", [["a"], ["a", "b"]])
+def test_distinct_matches_unique(df, cols):
+    result = df >> arrange(_.a, _.b) >> distinct(*cols)
+    
+    assert result.sort(cols).select(cols).equals(_unique(df, cols).select(cols))
+
+def test_distinct_on_frame_changed_in_place(df):
+    sorted_df = df >> arrange(_.a, _.b)
+    sorted_df.replace_column(1, pl.Series("b", ["y", "x", "y", "x", "y", "x"]))
+    
+    result = sorted_df >> distinct(_.a, _.b)
+    
+    assert sort_order(sorted_df) == (("a", False),)
+    assert result.height == sorted_df.unique(["a", "b"]).height == 4
+
+def test_distinct_when_first_key_replaced(df):
+    sorted_df = df >> arrange(_.a, _.b)
+    sorted_df.replace_column(0, pl.Series("a", [1, 2, 1, 2, 1, 2]))
+    
+    result = sorted_df >> distinct(_.a, _.b)
+    
+    assert result.height == sorted_df.unique(["a", "b"]).height
+
+def test_grouped_index_on_frame_changed_in_place():
+    df = pl.DataFrame({"a": [1, 1, 1, 1], "b": [1, 1, 2, 2], "v": [1, 2, 3, 4]})
+    sorted_df = df >> arrange(_.a, _.b)
+    sorted_df.replace_column(1, pl.Series("b", [1, 2, 1, 2]))
+    
+    result = sorted_df >> group_by(_.a, _.b) >> summarize(total=_.v.sum())
+    expected = sorted_df.group_by("a", "b").agg(total=pl.col("v").sum())
+    
+    assert result.sort("a", "b").equals(expected.sort("a", "b"))
+
+def test_grouped_index_on_sorted_frame(df):
+    result = df >> arrange(_.a, _.b) >> group_by(_.a, _.b) >> summarize(total=_.v.sum())
+    expected = df.group_by("a", "b").agg(total=pl.col("v").sum())
+    
+    assert result.sort("a", "b").equals(expected.sort("a", "b"))
+
+def test_assume_sorted_validates(df):
+    from penguins import options
+    
+    options.validate_sorted = True
+    try:
+        with pytest.raises(ValueError):
+            df >> assume_sorted(_.a)
+    finally:
+        options.validate_sorted = False
+
+@pytest.mark.parametrize("step", [
+    lambda: filter(_.v > 1), lambda: head(4), lambda: tail(4), lambda: slice(1, 4),
+    lambda: drop_null(), lambda: relocate(_.v), lambda: mutate(w=_.v * 2)
+])
+def test_order_carried_through_row_preserving_verbs(df, step):
+    result = df >> arrange(_.a, -_.b) >> step()
+    
+    assert sort_order(result) == (("a", False), ("b", True))
+
+def test_order_carried_through_fused_lazy_chain(df):
+    result = df.lazy() >> (arrange(_.a, _.b) >> filter(_.v > 1) >> mutate(w=_.v)) >> collect()
+    
+    assert isinstance(result, pl.DataFrame)
+    assert sort_order(result) == (("a", False), ("b", False))
+    assert result["a"].flags["SORTED_ASC"]
+
+def test_order_carried_through_groups(df):
+    result = df >> arrange(_.a, _.b) >> group_by(_.a) >> mutate(n=pl.len())
+    
+    assert sort_order(result) == (("a", False), ("b", False))
+
+def test_externally_sorted_frames_report_flagged_column(df):
+    assert sort_order(df.sort("v", descending=True)) == (("v", True),)
+    assert sort_order(df) == ()
+
+def test_assume_sorted_records_order_and_flag():
+    df = pl.DataFrame({"t": [3, 2, 1], "k": [1, 1, 2]})
+    
+    result = df >> assume_sorted(-_.t, _.k)
+    
+    assert sort_order(result) == (("t", True), ("k", False))
+    assert result["t"].flags["SORTED_DESC"]
+
+def test_assume_sorted_on_lazy_frames(df):
+    result = df.lazy() >> assume_sorted(_.v)
+    
+    assert isinstance(result, pl.LazyFrame)
+    assert is_sorted_on(result, "v")
+
+def test_assume_sorted_accepts_sorted_rows(df):
+    from penguins import options
+    
+    options.validate_sorted = True
+    try:
+        result = df.sort("a", "b") >> assume_sorted(_.a, _.b)
+    finally:
+        options.validate_sorted = False
+    
+    assert is_sorted_by(result, ["a", "b"])
+
+def test_assume_sorted_rejects_expressions():
+    with pytest.raises(ValueError):
+        assume_sorted(pl.col("a") * 2)
+
+def test_join_asof_skips_sorting_known_order():
+    trades = pl.LazyFrame({"time": [1, 3, 5], "qty": [1, 2, 3]})
+    quotes = pl.LazyFrame({"time": [0, 2, 4], "price": [1.0, 2.0, 3.0]})
+    
+    result = trades >> assume_sorted(_.time) >> join_asof(quotes >> assume_sorted(_.time), on=_.time)
+    unsorted = trades >> join_asof(quotes, on=_.time)
+    
+    assert "SORT" not in result.explain()
+    assert unsorted.explain().count("SORT") == 2
+    assert result.collect().equals(unsorted.collect())
+
+def test_distinct_on_lazy_sorted_frame(df):
+    result = df.lazy() >> arrange(_.a, _.b) >> distinct(_.a, _.b)
+    
+    assert result.collect().sort("a", "b").select("a", "b").equals(_unique(df, ["a", "b"]).select("a", "b"))
@@ -0,0 +1,77 @@
+import json
+import polars as pl
+import pytest
+from penguins import _, trace, filter, mutate, select, arrange, collect
+
+@pytest.fixture
+def df():
+    return pl.DataFrame({"x": [3, 1, 2, 4], "y": ["a", "b", "c", "d"]})
+
+def test_records_each_verb(df):
+    with trace() as t:
+        df >> filter(_.x > 1) >> mutate(z=_.x * 2)
+    
+    assert [event.verb for event in t] == ["filter", "mutate"]
+    assert [event.rows_out for event in t] == [3, 3]
+    assert t.events[1].cols_out == 3
+
+def test_pipeline_is_traced_per_verb(df):
+    pipeline = filter(_.x > 1) >> mutate(z=_.x * 2) >> select(_.z)
+    
+    with trace() as t:
+        result = df >> pipeline
+    
+    assert [event.verb for event in t] == ["filter", "mutate", "select"]
+    assert result.equals(df >> pipeline)
+
+def test_lazy_frames_are_not_collected(df):
+    with trace() as t:
+        result = df.lazy() >> arrange(_.x) >> filter(_.x > 1)
+    
+    assert isinstance(result, pl.LazyFrame)
+    assert [event.rows_out for event in t] == [None, None]
+    assert not any(event.collected for event in t)
+
+def test_collect_is_flagged(df):
+    with trace() as t:
+        df.lazy() >> filter(_.x > 1) >> collect()
+    
+    assert t.events[-1].collected
+
+def test_exports(df, tmp_path):
+    with trace() as t:
+        df >> filter(_.x > 1)
+    
+    assert t.to_frame().height == 1
+    assert json.loads(t.to_json())[0]["verb"] == "filter"
+    
+    path = tmp_path / "trace.json"
+    t.to_chrome_trace(path)
+    assert json.loads(path.read_text())["traceEvents"][0]["name"] == "filter"
+
+def test_nothing_recorded_outside_block(df):
+    with trace() as t:
+        pass
+    df >> filter(_.x > 1)
+    
+    assert len(t) == 0
+
+@pytest.mark.skipif(not hasattr(pl.LazyFrame, "profile"), reason="LazyFrame.profile() is not available")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_profile_maps_nodes_to_verbs(df):
+    with trace() as t:
+        lf = df.lazy() >> arrange(_.x) >> filter(_.x > 1)
+    
+    result, timings = t.profile(lf)
+    
+    assert result.equals(df.sort("x").filter(pl.col("x") > 1))
+    assert "verb" in timings.columns
+    assert set(timings["verb"].drop_nulls()) == {event.step for event in t}
+
+@pytest.mark.skipif(hasattr(pl.LazyFrame, "profile"), reason="LazyFrame.profile() is available")
+def test_profile_names_polars_version(df):
+    with trace() as t:
+        lf = df.lazy() >> filter(_.x > 1)
+    
+    with pytest.raises(NotImplementedError, match=pl.__version__):
+        t.profile(lf)